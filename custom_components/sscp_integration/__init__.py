@@ -8,7 +8,7 @@ from homeassistant.core import HomeAssistant
 from .const import DOMAIN, PLATFORMS
 from .coordinator import SSCPDataCoordinator, SSCPDiagnosticsCoordinator
 from .migration import ENTRY_MINOR_VERSION, ENTRY_VERSION, async_migrate_entry_data
-from .transport import build_client_from_entry_data, has_connection_settings
+from .transport import async_call_client, build_client_from_entry_data, has_connection_settings
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -66,8 +66,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if has_connection_settings(entry.data):
         client = build_client_from_entry_data(entry.data)
         try:
-            await hass.async_add_executor_job(client.connect)
-            await hass.async_add_executor_job(client.login)
+            await async_call_client(hass, client, "connect")
+            await async_call_client(hass, client, "login")
             coordinator = SSCPDataCoordinator(hass, entry, client)
             await coordinator.async_config_entry_first_refresh()
             diagnostics_coordinator = SSCPDiagnosticsCoordinator(hass, entry, client, coordinator)
@@ -75,7 +75,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         except Exception as exc:
             _LOGGER.error("PLC entry %s is loaded in offline mode: %s", entry.title or entry.entry_id, exc)
             if client is not None:
-                await hass.async_add_executor_job(client.disconnect)
+                await async_call_client(hass, client, "disconnect")
             startup_error = str(exc)
             client = None
             coordinator = None
@@ -109,8 +109,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     entry_data = hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
     client = entry_data.get("client") if entry_data else None
+    coordinator = entry_data.get("coordinator") if entry_data else None
+    if coordinator is not None:
+        # Writes still inside the coalescing window go out before the connection closes.
+        await coordinator.writes.async_flush()
     if client is not None:
-        await hass.async_add_executor_job(client.disconnect)
+        await async_call_client(hass, client, "disconnect")
     return unload_ok
 
 
@@ -34,11 +34,13 @@ SSCP_DIAGNOSTIC_BINARY_SENSORS: list[dict[str, Any]] = [
     {
         "key": "runtime_running",
         "name": "Runtime Running",
+        "sections": ("plc_statistics",),
         "extractor": lambda data: _dig(data, "plc_statistics", "runtime", "evaluator_state_label") == "RunningNormalTasks",
     },
     {
         "key": "proxy_connected",
         "name": "Proxy Connected",
+        "sections": ("plc_statistics",),
         "extractor": lambda data: _dig(data, "plc_statistics", "proxy", "proxy_status_label") == "Connected",
     },
 ]
@@ -124,6 +126,11 @@ class SSCPDiagnosticBinarySensor(CoordinatorEntity[SSCPDiagnosticsCoordinator],
             "model": f"{transport_name} PLC",
         }
 
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if self._descriptor.get("sections"):
+            self.async_on_remove(self.coordinator.async_add_section_listener(self._descriptor["sections"]))
+
     @property
     def is_on(self):
         extractor: Callable[[dict[str, Any]], bool] = self._descriptor["extractor"]
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-from functools import partial
 import logging
 
 from homeassistant.components.button import ButtonEntity
@@ -35,27 +34,8 @@ class SSCPButton(SSCPBaseEntity, ButtonEntity):
 
     async def async_press(self) -> None:
         try:
-            await self.hass.async_add_executor_job(
-                partial(
-                    self._client.write_variable,
-                    self._uid,
-                    True,
-                    offset=self._offset,
-                    length=self._length,
-                    type_data=self._type,
-                )
-            )
+            await self.coordinator.async_write_variables([self._write_request(True)], force=True)
             await asyncio.sleep(max(0.01, self._press_time))
-            await self.hass.async_add_executor_job(
-                partial(
-                    self._client.write_variable,
-                    self._uid,
-                    False,
-                    offset=self._offset,
-                    length=self._length,
-                    type_data=self._type,
-                )
-            )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_write_variables([self._write_request(False)], force=True)
         except Exception as err:
             _LOGGER.error("Failed to press button %s: %s", self.name, err)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from functools import partial
 import logging
 from typing import Any
 
@@ -13,8 +12,8 @@ from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import SSCPDataCoordinator, variable_key
-from .entity import async_apply_entity_area, build_plc_device_info
+from .coordinator import SSCPDataCoordinator
+from .entity import SSCPRefValues, SSCPWriteTransaction, async_apply_entity_area, build_plc_device_info, ref_data_keys
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -116,6 +115,7 @@ class SSCPComposedClimate(CoordinatorEntity[SSCPDataCoordinator], ClimateEntity)
             "hvac_mode_var": config.get("hvac_mode_var"),
             "preset_var": config.get("preset_var"),
         }
+        self._values = SSCPRefValues(coordinator, self._refs)
         self._temperature_unit = str(config.get("temperature_unit") or "°C")
         self._precision_digits = config.get("suggested_display_precision")
         self._default_power_hvac_mode = self._resolve_default_power_hvac_mode()
@@ -130,6 +130,9 @@ class SSCPComposedClimate(CoordinatorEntity[SSCPDataCoordinator], ClimateEntity)
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_key_listener(ref_data_keys(self._refs), self.async_write_ha_state)
+        )
         await async_apply_entity_area(self.hass, getattr(self, "entity_id", None), self._config.get("area_id"))
 
     def _resolve_default_power_hvac_mode(self) -> HVACMode:
@@ -139,23 +142,17 @@ class SSCPComposedClimate(CoordinatorEntity[SSCPDataCoordinator], ClimateEntity)
                     return _HVAC_MODE_BY_VALUE.get(candidate, _DEFAULT_HVAC_MODE)
         return _DEFAULT_HVAC_MODE
 
-    def _coordinator_value(self, ref: dict[str, Any] | None) -> Any:
-        if not isinstance(ref, dict):
-            return None
-        return self.coordinator.data.get(variable_key(ref))
-
-    async def _async_write_ref(self, ref: dict[str, Any] | None, raw_value: Any) -> None:
-        if not isinstance(ref, dict):
-            raise ValueError("Chybi datovy bod pro zapis.")
-        await self.hass.async_add_executor_job(
-            partial(
-                self._client.write_variable,
-                int(ref["uid"]),
-                _coerce_write_value(raw_value, str(ref["type"])),
-                offset=int(ref.get("offset", 0)),
-                length=int(ref.get("length", 1)),
-                type_data=str(ref["type"]),
-            )
+    async def _async_write_ref(self, ref: dict[str, Any] | None, raw_value: Any, *, force: bool = False) -> None:
+        writes = self._write_transaction()
+        writes.add(ref, raw_value, force=force)
+        await writes.async_commit()
+
+    def _write_transaction(self) -> SSCPWriteTransaction:
+        return SSCPWriteTransaction(
+            self.coordinator,
+            _coerce_write_value,
+            read_back=self._refs.values(),
+            force=bool(self._config.get("always_write")),
         )
 
     @property
@@ -196,21 +193,21 @@ class SSCPComposedClimate(CoordinatorEntity[SSCPDataCoordinator], ClimateEntity)
 
     @property
     def current_temperature(self) -> float | None:
-        value = self._coordinator_value(self._refs.get("current_temperature_var"))
+        value = self._values.get("current_temperature_var")
         if value is None:
             return None
         return float(value)
 
     @property
     def target_temperature(self) -> float | None:
-        value = self._coordinator_value(self._refs.get("target_temperature_var"))
+        value = self._values.get("target_temperature_var")
         if value is None:
             return None
         return float(value)
 
     @property
     def current_humidity(self) -> float | None:
-        value = self._coordinator_value(self._refs.get("current_humidity_var"))
+        value = self._values.get("current_humidity_var")
         if value is None:
             return None
         return float(value)
@@ -235,13 +232,13 @@ class SSCPComposedClimate(CoordinatorEntity[SSCPDataCoordinator], ClimateEntity)
     @property
     def hvac_mode(self) -> HVACMode:
         power_ref = self._refs.get("power_var")
-        power_value = self._coordinator_value(power_ref)
+        power_value = self._values.get("power_var")
         if power_ref and power_value is not None and not bool(power_value):
             return HVACMode.OFF
 
         hvac_ref = self._refs.get("hvac_mode_var")
         if hvac_ref:
-            mapped = self._hvac_mode_map.get(_normalize_ref_value(self._coordinator_value(hvac_ref)))
+            mapped = self._hvac_mode_map.get(_normalize_ref_value(self._values.get("hvac_mode_var")))
             if mapped in _HVAC_MODE_BY_VALUE:
                 return _HVAC_MODE_BY_VALUE[mapped]
 
@@ -260,7 +257,7 @@ class SSCPComposedClimate(CoordinatorEntity[SSCPDataCoordinator], ClimateEntity)
         preset_ref = self._refs.get("preset_var")
         if not preset_ref or not self._preset_map:
             return None
-        raw_value = self._coordinator_value(preset_ref)
+        raw_value = self._values.get("preset_var")
         if raw_value is None:
             return None
         mapped = self._preset_map.get(_normalize_ref_value(raw_value))
@@ -272,17 +269,17 @@ class SSCPComposedClimate(CoordinatorEntity[SSCPDataCoordinator], ClimateEntity)
             return
         try:
             await self._async_write_ref(self._refs.get("target_temperature_var"), target)
-            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to set target temperature for %s: %s", self.name, err)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+        writes = self._write_transaction()
         try:
             if hvac_mode == HVACMode.OFF:
                 if self._refs.get("power_var"):
-                    await self._async_write_ref(self._refs.get("power_var"), False)
+                    writes.add(self._refs.get("power_var"), False)
                 if self._refs.get("hvac_mode_var") and HVACMode.OFF.value in self._hvac_mode_reverse_map:
-                    await self._async_write_ref(
+                    writes.add(
                         self._refs.get("hvac_mode_var"),
                         self._hvac_mode_reverse_map[HVACMode.OFF.value],
                     )
@@ -290,13 +287,13 @@ class SSCPComposedClimate(CoordinatorEntity[SSCPDataCoordinator], ClimateEntity)
                     raise ValueError("Climate nema definovany zpusob vypnuti.")
             else:
                 if self._refs.get("power_var"):
-                    await self._async_write_ref(self._refs.get("power_var"), True)
+                    writes.add(self._refs.get("power_var"), True)
                 if self._refs.get("hvac_mode_var"):
                     raw_value = self._hvac_mode_reverse_map.get(hvac_mode.value)
                     if raw_value is None:
                         raise ValueError(f"HVAC mode {hvac_mode.value} neni v mapovani definovan.")
-                    await self._async_write_ref(self._refs.get("hvac_mode_var"), raw_value)
-            await self.coordinator.async_request_refresh()
+                    writes.add(self._refs.get("hvac_mode_var"), raw_value)
+            await writes.async_commit()
         except Exception as err:
             _LOGGER.error("Failed to set hvac mode %s for %s: %s", hvac_mode, self.name, err)
 
@@ -312,6 +309,5 @@ class SSCPComposedClimate(CoordinatorEntity[SSCPDataCoordinator], ClimateEntity)
             if raw_value is None:
                 raise ValueError(f"Preset {preset_mode} neni v mapovani definovan.")
             await self._async_write_ref(self._refs.get("preset_var"), raw_value)
-            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to set preset %s for %s: %s", preset_mode, self.name, err)
@@ -13,11 +13,32 @@ from .const import (
     COMM_MODE_SSCP,
     COMM_MODE_WEBPANEL,
     CONF_COMMUNICATION_MODE,
+    CONF_FAST_SCAN_INTERVAL_MS,
+    CONF_PIPELINE_DEPTH,
+    CONF_REDUNDANT_WRITE_MAX_AGE,
     CONF_SCAN_INTERVAL,
+    CONF_SESSION_COUNT,
+    CONF_SHARED_GATEWAY,
+    CONF_SLOW_SCAN_INTERVAL,
     CONF_WEBPANEL_CONNECTION,
     CONF_WEBPANEL_SCHEME,
+    CONF_WRITE_COALESCE_MS,
+    DEFAULT_FAST_SCAN_INTERVAL_MS,
+    DEFAULT_PIPELINE_DEPTH,
+    DEFAULT_REDUNDANT_WRITE_MAX_AGE,
     DEFAULT_SCAN_INTERVAL_SECONDS,
+    DEFAULT_SESSION_COUNT,
+    DEFAULT_SHARED_GATEWAY,
+    DEFAULT_SLOW_SCAN_INTERVAL_SECONDS,
+    DEFAULT_WRITE_COALESCE_MS,
     DOMAIN,
+    MAX_FAST_SCAN_INTERVAL_MS,
+    MAX_PIPELINE_DEPTH,
+    MAX_REDUNDANT_WRITE_MAX_AGE,
+    MAX_SESSION_COUNT,
+    MAX_SLOW_SCAN_INTERVAL_SECONDS,
+    MAX_WRITE_COALESCE_MS,
+    MIN_FAST_SCAN_INTERVAL_MS,
 )
 from .migration import ENTRY_MINOR_VERSION, ENTRY_VERSION
 from .runtime import SSCPRuntime
@@ -183,6 +204,48 @@ def _scan_interval_value(value: Any) -> int:
         return DEFAULT_SCAN_INTERVAL_SECONDS
 
 
+def _session_count_value(value: Any) -> int:
+    try:
+        return max(1, min(MAX_SESSION_COUNT, int(value)))
+    except (TypeError, ValueError):
+        return DEFAULT_SESSION_COUNT
+
+
+def _pipeline_depth_value(value: Any) -> int:
+    try:
+        return max(1, min(MAX_PIPELINE_DEPTH, int(value)))
+    except (TypeError, ValueError):
+        return DEFAULT_PIPELINE_DEPTH
+
+
+def _write_coalesce_ms_value(value: Any) -> int:
+    try:
+        return max(0, min(MAX_WRITE_COALESCE_MS, int(value)))
+    except (TypeError, ValueError):
+        return DEFAULT_WRITE_COALESCE_MS
+
+
+def _redundant_write_max_age_value(value: Any) -> int:
+    try:
+        return max(0, min(MAX_REDUNDANT_WRITE_MAX_AGE, int(value)))
+    except (TypeError, ValueError):
+        return DEFAULT_REDUNDANT_WRITE_MAX_AGE
+
+
+def _fast_scan_interval_ms_value(value: Any) -> int:
+    try:
+        return max(MIN_FAST_SCAN_INTERVAL_MS, min(MAX_FAST_SCAN_INTERVAL_MS, int(value)))
+    except (TypeError, ValueError):
+        return DEFAULT_FAST_SCAN_INTERVAL_MS
+
+
+def _slow_scan_interval_value(value: Any) -> int:
+    try:
+        return max(1, min(MAX_SLOW_SCAN_INTERVAL_SECONDS, int(value)))
+    except (TypeError, ValueError):
+        return DEFAULT_SLOW_SCAN_INTERVAL_SECONDS
+
+
 def _vlist_file_name_from_data(data: dict[str, Any]) -> str:
     raw_value = str(data.get("vlist_file") or "").strip()
     if not raw_value:
@@ -212,6 +275,19 @@ def _workspace_defaults(data: dict[str, Any] | None = None) -> dict[str, Any]:
         "webpanel_connection": str(source.get(CONF_WEBPANEL_CONNECTION) or "defaultConnection").strip() or "defaultConnection",
         "webpanel_scheme": str(source.get(CONF_WEBPANEL_SCHEME) or "http").strip().lower() or "http",
         "scan_interval": _scan_interval_value(source.get(CONF_SCAN_INTERVAL)),
+        "session_count": _session_count_value(source.get(CONF_SESSION_COUNT)),
+        "pipeline_depth": _pipeline_depth_value(source.get(CONF_PIPELINE_DEPTH)),
+        "write_coalesce_ms": _write_coalesce_ms_value(source.get(CONF_WRITE_COALESCE_MS, DEFAULT_WRITE_COALESCE_MS)),
+        "redundant_write_max_age": _redundant_write_max_age_value(
+            source.get(CONF_REDUNDANT_WRITE_MAX_AGE, DEFAULT_REDUNDANT_WRITE_MAX_AGE)
+        ),
+        "fast_scan_interval_ms": _fast_scan_interval_ms_value(
+            source.get(CONF_FAST_SCAN_INTERVAL_MS, DEFAULT_FAST_SCAN_INTERVAL_MS)
+        ),
+        "slow_scan_interval": _slow_scan_interval_value(
+            source.get(CONF_SLOW_SCAN_INTERVAL, DEFAULT_SLOW_SCAN_INTERVAL_SECONDS)
+        ),
+        "shared_gateway": bool(source.get(CONF_SHARED_GATEWAY, DEFAULT_SHARED_GATEWAY)),
         "vlist_file_name": _vlist_file_name_from_data(source),
     }
 
@@ -233,6 +309,25 @@ def _workspace_schema(defaults: dict[str, Any], *, include_action: bool = False)
         vol.Optional("webpanel_connection", default=defaults["webpanel_connection"]): str,
         vol.Optional("webpanel_scheme", default=defaults["webpanel_scheme"]): vol.In({"http": "http", "https": "https"}),
         vol.Optional("scan_interval", default=defaults["scan_interval"]): vol.All(vol.Coerce(int), vol.Range(min=1, max=300)),
+        vol.Optional("session_count", default=defaults["session_count"]): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_SESSION_COUNT)
+        ),
+        vol.Optional("pipeline_depth", default=defaults["pipeline_depth"]): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_PIPELINE_DEPTH)
+        ),
+        vol.Optional("write_coalesce_ms", default=defaults["write_coalesce_ms"]): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=MAX_WRITE_COALESCE_MS)
+        ),
+        vol.Optional("redundant_write_max_age", default=defaults["redundant_write_max_age"]): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=MAX_REDUNDANT_WRITE_MAX_AGE)
+        ),
+        vol.Optional("fast_scan_interval_ms", default=defaults["fast_scan_interval_ms"]): vol.All(
+            vol.Coerce(int), vol.Range(min=MIN_FAST_SCAN_INTERVAL_MS, max=MAX_FAST_SCAN_INTERVAL_MS)
+        ),
+        vol.Optional("slow_scan_interval", default=defaults["slow_scan_interval"]): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_SLOW_SCAN_INTERVAL_SECONDS)
+        ),
+        vol.Optional("shared_gateway", default=defaults["shared_gateway"]): bool,
         vol.Optional("vlist_file_name", default=defaults["vlist_file_name"]): vol.In(_vlist_options(defaults["vlist_file_name"])),
     }
     if include_action:
@@ -271,6 +366,19 @@ def _entry_data_from_workspace_input(user_input: dict[str, Any]) -> dict[str, An
         CONF_WEBPANEL_CONNECTION: str(user_input.get("webpanel_connection") or "defaultConnection").strip() or "defaultConnection",
         CONF_WEBPANEL_SCHEME: str(user_input.get("webpanel_scheme") or "http").strip().lower() or "http",
         CONF_SCAN_INTERVAL: _scan_interval_value(user_input.get("scan_interval")),
+        CONF_SESSION_COUNT: _session_count_value(user_input.get("session_count")),
+        CONF_PIPELINE_DEPTH: _pipeline_depth_value(user_input.get("pipeline_depth")),
+        CONF_WRITE_COALESCE_MS: _write_coalesce_ms_value(user_input.get("write_coalesce_ms", DEFAULT_WRITE_COALESCE_MS)),
+        CONF_REDUNDANT_WRITE_MAX_AGE: _redundant_write_max_age_value(
+            user_input.get("redundant_write_max_age", DEFAULT_REDUNDANT_WRITE_MAX_AGE)
+        ),
+        CONF_FAST_SCAN_INTERVAL_MS: _fast_scan_interval_ms_value(
+            user_input.get("fast_scan_interval_ms", DEFAULT_FAST_SCAN_INTERVAL_MS)
+        ),
+        CONF_SLOW_SCAN_INTERVAL: _slow_scan_interval_value(
+            user_input.get("slow_scan_interval", DEFAULT_SLOW_SCAN_INTERVAL_SECONDS)
+        ),
+        CONF_SHARED_GATEWAY: bool(user_input.get("shared_gateway", DEFAULT_SHARED_GATEWAY)),
         "configuration_mode": "vlist",
         "vlist_file": vlist_path,
     }
@@ -733,6 +841,13 @@ class SSCPOptionsFlow(config_entries.OptionsFlow):
             CONF_WEBPANEL_CONNECTION,
             CONF_WEBPANEL_SCHEME,
             CONF_SCAN_INTERVAL,
+            CONF_SESSION_COUNT,
+            CONF_PIPELINE_DEPTH,
+            CONF_WRITE_COALESCE_MS,
+            CONF_REDUNDANT_WRITE_MAX_AGE,
+            CONF_FAST_SCAN_INTERVAL_MS,
+            CONF_SLOW_SCAN_INTERVAL,
+            CONF_SHARED_GATEWAY,
             "vlist_file",
         )
         return any(self.entry.data.get(key) != updated_data.get(key) for key in tracked_keys)
@@ -1222,4 +1337,4 @@ class SSCPOptionsFlow(config_entries.OptionsFlow):
         await self.hass.config_entries.async_reload(self.entry.entry_id)
 
 
-
+
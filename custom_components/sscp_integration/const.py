@@ -28,17 +28,50 @@ PLATFORMS: Final = (
 
 DEFAULT_PROTOCOL_VERSION: Final = 7
 DEFAULT_CLIENT_MAX_DATA_SIZE: Final = 10240
+MAX_CLIENT_MAX_DATA_SIZE: Final = 0xFFFF
 DEFAULT_SCAN_INTERVAL_SECONDS: Final = 5
 DEFAULT_SOCKET_TIMEOUT: Final = 10.0
+MIN_SOCKET_TIMEOUT: Final = 2.0
+CIRCUIT_FAILURE_THRESHOLD: Final = 3
+CIRCUIT_MIN_PROBE_DELAY: Final = 5.0
+CIRCUIT_MAX_PROBE_DELAY: Final = 300.0
+DEFAULT_SESSION_COUNT: Final = 1
+MAX_SESSION_COUNT: Final = 8
+DEFAULT_PIPELINE_DEPTH: Final = 1
+MAX_PIPELINE_DEPTH: Final = 8
+DEFAULT_WRITE_COALESCE_MS: Final = 20
+MAX_WRITE_COALESCE_MS: Final = 500
+DEFAULT_REDUNDANT_WRITE_MAX_AGE: Final = 0
+MAX_REDUNDANT_WRITE_MAX_AGE: Final = 3600
+DEFAULT_FAST_SCAN_INTERVAL_MS: Final = 200
+MIN_FAST_SCAN_INTERVAL_MS: Final = 50
+MAX_FAST_SCAN_INTERVAL_MS: Final = 5000
+DEFAULT_SLOW_SCAN_INTERVAL_SECONDS: Final = 60
+MAX_SLOW_SCAN_INTERVAL_SECONDS: Final = 3600
+DEFAULT_SHARED_GATEWAY: Final = True
 
 DEFAULT_UPDATE_INTERVAL: Final = timedelta(seconds=DEFAULT_SCAN_INTERVAL_SECONDS)
 
 CONF_PANEL_TITLE: Final = "panel_title"
 CONF_SCAN_INTERVAL: Final = "scan_interval"
+CONF_SESSION_COUNT: Final = "session_count"
+CONF_PIPELINE_DEPTH: Final = "pipeline_depth"
+CONF_WRITE_COALESCE_MS: Final = "write_coalesce_ms"
+CONF_REDUNDANT_WRITE_MAX_AGE: Final = "redundant_write_max_age"
+CONF_FAST_SCAN_INTERVAL_MS: Final = "fast_scan_interval_ms"
+CONF_SLOW_SCAN_INTERVAL: Final = "slow_scan_interval"
+CONF_SHARED_GATEWAY: Final = "shared_gateway"
 CONF_COMMUNICATION_MODE: Final = "communication_mode"
 CONF_WEBPANEL_CONNECTION: Final = "webpanel_connection"
 CONF_WEBPANEL_SCHEME: Final = "webpanel_scheme"
 
+# Poll rates a variable or composed entity can be assigned; on_demand points are read only when asked for.
+SCAN_CLASS_FAST: Final = "fast"
+SCAN_CLASS_NORMAL: Final = "normal"
+SCAN_CLASS_SLOW: Final = "slow"
+SCAN_CLASS_ON_DEMAND: Final = "on_demand"
+SCAN_CLASSES: Final = (SCAN_CLASS_FAST, SCAN_CLASS_NORMAL, SCAN_CLASS_SLOW, SCAN_CLASS_ON_DEMAND)
+
 COMM_MODE_SSCP: Final = "sscp"
 COMM_MODE_WEBPANEL: Final = "webpanel_api"
 SUPPORTED_COMMUNICATION_MODES: Final = (
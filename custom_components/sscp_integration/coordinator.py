@@ -1,15 +1,36 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Container, Iterable, Mapping
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from time import perf_counter
+from operator import attrgetter
+from time import monotonic, perf_counter
 import logging
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL_SECONDS, DOMAIN
+from .const import (
+    CONF_FAST_SCAN_INTERVAL_MS,
+    CONF_REDUNDANT_WRITE_MAX_AGE,
+    CONF_SCAN_INTERVAL,
+    CONF_SLOW_SCAN_INTERVAL,
+    CONF_WRITE_COALESCE_MS,
+    DEFAULT_FAST_SCAN_INTERVAL_MS,
+    DEFAULT_REDUNDANT_WRITE_MAX_AGE,
+    DEFAULT_SCAN_INTERVAL_SECONDS,
+    DEFAULT_SLOW_SCAN_INTERVAL_SECONDS,
+    DEFAULT_WRITE_COALESCE_MS,
+    DOMAIN,
+    SCAN_CLASS_FAST,
+    SCAN_CLASS_NORMAL,
+    SCAN_CLASS_SLOW,
+    SCAN_CLASSES,
+)
+from .sscp_client import PRIORITY_INTERACTIVE, encode_value, request_priority
 from .studio_models import (
     iter_climate_variable_refs,
     iter_cover_variable_refs,
@@ -22,8 +43,11 @@ from .studio_models import (
     iter_valve_variable_refs,
     iter_vacuum_variable_refs,
     iter_water_heater_variable_refs,
+    normalize_scan_class,
 )
-from .transport import PLCClientProtocol
+from .transport import PLCClientProtocol, async_call_client
+from .value_store import SSCPDataPoint, SSCPValueStore
+from .write_coalescer import SSCPWriteCoalescer
 
 
 def variable_key(variable: dict[str, Any]) -> str:
@@ -37,7 +61,83 @@ def is_readable_variable(variable: dict[str, Any]) -> bool:
     return variable.get("entity_type") != "button"
 
 
-class SSCPDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+def _data_point_address(variable: dict[str, Any], default_length: int) -> tuple[int, int, int]:
+    return (
+        int(variable["uid"]),
+        int(variable.get("offset", 0)),
+        int(variable.get("length", default_length)),
+    )
+
+
+def same_plc_value(left: Any, right: Any, plc_type: str) -> bool:
+    """Compare two values the way the PLC stores them, e.g. 21.3 and its REAL rounding are equal."""
+    if left is None or right is None:
+        return left is right
+    try:
+        return encode_value(left, plc_type) == encode_value(right, plc_type)
+    except (AttributeError, OverflowError, TypeError, ValueError):
+        return left == right
+
+
+# Entry data sections of composed entities, with the references each entity polls.
+COMPOSED_SECTIONS: dict[str, Callable[[dict[str, Any]], Iterable[dict[str, Any]]]] = {
+    "climate_entities": iter_climate_variable_refs,
+    "light_entities": iter_light_variable_refs,
+    "cover_entities": iter_cover_variable_refs,
+    "vacuum_entities": iter_vacuum_variable_refs,
+    "fan_entities": iter_fan_variable_refs,
+    "humidifier_entities": iter_humidifier_variable_refs,
+    "water_heater_entities": iter_water_heater_variable_refs,
+    "lock_entities": iter_lock_variable_refs,
+    "valve_entities": iter_valve_variable_refs,
+    "siren_entities": iter_siren_variable_refs,
+    "scheduler_entities": iter_scheduler_entity_refs,
+}
+
+_SCAN_CLASS_RANK = {scan_class: rank for rank, scan_class in enumerate(SCAN_CLASSES)}
+
+
+@dataclass
+class SSCPPollPlan:
+    """Deduplicated poll requests of one version of the entry data, compiled once."""
+
+    requests: list[dict[str, Any]]
+    # Data point address -> polled points at it; several configured names may share one address.
+    read_index: dict[tuple[int, int, int], list[SSCPDataPoint]]
+    configured_count: int
+    store: SSCPValueStore
+    # Scan class -> its points in slot order.
+    classes: dict[str, list[SSCPDataPoint]]
+    build_read_plan: Callable[[list[dict[str, Any]]], Any] | None = None
+    batches: dict[tuple[frozenset[str], bool], tuple[list[SSCPDataPoint], Any]] = field(default_factory=dict)
+
+    def batch(
+        self, scan_classes: Iterable[str], watched: Container[str] | None = None
+    ) -> tuple[list[SSCPDataPoint], Any]:
+        """Points of scan_classes, only the watched keys if given, and their read plan.
+
+        Compiled once per combination of classes; the owner clears batches when watched changes.
+        """
+        classes = frozenset(scan_classes)
+        key = (classes, watched is None)
+        batch = self.batches.get(key)
+        if batch is None:
+            points = sorted(
+                (
+                    point
+                    for scan_class in classes
+                    for point in self.classes.get(scan_class, ())
+                    if watched is None or point.key in watched
+                ),
+                key=attrgetter("slot"),
+            )
+            requests = [point.request for point in points]
+            read_plan = self.build_read_plan(requests) if self.build_read_plan is not None and requests else requests
+            batch = self.batches[key] = (points, read_plan)
+        return batch
+
+
+class SSCPDataCoordinator(DataUpdateCoordinator[SSCPValueStore]):
     """Batch refresh configured variables through one coordinator."""
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry, client: PLCClientProtocol) -> None:
@@ -52,6 +152,8 @@ class SSCPDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             logger=logging.getLogger(__name__),
             name=f"{DOMAIN}_{entry.entry_id}",
             update_interval=timedelta(seconds=max(1, scan_interval)),
+            # Polls fill the same store; entities hear about their changed keys instead of every poll.
+            always_update=False,
         )
         self.entry = entry
         self.client = client
@@ -60,6 +162,38 @@ class SSCPDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.last_refresh_duration_ms: float | None = None
         self.successful_refresh_count = 0
         self.failed_refresh_count = 0
+        self._poll_plan: SSCPPollPlan | None = None
+        self._poll_plan_source: Mapping[str, Any] | None = None
+        self.scan_intervals = {
+            SCAN_CLASS_FAST: int(entry.data.get(CONF_FAST_SCAN_INTERVAL_MS, DEFAULT_FAST_SCAN_INTERVAL_MS)) / 1000.0,
+            SCAN_CLASS_NORMAL: float(max(1, scan_interval)),
+            SCAN_CLASS_SLOW: float(entry.data.get(CONF_SLOW_SCAN_INTERVAL, DEFAULT_SLOW_SCAN_INTERVAL_SECONDS)),
+        }
+        self._class_read_at: dict[str, float] = {}
+        self._class_reads: dict[str, int] = {}
+        self._read_all = False
+        self._poll_running = False
+        self._fast_poll_running = False
+        self._unsub_fast_poll: Callable[[], None] | None = None
+        entry.async_on_unload(self._stop_fast_poll)
+        self.fast_poll_failures = 0
+        self.writes = SSCPWriteCoalescer(
+            hass,
+            client,
+            window_ms=int(entry.data.get(CONF_WRITE_COALESCE_MS, DEFAULT_WRITE_COALESCE_MS)),
+        )
+        self.redundant_write_max_age = int(
+            entry.data.get(CONF_REDUNDANT_WRITE_MAX_AGE, DEFAULT_REDUNDANT_WRITE_MAX_AGE)
+        )
+        self.skipped_write_count = 0
+        self.read_back_count = 0
+        self.read_back_corrections = 0
+        self.read_back_failures = 0
+        self._written_at: dict[tuple[int, int, int], float] = {}
+        self._confirmed_at: dict[tuple[int, int, int], float] = {}
+        self._key_listeners: dict[str, list[Callable[[], None]]] = {}
+        self.last_changed_points = 0
+        self.last_notified_listeners = 0
 
     @property
     def configured_variables(self) -> list[dict[str, Any]]:
@@ -109,157 +243,408 @@ class SSCPDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def configured_scheduler_entities(self) -> list[dict[str, Any]]:
         return list(self.entry.data.get("scheduler_entities", []))
 
+    async def async_write_variables(
+        self,
+        writes: list[dict[str, Any]],
+        *,
+        force: bool = False,
+        read_back: Iterable[dict[str, Any] | None] = (),
+    ) -> bool:
+        """Write one group of values together with whatever other entities write right now.
+
+        Values the last poll already read from the PLC are dropped unless force is set.
+        The written points, plus any polled read_back references the write may affect,
+        are then re-read on their own. Returns False when nothing had to be sent.
+        """
+        if not force and self.redundant_write_max_age > 0:
+            needed = [write for write in writes if not self._is_redundant_write(write)]
+            self.skipped_write_count += len(writes) - len(needed)
+            writes = needed
+        if not writes:
+            return False
+        written_at = monotonic()
+        for write in writes:
+            # Until a read started after this write, the stored value no longer describes the PLC.
+            self._written_at[_data_point_address(write, 0)] = written_at
+        applied = self._apply_optimistic(writes)
+        try:
+            await self.writes.async_write(writes)
+        except Exception:
+            self._roll_back(applied)
+            raise
+        await self._async_read_back(self._read_back_points([*writes, *read_back]))
+        return True
+
+    @callback
+    def async_add_key_listener(self, keys: Iterable[str], update_callback: Callable[[], None]) -> Callable[[], None]:
+        """Call update_callback when a poll or write changes the stored value of one of keys.
+
+        After the first poll only keys with a listener are polled at all.
+        """
+        keys = tuple(dict.fromkeys(keys))
+        watch_changed = False
+        for key in keys:
+            listeners = self._key_listeners.setdefault(key, [])
+            watch_changed |= not listeners
+            listeners.append(update_callback)
+        if watch_changed:
+            self._async_watch_changed()
+
+        @callback
+        def remove_listener() -> None:
+            watch_changed = False
+            for key in keys:
+                listeners = self._key_listeners.get(key)
+                if listeners and update_callback in listeners:
+                    listeners.remove(update_callback)
+                    if not listeners:
+                        del self._key_listeners[key]
+                        watch_changed = True
+            if watch_changed:
+                self._async_watch_changed()
+
+        return remove_listener
+
+    @callback
+    def _async_watch_changed(self) -> None:
+        # Batches filtered by the watched keys are stale; the next poll compiles them again.
+        if self._poll_plan is not None:
+            self._poll_plan.batches.clear()
+            self._sync_fast_poll(self._poll_plan)
+
+    @callback
+    def _async_notify_keys(self, keys: Iterable[str]) -> int:
+        """Call each listener of keys once, however many of its keys changed; returns how many ran."""
+        notified: dict[Callable[[], None], None] = {}
+        for key in keys:
+            for update_callback in self._key_listeners.get(key, ()):
+                notified[update_callback] = None
+        for update_callback in notified:
+            update_callback()
+        return len(notified)
+
+    def _read_back_points(self, refs: Iterable[dict[str, Any] | None]) -> list[SSCPDataPoint]:
+        points: dict[str, SSCPDataPoint] = {}
+        read_index = self.poll_plan.read_index
+        for ref in refs:
+            if not isinstance(ref, dict):
+                continue
+            # Write requests leave out a zero length; configured references default to 1.
+            for point in read_index.get(_data_point_address(ref, 0 if "value" in ref else 1), ()):
+                points[point.key] = point
+        return list(points.values())
+
+    def _apply_optimistic(self, writes: list[dict[str, Any]]) -> dict[SSCPDataPoint, tuple[Any, Any]]:
+        """Store written values right away; returns point -> (previous, written) for a roll back."""
+        store = self.data
+        if store is None:
+            return {}
+        applied: dict[SSCPDataPoint, tuple[Any, Any]] = {}
+        for write in writes:
+            for point in self.poll_plan.read_index.get(_data_point_address(write, 0), ()):
+                if not store.has_value_at(point.slot):
+                    # Never invent a value for a point the last poll could not read.
+                    continue
+                previous = applied[point][0] if point in applied else store.value_at(point.slot)
+                applied[point] = (previous, write["value"])
+                store.set_at(point.slot, write["value"])
+        self._async_notify_keys(point.key for point in applied)
+        return applied
+
+    def _roll_back(self, applied: dict[SSCPDataPoint, tuple[Any, Any]]) -> None:
+        store = self.data
+        if store is None:
+            return
+        # A poll or a later write may have replaced the value meanwhile; only undo our own.
+        restored = [point for point, (_previous, written) in applied.items() if store.value_at(point.slot) is written]
+        for point in restored:
+            store.set_at(point.slot, applied[point][0])
+        self._async_notify_keys(point.key for point in restored)
+
+    async def _async_read_back(self, points: list[SSCPDataPoint]) -> None:
+        """Confirm written points with a read of just those points instead of a full poll."""
+        if not points:
+            return
+        read_started = monotonic()
+        self.read_back_count += 1
+        try:
+            # The read-back completes the user's write, so it queues with writes rather than polls.
+            with request_priority(PRIORITY_INTERACTIVE):
+                values = await async_call_client(
+                    self.hass,
+                    self.client,
+                    "read_variables",
+                    [point.request for point in points],
+                )
+        except Exception as err:  # noqa: BLE001 - the next poll settles the state instead
+            self.read_back_failures += 1
+            self.logger.debug("Read-back of %s written points failed: %s", len(points), err)
+            await self.async_request_refresh()
+            return
+
+        store = self.data
+        if store is None:
+            return
+        corrected: list[str] = []
+        for point in points:
+            if point.key not in values:
+                continue
+            value = values[point.key]
+            if not same_plc_value(value, store.value_at(point.slot), point.type):
+                corrected.append(point.key)
+            store.set_at(point.slot, value)
+            self._confirmed_at[point.address] = read_started
+        self.read_back_corrections += len(corrected)
+        self._async_notify_keys(corrected)
+
+    def _is_redundant_write(self, write: dict[str, Any]) -> bool:
+        if not self.last_update_success:
+            return False
+        address = _data_point_address(write, 0)
+        points = self.poll_plan.read_index.get(address)
+        if not points:
+            return False
+        point = points[0]
+        if point.key not in self._key_listeners:
+            # Nobody watches the point, so no poll keeps its stored value current.
+            return False
+        class_read_at = self._class_read_at.get(point.scan_class)
+        if class_read_at is None:
+            return False
+        read_at = max(class_read_at, self._confirmed_at.get(address, float("-inf")))
+        if monotonic() - read_at > self.redundant_write_max_age or read_at <= self._written_at.get(
+            address, float("-inf")
+        ):
+            return False
+        plc_type = point.type
+        current = self.data.value_at(point.slot) if self.data is not None else None
+        if current is None or plc_type.upper() != str(write.get("type", "")).upper():
+            return False
+        return same_plc_value(write["value"], current, plc_type)
+
+    def quarantined_variables(self) -> list[dict[str, Any]]:
+        quarantined_reads = getattr(self.client, "quarantined_reads", None)
+        return quarantined_reads() if quarantined_reads is not None else []
+
     def metrics_payload(self) -> dict[str, Any]:
-        requests = self._build_requests()
+        plan = self.poll_plan
+        quarantined = self.quarantined_variables()
         return {
-            "configured_variable_count": (
-                len(self.configured_variables)
-                + len(self.configured_climates)
-                + len(self.configured_lights)
-                + len(self.configured_covers)
-                + len(self.configured_vacuums)
-                + len(self.configured_fans)
-                + len(self.configured_humidifiers)
-                + len(self.configured_water_heaters)
-                + len(self.configured_locks)
-                + len(self.configured_valves)
-                + len(self.configured_sirens)
-                + len(self.configured_scheduler_entities)
-            ),
-            "readable_variable_count": len(requests),
+            "configured_variable_count": plan.configured_count,
+            "readable_variable_count": len(plan.requests),
+            "polled_variable_count": sum(1 for request in plan.requests if request["key"] in self._key_listeners),
             "last_refresh_started_at": self.last_refresh_started_at,
             "last_refresh_completed_at": self.last_refresh_completed_at,
             "last_refresh_duration_ms": self.last_refresh_duration_ms,
             "successful_refresh_count": self.successful_refresh_count,
             "failed_refresh_count": self.failed_refresh_count,
+            "quarantined_variable_count": len(quarantined),
+            "quarantined_variables": quarantined,
+            "write_coalescing": self.writes.as_dict(),
+            "redundant_writes": {
+                "max_age_s": self.redundant_write_max_age,
+                "skipped": self.skipped_write_count,
+            },
+            "scan_classes": {
+                scan_class: {
+                    "points": len(plan.classes.get(scan_class, ())),
+                    "interval_s": self.scan_intervals.get(scan_class),
+                    "reads": self._class_reads.get(scan_class, 0),
+                }
+                for scan_class in SCAN_CLASSES
+            },
+            "fast_poll_failures": self.fast_poll_failures,
+            "notifications": {
+                "changed_points": self.last_changed_points,
+                "notified_listeners": self.last_notified_listeners,
+                "key_listeners": len({cb for listeners in self._key_listeners.values() for cb in listeners}),
+            },
+            "read_back": {
+                "reads": self.read_back_count,
+                "corrections": self.read_back_corrections,
+                "failures": self.read_back_failures,
+            },
         }
 
-    def _build_requests(self) -> list[dict[str, Any]]:
+    @property
+    def poll_plan(self) -> SSCPPollPlan:
+        """The compiled poll of the current entry data; recompiled only when the entry is updated."""
+        # Config entry updates replace entry.data, so identity tells whether anything changed.
+        data = self.entry.data
+        if self._poll_plan is None or self._poll_plan_source is not data:
+            previous = self._poll_plan
+            self._poll_plan = self._compile_poll_plan(data)
+            self._poll_plan_source = data
+            if previous is not None:
+                # Slots are numbered per plan; keep the values still configured until the next poll.
+                self._poll_plan.store.fill(previous.store)
+                if self.data is previous.store:
+                    self.data = self._poll_plan.store
+        return self._poll_plan
+
+    def _compile_poll_plan(self, data: Mapping[str, Any]) -> SSCPPollPlan:
         requests: list[dict[str, Any]] = []
-        seen_keys: set[str] = set()
-        for variable in self.configured_variables:
-            if not is_readable_variable(variable):
-                continue
-            request_key = variable_key(variable)
-            if request_key in seen_keys:
-                continue
-            seen_keys.add(request_key)
-            requests.append({**variable, "key": request_key})
-
-        for climate in self.configured_climates:
-            for variable in iter_climate_variable_refs(climate):
-                request_key = variable_key(variable)
-                if request_key in seen_keys:
-                    continue
-                seen_keys.add(request_key)
-                requests.append({**variable, "key": request_key})
-
-        for light in self.configured_lights:
-            for variable in iter_light_variable_refs(light):
-                request_key = variable_key(variable)
-                if request_key in seen_keys:
-                    continue
-                seen_keys.add(request_key)
-                requests.append({**variable, "key": request_key})
-
-        for cover in self.configured_covers:
-            for variable in iter_cover_variable_refs(cover):
-                request_key = variable_key(variable)
-                if request_key in seen_keys:
-                    continue
-                seen_keys.add(request_key)
-                requests.append({**variable, "key": request_key})
-
-        for vacuum in self.configured_vacuums:
-            for variable in iter_vacuum_variable_refs(vacuum):
-                request_key = variable_key(variable)
-                if request_key in seen_keys:
-                    continue
-                seen_keys.add(request_key)
-                requests.append({**variable, "key": request_key})
+        request_classes: list[str] = []
+        indexes: dict[str, int] = {}
 
-        for fan in self.configured_fans:
-            for variable in iter_fan_variable_refs(fan):
-                request_key = variable_key(variable)
-                if request_key in seen_keys:
-                    continue
-                seen_keys.add(request_key)
-                requests.append({**variable, "key": request_key})
-
-        for humidifier in self.configured_humidifiers:
-            for variable in iter_humidifier_variable_refs(humidifier):
-                request_key = variable_key(variable)
-                if request_key in seen_keys:
-                    continue
-                seen_keys.add(request_key)
-                requests.append({**variable, "key": request_key})
-
-        for water_heater in self.configured_water_heaters:
-            for variable in iter_water_heater_variable_refs(water_heater):
-                request_key = variable_key(variable)
-                if request_key in seen_keys:
-                    continue
-                seen_keys.add(request_key)
-                requests.append({**variable, "key": request_key})
-
-        for lock in self.configured_locks:
-            for variable in iter_lock_variable_refs(lock):
-                request_key = variable_key(variable)
-                if request_key in seen_keys:
-                    continue
-                seen_keys.add(request_key)
-                requests.append({**variable, "key": request_key})
-
-        for valve in self.configured_valves:
-            for variable in iter_valve_variable_refs(valve):
-                request_key = variable_key(variable)
-                if request_key in seen_keys:
-                    continue
-                seen_keys.add(request_key)
-                requests.append({**variable, "key": request_key})
-
-        for siren in self.configured_sirens:
-            for variable in iter_siren_variable_refs(siren):
-                request_key = variable_key(variable)
-                if request_key in seen_keys:
-                    continue
-                seen_keys.add(request_key)
-                requests.append({**variable, "key": request_key})
-
-        for scheduler_entity in self.configured_scheduler_entities:
-            for variable in iter_scheduler_entity_refs(scheduler_entity):
-                request_key = variable_key(variable)
-                if request_key in seen_keys:
-                    continue
-                seen_keys.add(request_key)
+        def add(variable: dict[str, Any], scan_class: str) -> None:
+            request_key = variable_key(variable)
+            index = indexes.get(request_key)
+            if index is None:
+                indexes[request_key] = len(requests)
                 requests.append({**variable, "key": request_key})
-        return requests
+                request_classes.append(scan_class)
+            elif _SCAN_CLASS_RANK[scan_class] < _SCAN_CLASS_RANK[request_classes[index]]:
+                # A point several entities use is read at the fastest rate any of them asks for.
+                request_classes[index] = scan_class
+
+        variables = data.get("variables", [])
+        configured_count = len(variables)
+        for variable in variables:
+            if is_readable_variable(variable):
+                add(variable, normalize_scan_class(variable.get("scan_class")))
+        for section, iter_refs in COMPOSED_SECTIONS.items():
+            entities = data.get(section, [])
+            configured_count += len(entities)
+            for entity in entities:
+                scan_class = normalize_scan_class(entity.get("scan_class"))
+                for variable in iter_refs(entity):
+                    add(variable, scan_class)
+
+        read_index: dict[tuple[int, int, int], list[SSCPDataPoint]] = {}
+        classes: dict[str, list[SSCPDataPoint]] = {}
+        for slot, request in enumerate(requests):
+            point = SSCPDataPoint(request, slot, request_classes[slot])
+            read_index.setdefault(point.address, []).append(point)
+            classes.setdefault(point.scan_class, []).append(point)
+        return SSCPPollPlan(
+            requests=requests,
+            read_index=read_index,
+            configured_count=configured_count,
+            store=SSCPValueStore({request["key"]: slot for slot, request in enumerate(requests)}),
+            classes=classes,
+            build_read_plan=getattr(self.client, "build_read_plan", None),
+        )
 
-    def _sync_read(self, requests: list[dict[str, Any]]) -> dict[str, Any]:
-        return self.client.read_variables(requests)
+    async def async_request_refresh(self) -> None:
+        """Request a refresh that also reads the on-demand scan class."""
+        self._read_all = True
+        await super().async_request_refresh()
+
+    def _is_due(self, scan_class: str, now: float, slack: float) -> bool:
+        read_at = self._class_read_at.get(scan_class)
+        return read_at is None or now - read_at >= self.scan_intervals[scan_class] - slack
+
+    def _mark_read(self, scan_classes: Iterable[str], read_started: float) -> None:
+        for scan_class in scan_classes:
+            self._class_read_at[scan_class] = read_started
+            self._class_reads[scan_class] = self._class_reads.get(scan_class, 0) + 1
+
+    @callback
+    def _sync_fast_poll(self, plan: SSCPPollPlan) -> None:
+        """Run the fast scan class on its own timer while an entity watches one of its points."""
+        if not any(point.key in self._key_listeners for point in plan.classes.get(SCAN_CLASS_FAST, ())):
+            self._stop_fast_poll()
+        elif self._unsub_fast_poll is None:
+            self._unsub_fast_poll = async_track_time_interval(
+                self.hass,
+                self._async_fast_poll,
+                timedelta(seconds=self.scan_intervals[SCAN_CLASS_FAST]),
+                name=f"{self.name} fast poll",
+            )
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        requests = self._build_requests()
-        if not requests:
-            return {}
+    @callback
+    def _stop_fast_poll(self) -> None:
+        if self._unsub_fast_poll is not None:
+            self._unsub_fast_poll()
+            self._unsub_fast_poll = None
+
+    async def _async_fast_poll(self, _now: datetime) -> None:
+        """Read the fast scan class between polls; a poll of the slower classes reads it along."""
+        plan = self.poll_plan
+        fast_interval = self.scan_intervals[SCAN_CLASS_FAST]
+        if (
+            self._poll_running
+            or self._fast_poll_running
+            or not self.last_update_success
+            or not self._is_due(SCAN_CLASS_FAST, monotonic(), fast_interval / 2)
+        ):
+            return
+        points, read_plan = plan.batch((SCAN_CLASS_FAST,), self._key_listeners)
+        if not points:
+            return
+        read_started = monotonic()
+        self._fast_poll_running = True
+        try:
+            result = await async_call_client(self.hass, self.client, "read_variables", read_plan)
+        except Exception as err:  # noqa: BLE001 - a lasting failure shows up in the next regular poll
+            self.fast_poll_failures += 1
+            self.logger.debug("Fast poll of %s points failed: %s", len(points), err)
+            return
+        finally:
+            self._fast_poll_running = False
+        self._mark_read((SCAN_CLASS_FAST,), read_started)
+        self._async_notify_keys(plan.store.fill(result, points))
+
+    async def _async_update_data(self) -> SSCPValueStore:
+        """Read the normal scan class plus every other class that is due in one batch.
+
+        The first poll and requested refreshes read every class, on-demand included.
+        The first poll reads every point, later polls only points an entity listens to.
+        References the PLC rejects are left out, not fatal.
+        """
+        plan = self.poll_plan
+        self._sync_fast_poll(plan)
+        read_started = monotonic()
+        first_poll = not self._class_read_at
+        if self._read_all or first_poll:
+            scan_classes = list(plan.classes)
+        else:
+            # Classes falling due within half a poll interval are read now rather than a moment later.
+            slack = self.scan_intervals[SCAN_CLASS_NORMAL] / 2
+            scan_classes = [SCAN_CLASS_NORMAL]
+            for scan_class in (SCAN_CLASS_FAST, SCAN_CLASS_SLOW):
+                if plan.classes.get(scan_class) and self._is_due(scan_class, read_started, slack):
+                    scan_classes.append(scan_class)
+        # Entities are added after the first poll; from then on their listeners say what is consumed.
+        points, read_plan = plan.batch(scan_classes, None if first_poll else self._key_listeners)
+        if not points:
+            return plan.store
         started = datetime.now(UTC)
         started_perf = perf_counter()
         self.last_refresh_started_at = started
+        self._poll_running = True
         try:
-            result = await self.hass.async_add_executor_job(self._sync_read, requests)
+            result = await async_call_client(self.hass, self.client, "read_variables", read_plan)
             self.last_refresh_completed_at = datetime.now(UTC)
             self.last_refresh_duration_ms = (perf_counter() - started_perf) * 1000.0
             self.successful_refresh_count += 1
-            return result
+            # Filled in place, so slots entities resolved earlier stay valid across polls.
+            changed = plan.store.fill(result, points)
         except Exception as err:
             self.last_refresh_completed_at = datetime.now(UTC)
             self.last_refresh_duration_ms = (perf_counter() - started_perf) * 1000.0
             self.failed_refresh_count += 1
             raise UpdateFailed(str(err)) from err
+        finally:
+            self._poll_running = False
+        self._mark_read(scan_classes, read_started)
+        self._read_all = False
+        self.last_changed_points = len(changed)
+        if self.last_update_success:
+            self.last_notified_listeners = self._async_notify_keys(changed)
+        else:
+            # Recovering from a failed poll; the coordinator updates every listener anyway.
+            self.last_notified_listeners = 0
+        return plan.store
 
 
 class SSCPDiagnosticsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Periodic PLC diagnostics refresh for system entities."""
+    """Periodic PLC diagnostics refresh for system entities.
+
+    Basic info, statistics and time are requested from the PLC only while an
+    added entity reads them.
+    """
 
     def __init__(
         self,
@@ -283,8 +668,31 @@ class SSCPDiagnosticsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.entry = entry
         self.client = client
         self.data_coordinator = data_coordinator
-
-    def _collect_sync(self) -> dict[str, Any]:
+        self._section_listeners: dict[str, int] = {}
+
+    @callback
+    def async_add_section_listener(self, sections: Iterable[str]) -> Callable[[], None]:
+        """Keep the PLC requests behind sections of the payload in each refresh until removed."""
+        sections = tuple(dict.fromkeys(sections))
+        for section in sections:
+            self._section_listeners[section] = self._section_listeners.get(section, 0) + 1
+
+        @callback
+        def remove_listener() -> None:
+            for section in sections:
+                remaining = self._section_listeners.get(section, 0) - 1
+                if remaining > 0:
+                    self._section_listeners[section] = remaining
+                else:
+                    self._section_listeners.pop(section, None)
+
+        return remove_listener
+
+    def _wants(self, section: str) -> bool:
+        # The first refresh runs before any entity is added and fills every section once.
+        return self.data is None or section in self._section_listeners
+
+    async def _async_collect(self) -> dict[str, Any]:
         payload: dict[str, Any] = {
             "connected": bool(getattr(self.client, "connected", False) and getattr(self.client, "loggedin", False)),
             "transport": getattr(self.client, "transport_name", "sscp"),
@@ -292,6 +700,7 @@ class SSCPDiagnosticsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "basic_info": {},
             "plc_statistics": {},
             "time": {},
+            "link": {},
             "errors": {},
         }
 
@@ -300,27 +709,36 @@ class SSCPDiagnosticsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         except Exception as err:
             payload["errors"]["capabilities"] = str(err)
 
-        try:
-            payload["basic_info"] = self.client.get_basic_info(requested_size=0)
-        except Exception as err:
-            payload["errors"]["basic_info"] = str(err)
+        link_state = getattr(self.client, "link_state", None)
+        if link_state is not None:
+            payload["link"] = link_state()
 
-        try:
-            payload["plc_statistics"] = self.client.get_plc_statistics()
-        except Exception as err:
-            payload["errors"]["plc_statistics"] = str(err)
+        if self._wants("basic_info"):
+            try:
+                payload["basic_info"] = await async_call_client(
+                    self.hass, self.client, "get_basic_info", requested_size=0
+                )
+            except Exception as err:
+                payload["errors"]["basic_info"] = str(err)
 
-        for key, mode in (
-            ("utc", "utc"),
-            ("local", "local"),
-            ("timezone_offset", "timezone"),
-            ("daylight_offset", "daylight"),
-        ):
+        if self._wants("plc_statistics"):
             try:
-                getter = self.client.get_time if key in {"utc", "local"} else self.client.get_time_offset
-                payload["time"][key] = getter(mode)
+                payload["plc_statistics"] = await async_call_client(self.hass, self.client, "get_plc_statistics")
             except Exception as err:
-                payload["errors"][key] = str(err)
+                payload["errors"]["plc_statistics"] = str(err)
+
+        if self._wants("time"):
+            for key, mode in (
+                ("utc", "utc"),
+                ("local", "local"),
+                ("timezone_offset", "timezone"),
+                ("daylight_offset", "daylight"),
+            ):
+                try:
+                    getter = "get_time" if key in {"utc", "local"} else "get_time_offset"
+                    payload["time"][key] = await async_call_client(self.hass, self.client, getter, mode)
+                except Exception as err:
+                    payload["errors"][key] = str(err)
 
         if self.data_coordinator is not None:
             payload["metrics"] = self.data_coordinator.metrics_payload()
@@ -332,6 +750,6 @@ class SSCPDiagnosticsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def _async_update_data(self) -> dict[str, Any]:
         try:
-            return await self.hass.async_add_executor_job(self._collect_sync)
+            return await self._async_collect()
         except Exception as err:
             raise UpdateFailed(str(err)) from err
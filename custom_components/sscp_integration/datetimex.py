@@ -10,6 +10,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import COMM_MODE_WEBPANEL, DOMAIN
 from .coordinator import SSCPDiagnosticsCoordinator
 from .entity import SSCPBaseEntity, async_apply_entity_area, build_plc_device_info
+from .transport import async_call_client
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -95,11 +96,12 @@ class SSCPSystemDateTimeEntity(CoordinatorEntity[SSCPDiagnosticsCoordinator], Da
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_add_section_listener(("time",)))
         await async_apply_entity_area(self.hass, getattr(self, "entity_id", None), None)
 
     async def async_set_value(self, value: datetime) -> None:
         try:
-            await self.hass.async_add_executor_job(self._client.set_time, value, self._mode)
+            await async_call_client(self.hass, self._client, "set_time", value, self._mode)
             await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to set %s time for %s: %s", self._mode, self.name, err)
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-from functools import partial
 import logging
-from typing import Any
+from typing import Any, Callable, Iterable
 
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import SSCPDataCoordinator, variable_key
+from .coordinator import SSCPDataCoordinator, is_readable_variable, variable_key
 from .transport import PLCClientProtocol
+from .value_store import SSCPValueStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,6 +39,97 @@ async def async_apply_entity_area(hass, entity_id: str | None, area_id: str | No
         _LOGGER.warning("Failed to apply area %s to %s: %s", normalized_area_id, entity_id, err)
 
 
+def build_write_request(uid: int, value: Any, *, offset: int, length: int, type_data: str) -> dict[str, Any]:
+    request = {"uid": uid, "offset": offset, "type": type_data, "value": value}
+    if length:
+        # Without a length the client falls back to the size of the PLC type, as write_variable does.
+        request["length"] = length
+    return request
+
+
+def ref_data_keys(refs: dict[str, Any]) -> list[str]:
+    """Return the coordinator data keys of the data points a composite entity is built from."""
+    return [variable_key(ref) for ref in refs.values() if isinstance(ref, dict)]
+
+
+class SSCPRefValues:
+    """Reads the values of a composite entity's data points by role.
+
+    Each role's key is resolved to its value store slot once per store, so a state
+    property reads a list index instead of formatting and hashing the key.
+    """
+
+    __slots__ = ("_coordinator", "_keys", "_store", "_slots")
+
+    def __init__(self, coordinator: SSCPDataCoordinator, refs: dict[str, Any]) -> None:
+        self._coordinator = coordinator
+        self._keys = {role: variable_key(ref) for role, ref in refs.items() if isinstance(ref, dict)}
+        self._store: SSCPValueStore | None = None
+        self._slots: dict[str, int | None] = {}
+
+    def get(self, role: str) -> Any:
+        store = self._coordinator.data
+        if store is None:
+            return None
+        if store is not self._store:
+            self._store = store
+            self._slots = {role: store.slot_of(key) for role, key in self._keys.items()}
+        slot = self._slots.get(role)
+        return None if slot is None else store.value_at(slot)
+
+
+class SSCPWriteTransaction:
+    """Collects the data point writes of one service call and commits them together.
+
+    The values reach the client as a single group, so the PLC gets them in one
+    write frame instead of one per data point and never observes a half-applied
+    state. The coordinator may send the group alongside other entities' writes.
+    With force, or once a forced value such as a command trigger is added, the
+    group is sent even if the PLC already holds every value.
+    """
+
+    def __init__(
+        self,
+        coordinator: SSCPDataCoordinator,
+        coerce: Callable[[Any, str], Any],
+        *,
+        read_back: Iterable[dict[str, Any] | None] = (),
+        force: bool = False,
+    ) -> None:
+        self._coordinator = coordinator
+        self._coerce = coerce
+        self._read_back = list(read_back)
+        self._force = force
+        self._writes: dict[tuple[int, int, int], dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._writes)
+
+    def add(self, ref: dict[str, Any] | None, raw_value: Any, *, force: bool = False) -> None:
+        if not isinstance(ref, dict):
+            raise ValueError("Chybi datovy bod pro zapis.")
+        plc_type = str(ref["type"])
+        uid = int(ref["uid"])
+        offset = int(ref.get("offset", 0))
+        length = int(ref.get("length", 1))
+        self._force = self._force or force
+        # A later value for the same data point replaces the earlier one.
+        self._writes[(uid, offset, length)] = build_write_request(
+            uid,
+            self._coerce(raw_value, plc_type),
+            offset=offset,
+            length=length,
+            type_data=plc_type,
+        )
+
+    async def async_commit(self) -> None:
+        if not self._writes:
+            return
+        writes = list(self._writes.values())
+        self._writes.clear()
+        await self._coordinator.async_write_variables(writes, force=self._force, read_back=self._read_back)
+
+
 class SSCPBaseEntity(CoordinatorEntity[SSCPDataCoordinator]):
     """Shared helper for all SSCP entities backed by the coordinator."""
 
@@ -59,9 +150,13 @@ class SSCPBaseEntity(CoordinatorEntity[SSCPDataCoordinator]):
         self._offset = int(config.get("offset", 0))
         self._length = int(config.get("length", 1))
         self._type = str(config["type"])
+        # Commands whose side effect the PLC needs on every write opt out of skipping unchanged values.
+        self._always_write = bool(config.get("always_write"))
         self._entry_id = entry_id
         self.hass = hass
         self._coordinator_key = variable_key(config)
+        self._slot_store: SSCPValueStore | None = None
+        self._slot: int | None = None
 
     @property
     def plc_name(self) -> str:
@@ -75,29 +170,43 @@ class SSCPBaseEntity(CoordinatorEntity[SSCPDataCoordinator]):
             getattr(self._client, "transport_name", "sscp"),
         )
 
+    @property
+    def available(self) -> bool:
+        if not super().available or not is_readable_variable(self._config):
+            return super().available
+        # Quarantined references are missing from an otherwise successful poll.
+        slot = self._data_slot()
+        return slot is not None and self.coordinator.data.has_value_at(slot)
+
     @property
     def current_value(self) -> Any:
-        return self.coordinator.data.get(self._coordinator_key)
+        slot = self._data_slot()
+        return None if slot is None else self.coordinator.data.value_at(slot)
+
+    def _data_slot(self) -> int | None:
+        store = self.coordinator.data
+        if store is None:
+            return None
+        if store is not self._slot_store:
+            self._slot_store = store
+            self._slot = store.slot_of(self._coordinator_key)
+        return self._slot
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_key_listener([self._coordinator_key], self._handle_coordinator_update)
+        )
         await self._async_apply_area_id()
 
     async def _async_apply_area_id(self) -> None:
         await async_apply_entity_area(self.hass, getattr(self, "entity_id", None), self._config.get("area_id"))
 
+    def _write_request(self, value: Any) -> dict[str, Any]:
+        return build_write_request(self._uid, value, offset=self._offset, length=self._length, type_data=self._type)
+
     async def async_write_value(self, value: Any) -> None:
-        await self.hass.async_add_executor_job(
-            partial(
-                self._client.write_variable,
-                self._uid,
-                value,
-                offset=self._offset,
-                length=self._length,
-                type_data=self._type,
-            )
-        )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write_variables([self._write_request(value)], force=self._always_write)
 
     async def async_write_sscp_value(self, value: Any) -> None:
         await self.async_write_value(value)
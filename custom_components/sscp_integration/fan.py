@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from functools import partial
 import logging
 from typing import Any
 
@@ -12,8 +11,8 @@ from homeassistant.components.fan import (
 )
 
 from .const import DOMAIN
-from .coordinator import SSCPDataCoordinator, variable_key
-from .entity import async_apply_entity_area, build_plc_device_info
+from .coordinator import SSCPDataCoordinator
+from .entity import SSCPRefValues, SSCPWriteTransaction, async_apply_entity_area, build_plc_device_info, ref_data_keys
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -89,6 +88,7 @@ class SSCPComposedFan(FanEntity):
             "oscillate_var": config.get("oscillate_var"),
             "direction_var": config.get("direction_var"),
         }
+        self._values = SSCPRefValues(coordinator, self._refs)
         self._preset_map = {
             str(key): str(value).strip()
             for key, value in (config.get("preset_map") or {}).items()
@@ -117,29 +117,26 @@ class SSCPComposedFan(FanEntity):
     async def async_added_to_hass(self) -> None:
         if hasattr(self.coordinator, "async_add_listener"):
             self.async_on_remove(self.coordinator.async_add_listener(self.async_write_ha_state))
+            self.async_on_remove(
+                self.coordinator.async_add_key_listener(ref_data_keys(self._refs), self.async_write_ha_state)
+            )
         await async_apply_entity_area(self.hass, getattr(self, "entity_id", None), self._config.get("area_id"))
 
     @property
     def available(self) -> bool:
         return self.coordinator.last_update_success if self.coordinator else False
 
-    def _coordinator_value(self, ref: dict[str, Any] | None) -> Any:
-        if not isinstance(ref, dict):
-            return None
-        return self.coordinator.data.get(variable_key(ref))
-
-    async def _async_write_ref(self, ref: dict[str, Any] | None, raw_value: Any) -> None:
-        if not isinstance(ref, dict):
-            raise ValueError("Chybi datovy bod pro zapis.")
-        await self.hass.async_add_executor_job(
-            partial(
-                self._client.write_variable,
-                int(ref["uid"]),
-                _coerce_write_value(raw_value, str(ref["type"])),
-                offset=int(ref.get("offset", 0)),
-                length=int(ref.get("length", 1)),
-                type_data=str(ref["type"]),
-            )
+    async def _async_write_ref(self, ref: dict[str, Any] | None, raw_value: Any, *, force: bool = False) -> None:
+        writes = self._write_transaction()
+        writes.add(ref, raw_value, force=force)
+        await writes.async_commit()
+
+    def _write_transaction(self) -> SSCPWriteTransaction:
+        return SSCPWriteTransaction(
+            self.coordinator,
+            _coerce_write_value,
+            read_back=self._refs.values(),
+            force=bool(self._config.get("always_write")),
         )
 
     @property
@@ -159,7 +156,7 @@ class SSCPComposedFan(FanEntity):
 
     @property
     def is_on(self) -> bool | None:
-        power_value = self._coordinator_value(self._refs.get("power_var"))
+        power_value = self._values.get("power_var")
         if power_value is not None:
             return bool(power_value)
         percentage = self.percentage
@@ -169,7 +166,7 @@ class SSCPComposedFan(FanEntity):
 
     @property
     def percentage(self) -> int | None:
-        value = self._coordinator_value(self._refs.get("percentage_var"))
+        value = self._values.get("percentage_var")
         if value is None:
             return None
         return max(0, min(100, int(round(float(value)))))
@@ -186,21 +183,21 @@ class SSCPComposedFan(FanEntity):
 
     @property
     def preset_mode(self) -> str | None:
-        value = self._coordinator_value(self._refs.get("preset_var"))
+        value = self._values.get("preset_var")
         if value is None:
             return None
         return self._preset_map.get(_value_key(value))
 
     @property
     def oscillating(self) -> bool | None:
-        value = self._coordinator_value(self._refs.get("oscillate_var"))
+        value = self._values.get("oscillate_var")
         if value is None:
             return None
         return bool(value)
 
     @property
     def current_direction(self) -> str | None:
-        value = self._coordinator_value(self._refs.get("direction_var"))
+        value = self._values.get("direction_var")
         if value is None:
             return None
         mapped = self._direction_map.get(_value_key(value))
@@ -211,19 +208,20 @@ class SSCPComposedFan(FanEntity):
         return None
 
     async def async_turn_on(self, percentage: int | None = None, preset_mode: str | None = None, **kwargs) -> None:
+        writes = self._write_transaction()
         try:
             if self._refs.get("power_var"):
-                await self._async_write_ref(self._refs.get("power_var"), True)
+                writes.add(self._refs.get("power_var"), True)
             elif self._refs.get("percentage_var"):
-                await self._async_write_ref(self._refs.get("percentage_var"), percentage if percentage is not None else 100)
+                writes.add(self._refs.get("percentage_var"), percentage if percentage is not None else 100)
             if percentage is not None and self._refs.get("percentage_var"):
-                await self._async_write_ref(self._refs.get("percentage_var"), percentage)
+                writes.add(self._refs.get("percentage_var"), percentage)
             if preset_mode is not None and self._refs.get("preset_var"):
                 raw_value = self._preset_reverse_map.get(str(preset_mode))
                 if raw_value is None:
                     raise ValueError(f"Preset mode {preset_mode} neni v mapovani definovan.")
-                await self._async_write_ref(self._refs.get("preset_var"), raw_value)
-            await self.coordinator.async_request_refresh()
+                writes.add(self._refs.get("preset_var"), raw_value)
+            await writes.async_commit()
         except Exception as err:
             _LOGGER.error("Failed to turn on fan %s: %s", self.name, err)
 
@@ -235,14 +233,12 @@ class SSCPComposedFan(FanEntity):
                 await self._async_write_ref(self._refs.get("percentage_var"), 0)
             else:
                 raise ValueError("Fan nema definovan power ani percentage point pro vypnuti.")
-            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to turn off fan %s: %s", self.name, err)
 
     async def async_set_percentage(self, percentage: int) -> None:
         try:
             await self._async_write_ref(self._refs.get("percentage_var"), max(0, min(100, int(percentage))))
-            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to set percentage for fan %s: %s", self.name, err)
 
@@ -252,14 +248,12 @@ class SSCPComposedFan(FanEntity):
             if raw_value is None:
                 raise ValueError(f"Preset mode {preset_mode} neni v mapovani definovan.")
             await self._async_write_ref(self._refs.get("preset_var"), raw_value)
-            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to set preset mode for fan %s: %s", self.name, err)
 
     async def async_oscillate(self, oscillating: bool) -> None:
         try:
             await self._async_write_ref(self._refs.get("oscillate_var"), bool(oscillating))
-            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to set oscillation for fan %s: %s", self.name, err)
 
@@ -270,6 +264,5 @@ class SSCPComposedFan(FanEntity):
             if raw_value is None:
                 raise ValueError(f"Smer ventilatoru {direction} neni v mapovani definovan.")
             await self._async_write_ref(self._refs.get("direction_var"), raw_value)
-            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to set direction for fan %s: %s", self.name, err)
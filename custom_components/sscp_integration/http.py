@@ -9,7 +9,16 @@ from aiohttp import web
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN, FRONTEND_ACTION_PATH, FRONTEND_STATUS_PATH
+from .const import (
+    DEFAULT_FAST_SCAN_INTERVAL_MS,
+    DEFAULT_REDUNDANT_WRITE_MAX_AGE,
+    DEFAULT_SHARED_GATEWAY,
+    DEFAULT_SLOW_SCAN_INTERVAL_SECONDS,
+    DEFAULT_WRITE_COALESCE_MS,
+    DOMAIN,
+    FRONTEND_ACTION_PATH,
+    FRONTEND_STATUS_PATH,
+)
 from .runtime import async_domain_state_payload, resolve_runtime
 
 _LOGGER = logging.getLogger(__name__)
@@ -117,6 +126,15 @@ class SSCPActionView(HomeAssistantView):
                     scan_interval=int(payload.get("scan_interval", 5)),
                     vlist_file_name=payload.get("vlist_file_name", ""),
                     configuration_mode=payload.get("configuration_mode", "vlist"),
+                    session_count=int(payload.get("session_count", 1)),
+                    pipeline_depth=int(payload.get("pipeline_depth", 1)),
+                    write_coalesce_ms=int(payload.get("write_coalesce_ms", DEFAULT_WRITE_COALESCE_MS)),
+                    redundant_write_max_age=int(
+                        payload.get("redundant_write_max_age", DEFAULT_REDUNDANT_WRITE_MAX_AGE)
+                    ),
+                    fast_scan_interval_ms=int(payload.get("fast_scan_interval_ms", DEFAULT_FAST_SCAN_INTERVAL_MS)),
+                    slow_scan_interval=int(payload.get("slow_scan_interval", DEFAULT_SLOW_SCAN_INTERVAL_SECONDS)),
+                    shared_gateway=bool(payload.get("shared_gateway", DEFAULT_SHARED_GATEWAY)),
                 )
                 return web.json_response(result)
 
@@ -136,6 +154,8 @@ class SSCPActionView(HomeAssistantView):
                     step=_optional_float(payload.get("step")),
                     mode=str(payload.get("mode", "box")),
                     press_time=_optional_float(payload.get("press_time")),
+                    write_interval_ms=_optional_int(payload.get("write_interval_ms")),
+                    always_write=bool(payload.get("always_write", False)),
                 )
                 return web.json_response(result)
 
@@ -158,6 +178,8 @@ class SSCPActionView(HomeAssistantView):
                     step=_optional_float(payload.get("step")),
                     mode=str(payload.get("mode", "box")),
                     press_time=_optional_float(payload.get("press_time")),
+                    write_interval_ms=_optional_int(payload.get("write_interval_ms")),
+                    always_write=bool(payload.get("always_write", False)),
                     select_options=payload.get("select_options") or {},
                 )
                 return web.json_response(result)
@@ -177,6 +199,8 @@ class SSCPActionView(HomeAssistantView):
                     step=_optional_float(payload.get("step")),
                     mode=str(payload.get("mode", "box")),
                     press_time=_optional_float(payload.get("press_time")),
+                    write_interval_ms=_optional_int(payload.get("write_interval_ms")),
+                    always_write=None if payload.get("always_write") is None else bool(payload["always_write"]),
                 )
                 return web.json_response(result)
 
@@ -225,6 +249,7 @@ class SSCPActionView(HomeAssistantView):
                     white_name=str(payload.get("white_name", "")),
                     effect_name=str(payload.get("effect_name", "")),
                     effect_map=payload.get("effect_map") or {},
+                    write_interval_ms=_optional_int(payload.get("write_interval_ms")),
                 )
                 return web.json_response(result)
 
@@ -429,6 +454,22 @@ class SSCPActionView(HomeAssistantView):
                 result = await runtime.async_delete_variable(variable_entry_key=payload["variable_entry_key"])
                 return web.json_response(result)
 
+            if action == "set_scan_class":
+                result = await runtime.async_set_scan_class(
+                    section=str(payload.get("section", "")),
+                    key=str(payload.get("key", "")),
+                    scan_class=str(payload.get("scan_class", "")),
+                )
+                return web.json_response(result)
+
+            if action == "set_always_write":
+                result = await runtime.async_set_always_write(
+                    section=str(payload.get("section", "")),
+                    key=str(payload.get("key", "")),
+                    always_write=bool(payload.get("always_write", False)),
+                )
+                return web.json_response(result)
+
             if action == "reload_from_vlist":
                 result = await runtime.async_reload_from_vlist()
                 return web.json_response(result)
@@ -456,6 +497,13 @@ class SSCPActionView(HomeAssistantView):
                 )
                 return web.json_response(result)
 
+            if action == "apply_scheduler":
+                result = await runtime.async_apply_scheduler(
+                    source_root_name=str(payload.get("root_name", "")),
+                    targets=payload.get("targets") or [],
+                )
+                return web.json_response(result)
+
             return web.json_response({"error": "unknown_action"}, status=400)
         except (KeyError, TypeError, ValueError) as err:
             return web.json_response(
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from functools import partial
 import logging
 from typing import Any
 
@@ -12,8 +11,8 @@ except ImportError:  # pragma: no cover
     HumidifierDeviceClass = None
 
 from .const import DOMAIN
-from .coordinator import SSCPDataCoordinator, variable_key
-from .entity import async_apply_entity_area, build_plc_device_info
+from .coordinator import SSCPDataCoordinator
+from .entity import SSCPRefValues, SSCPWriteTransaction, async_apply_entity_area, build_plc_device_info, ref_data_keys
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -101,6 +100,7 @@ class SSCPComposedHumidifier(HumidifierEntity):
             "power_var": config.get("power_var"),
             "mode_var": config.get("mode_var"),
         }
+        self._values = SSCPRefValues(coordinator, self._refs)
         self._mode_map = {
             str(key): str(value).strip()
             for key, value in (config.get("mode_map") or {}).items()
@@ -123,29 +123,26 @@ class SSCPComposedHumidifier(HumidifierEntity):
     async def async_added_to_hass(self) -> None:
         if hasattr(self.coordinator, "async_add_listener"):
             self.async_on_remove(self.coordinator.async_add_listener(self.async_write_ha_state))
+            self.async_on_remove(
+                self.coordinator.async_add_key_listener(ref_data_keys(self._refs), self.async_write_ha_state)
+            )
         await async_apply_entity_area(self.hass, getattr(self, "entity_id", None), self._config.get("area_id"))
 
     @property
     def available(self) -> bool:
         return self.coordinator.last_update_success if self.coordinator else False
 
-    def _coordinator_value(self, ref: dict[str, Any] | None) -> Any:
-        if not isinstance(ref, dict):
-            return None
-        return self.coordinator.data.get(variable_key(ref))
-
-    async def _async_write_ref(self, ref: dict[str, Any] | None, raw_value: Any) -> None:
-        if not isinstance(ref, dict):
-            raise ValueError("Chybi datovy bod pro zapis.")
-        await self.hass.async_add_executor_job(
-            partial(
-                self._client.write_variable,
-                int(ref["uid"]),
-                _coerce_write_value(raw_value, str(ref["type"])),
-                offset=int(ref.get("offset", 0)),
-                length=int(ref.get("length", 1)),
-                type_data=str(ref["type"]),
-            )
+    async def _async_write_ref(self, ref: dict[str, Any] | None, raw_value: Any, *, force: bool = False) -> None:
+        writes = self._write_transaction()
+        writes.add(ref, raw_value, force=force)
+        await writes.async_commit()
+
+    def _write_transaction(self) -> SSCPWriteTransaction:
+        return SSCPWriteTransaction(
+            self.coordinator,
+            _coerce_write_value,
+            read_back=self._refs.values(),
+            force=bool(self._config.get("always_write")),
         )
 
     @property
@@ -157,21 +154,21 @@ class SSCPComposedHumidifier(HumidifierEntity):
 
     @property
     def is_on(self) -> bool | None:
-        value = self._coordinator_value(self._refs.get("power_var"))
+        value = self._values.get("power_var")
         if value is None:
             return None
         return bool(value)
 
     @property
     def current_humidity(self) -> int | None:
-        value = self._coordinator_value(self._refs.get("current_humidity_var"))
+        value = self._values.get("current_humidity_var")
         if value is None:
             return None
         return int(round(float(value)))
 
     @property
     def target_humidity(self) -> int | None:
-        value = self._coordinator_value(self._refs.get("target_humidity_var"))
+        value = self._values.get("target_humidity_var")
         if value is None:
             return None
         return int(round(float(value)))
@@ -190,7 +187,7 @@ class SSCPComposedHumidifier(HumidifierEntity):
 
     @property
     def mode(self) -> str | None:
-        value = self._coordinator_value(self._refs.get("mode_var"))
+        value = self._values.get("mode_var")
         if value is None:
             return None
         return self._mode_map.get(_value_key(value))
@@ -216,14 +213,12 @@ class SSCPComposedHumidifier(HumidifierEntity):
     async def async_turn_on(self, **kwargs) -> None:
         try:
             await self._async_write_ref(self._refs.get("power_var"), True)
-            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to turn on humidifier %s: %s", self.name, err)
 
     async def async_turn_off(self, **kwargs) -> None:
         try:
             await self._async_write_ref(self._refs.get("power_var"), False)
-            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to turn off humidifier %s: %s", self.name, err)
 
@@ -231,7 +226,6 @@ class SSCPComposedHumidifier(HumidifierEntity):
         try:
             bounded = max(self.min_humidity, min(self.max_humidity, int(humidity)))
             await self._async_write_ref(self._refs.get("target_humidity_var"), bounded)
-            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to set humidity for %s: %s", self.name, err)
 
@@ -241,6 +235,5 @@ class SSCPComposedHumidifier(HumidifierEntity):
             if raw_value is None:
                 raise ValueError(f"Humidifier mode {mode} neni v mapovani definovan.")
             await self._async_write_ref(self._refs.get("mode_var"), raw_value)
-            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to set mode for %s: %s", self.name, err)
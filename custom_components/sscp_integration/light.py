@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-from functools import partial
 import logging
 from typing import Any
 
 from homeassistant.components.light import ColorMode, LightEntity
 
 from .const import DOMAIN
-from .coordinator import SSCPDataCoordinator, variable_key
-from .entity import SSCPBaseEntity, async_apply_entity_area, build_plc_device_info
+from .coordinator import SSCPDataCoordinator
+from .entity import SSCPBaseEntity, SSCPRefValues, SSCPWriteTransaction, async_apply_entity_area, build_plc_device_info, ref_data_keys
+from .write_coalescer import SSCPWriteBehind
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -146,10 +146,17 @@ class SSCPComposedLight(LightEntity):
             "white_var": config.get("white_var"),
             "effect_var": config.get("effect_var"),
         }
+        self._values = SSCPRefValues(coordinator, self._refs)
         self._attr_name = str(config.get("name") or "Light")
         self._attr_unique_id = f"{entry_id}_light_{config.get('entity_key')}"
         self._attr_has_entity_name = False
         self._attr_supported_color_modes = set(self._compute_supported_color_modes())
+        write_interval_ms = int(config.get("write_interval_ms") or 0)
+        self._brightness_writer = (
+            SSCPWriteBehind(write_interval_ms, self._async_write_brightness, self._async_brightness_settled)
+            if write_interval_ms > 0 and self._refs.get("brightness_var")
+            else None
+        )
 
     def _compute_supported_color_modes(self) -> list[ColorMode]:
         modes: list[ColorMode] = []
@@ -178,64 +185,84 @@ class SSCPComposedLight(LightEntity):
     async def async_added_to_hass(self) -> None:
         if hasattr(self.coordinator, "async_add_listener"):
             self.async_on_remove(self.coordinator.async_add_listener(self.async_write_ha_state))
+            self.async_on_remove(
+                self.coordinator.async_add_key_listener(ref_data_keys(self._refs), self.async_write_ha_state)
+            )
         await async_apply_entity_area(self.hass, getattr(self, "entity_id", None), self._config.get("area_id"))
 
     @property
     def available(self) -> bool:
         return self.coordinator.last_update_success if self.coordinator else False
 
-    def _coordinator_value(self, ref: dict[str, Any] | None) -> Any:
-        if not isinstance(ref, dict):
-            return None
-        return self.coordinator.data.get(variable_key(ref))
-
-    async def _async_write_ref(self, ref: dict[str, Any] | None, raw_value: Any) -> None:
-        if not isinstance(ref, dict):
-            raise ValueError("Chybi datovy bod pro zapis.")
-        await self.hass.async_add_executor_job(
-            partial(
-                self._client.write_variable,
-                int(ref["uid"]),
-                _coerce_write_value(raw_value, str(ref["type"])),
-                offset=int(ref.get("offset", 0)),
-                length=int(ref.get("length", 1)),
-                type_data=str(ref["type"]),
-            )
+    async def _async_write_ref(self, ref: dict[str, Any] | None, raw_value: Any, *, force: bool = False) -> None:
+        writes = self._write_transaction()
+        writes.add(ref, raw_value, force=force)
+        await writes.async_commit()
+
+    def _write_transaction(self) -> SSCPWriteTransaction:
+        return SSCPWriteTransaction(
+            self.coordinator,
+            _coerce_write_value,
+            read_back=self._refs.values(),
+            force=bool(self._config.get("always_write")),
         )
 
+    def _pending_brightness(self) -> int | None:
+        if self._brightness_writer is not None and self._brightness_writer.pending:
+            return int(self._brightness_writer.value)
+        return None
+
+    async def _async_write_brightness(self, brightness: int) -> None:
+        writes = self._write_transaction()
+        if self._refs.get("power_var"):
+            writes.add(self._refs.get("power_var"), True)
+        writes.add(self._refs.get("brightness_var"), _from_brightness(brightness, self._brightness_scale))
+        await writes.async_commit()
+
+    async def _async_brightness_settled(self, error: BaseException | None) -> None:
+        if error is not None:
+            _LOGGER.error("Failed to turn on composed light %s: %s", self.name, error)
+        self.async_write_ha_state()
+
     @property
     def is_on(self):
-        power_value = self._coordinator_value(self._refs.get("power_var"))
+        pending_brightness = self._pending_brightness()
+        if pending_brightness is not None:
+            return True
+        power_value = self._values.get("power_var")
         if power_value is not None:
             return bool(power_value)
         brightness = self.brightness
         if brightness is not None:
             return brightness > 0
-        white_value = self._coordinator_value(self._refs.get("white_var"))
+        white_value = self._values.get("white_var")
         if white_value is not None:
             return float(white_value) > 0
         return None
 
     @property
     def brightness(self) -> int | None:
-        value = self._coordinator_value(self._refs.get("brightness_var"))
+        pending_brightness = self._pending_brightness()
+        if pending_brightness is not None:
+            return pending_brightness
+        value = self._values.get("brightness_var")
         if value is None:
-            value = self._coordinator_value(self._refs.get("white_var"))
+            value = self._values.get("white_var")
         return _to_brightness(value, self._brightness_scale) if value is not None else None
 
     @property
     def hs_color(self):
-        hue = self._coordinator_value(self._refs.get("hs_hue_var"))
-        saturation = self._coordinator_value(self._refs.get("hs_saturation_var"))
+        hue = self._values.get("hs_hue_var")
+        saturation = self._values.get("hs_saturation_var")
         if hue is None or saturation is None:
             return None
         return (float(hue), float(saturation))
 
     @property
     def rgb_color(self):
-        red = self._coordinator_value(self._refs.get("rgb_red_var"))
-        green = self._coordinator_value(self._refs.get("rgb_green_var"))
-        blue = self._coordinator_value(self._refs.get("rgb_blue_var"))
+        red = self._values.get("rgb_red_var")
+        green = self._values.get("rgb_green_var")
+        blue = self._values.get("rgb_blue_var")
         if red is None or green is None or blue is None:
             return None
         return (
@@ -246,7 +273,7 @@ class SSCPComposedLight(LightEntity):
 
     @property
     def color_temp_kelvin(self) -> int | None:
-        value = self._coordinator_value(self._refs.get("color_temp_var"))
+        value = self._values.get("color_temp_var")
         if value in (None, 0):
             return None
         mireds = max(1, int(round(float(value))))
@@ -270,7 +297,7 @@ class SSCPComposedLight(LightEntity):
 
     @property
     def effect(self) -> str | None:
-        effect_value = self._coordinator_value(self._refs.get("effect_var"))
+        effect_value = self._values.get("effect_var")
         if effect_value is None or not self._effect_map:
             return None
         return self._effect_map.get(_value_key(effect_value))
@@ -290,55 +317,64 @@ class SSCPComposedLight(LightEntity):
         return ColorMode.ONOFF
 
     async def async_turn_on(self, **kwargs):
+        if self._brightness_writer is not None:
+            if "brightness" in kwargs and set(kwargs) <= {"brightness", "transition"}:
+                # Dimmer drags arrive as a stream of brightness-only calls; only the newest one matters.
+                self._brightness_writer.submit(kwargs["brightness"])
+                self.async_write_ha_state()
+                return
+            await self._brightness_writer.async_drain()
+        writes = self._write_transaction()
         try:
             if self._refs.get("power_var"):
-                await self._async_write_ref(self._refs.get("power_var"), True)
+                writes.add(self._refs.get("power_var"), True)
 
             if "brightness" in kwargs and self._refs.get("brightness_var"):
-                await self._async_write_ref(
+                writes.add(
                     self._refs.get("brightness_var"),
                     _from_brightness(kwargs["brightness"], self._brightness_scale),
                 )
 
             if "white" in kwargs and self._refs.get("white_var"):
-                await self._async_write_ref(
+                writes.add(
                     self._refs.get("white_var"),
                     _from_brightness(kwargs["white"], self._brightness_scale),
                 )
 
             if "hs_color" in kwargs and self._refs.get("hs_hue_var") and self._refs.get("hs_saturation_var"):
                 hue, saturation = kwargs["hs_color"]
-                await self._async_write_ref(self._refs.get("hs_hue_var"), hue)
-                await self._async_write_ref(self._refs.get("hs_saturation_var"), saturation)
+                writes.add(self._refs.get("hs_hue_var"), hue)
+                writes.add(self._refs.get("hs_saturation_var"), saturation)
 
             if "rgb_color" in kwargs and self._refs.get("rgb_red_var"):
                 red, green, blue = kwargs["rgb_color"]
-                await self._async_write_ref(self._refs.get("rgb_red_var"), red)
-                await self._async_write_ref(self._refs.get("rgb_green_var"), green)
-                await self._async_write_ref(self._refs.get("rgb_blue_var"), blue)
+                writes.add(self._refs.get("rgb_red_var"), red)
+                writes.add(self._refs.get("rgb_green_var"), green)
+                writes.add(self._refs.get("rgb_blue_var"), blue)
 
             color_temp_kelvin = kwargs.get("color_temp_kelvin")
             color_temp_mireds = kwargs.get("color_temp")
             if self._refs.get("color_temp_var") and (color_temp_kelvin or color_temp_mireds):
                 if color_temp_mireds is None and color_temp_kelvin:
                     color_temp_mireds = int(round(1000000 / max(1, float(color_temp_kelvin))))
-                await self._async_write_ref(self._refs.get("color_temp_var"), color_temp_mireds)
+                writes.add(self._refs.get("color_temp_var"), color_temp_mireds)
 
             if "effect" in kwargs and self._refs.get("effect_var") and self._effect_reverse_map:
                 raw_value = self._effect_reverse_map.get(str(kwargs["effect"]))
                 if raw_value is not None:
-                    await self._async_write_ref(self._refs.get("effect_var"), raw_value)
+                    writes.add(self._refs.get("effect_var"), raw_value)
 
-            await self.coordinator.async_request_refresh()
+            await writes.async_commit()
         except Exception as err:
             _LOGGER.error("Failed to turn on composed light %s: %s", self.name, err)
 
     async def async_turn_off(self, **kwargs):
+        if self._brightness_writer is not None:
+            await self._brightness_writer.async_drain()
         try:
             if self._refs.get("power_var"):
                 await self._async_write_ref(self._refs.get("power_var"), False)
             elif self._refs.get("brightness_var"):
                 await self._async_write_ref(self._refs.get("brightness_var"), 0)
-            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to turn off composed light %s: %s", self.name, err)
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
-from functools import partial
 import logging
 from typing import Any
 
 from homeassistant.components.lock import LockEntity, LockEntityFeature
 
 from .const import DOMAIN
-from .coordinator import SSCPDataCoordinator, variable_key
-from .entity import async_apply_entity_area, build_plc_device_info
+from .coordinator import SSCPDataCoordinator
+from .entity import SSCPRefValues, SSCPWriteTransaction, async_apply_entity_area, build_plc_device_info, ref_data_keys
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -83,6 +82,7 @@ class SSCPComposedLock(LockEntity):
             "unlock_var": config.get("unlock_var"),
             "open_var": config.get("open_var"),
         }
+        self._values = SSCPRefValues(coordinator, self._refs)
         self._state_map = {
             str(key): str(value).strip().lower()
             for key, value in (config.get("state_map") or {}).items()
@@ -103,33 +103,30 @@ class SSCPComposedLock(LockEntity):
     async def async_added_to_hass(self) -> None:
         if hasattr(self.coordinator, "async_add_listener"):
             self.async_on_remove(self.coordinator.async_add_listener(self.async_write_ha_state))
+            self.async_on_remove(
+                self.coordinator.async_add_key_listener(ref_data_keys(self._refs), self.async_write_ha_state)
+            )
         await async_apply_entity_area(self.hass, getattr(self, "entity_id", None), self._config.get("area_id"))
 
     @property
     def available(self) -> bool:
         return self.coordinator.last_update_success if self.coordinator else False
 
-    def _coordinator_value(self, ref: dict[str, Any] | None) -> Any:
-        if not isinstance(ref, dict):
-            return None
-        return self.coordinator.data.get(variable_key(ref))
-
-    async def _async_write_ref(self, ref: dict[str, Any] | None, raw_value: Any) -> None:
-        if not isinstance(ref, dict):
-            raise ValueError("Chybi datovy bod pro zapis.")
-        await self.hass.async_add_executor_job(
-            partial(
-                self._client.write_variable,
-                int(ref["uid"]),
-                _coerce_write_value(raw_value, str(ref["type"])),
-                offset=int(ref.get("offset", 0)),
-                length=int(ref.get("length", 1)),
-                type_data=str(ref["type"]),
-            )
+    async def _async_write_ref(self, ref: dict[str, Any] | None, raw_value: Any, *, force: bool = False) -> None:
+        writes = self._write_transaction()
+        writes.add(ref, raw_value, force=force)
+        await writes.async_commit()
+
+    def _write_transaction(self) -> SSCPWriteTransaction:
+        return SSCPWriteTransaction(
+            self.coordinator,
+            _coerce_write_value,
+            read_back=self._refs.values(),
+            force=bool(self._config.get("always_write")),
         )
 
     def _state_label(self) -> str | None:
-        value = self._coordinator_value(self._refs.get("state_var"))
+        value = self._values.get("state_var")
         if value is None:
             return None
         if isinstance(value, bool) and not self._state_map:
@@ -175,21 +172,18 @@ class SSCPComposedLock(LockEntity):
 
     async def async_lock(self, **kwargs) -> None:
         try:
-            await self._async_write_ref(self._refs.get("lock_var"), True)
-            await self.coordinator.async_request_refresh()
+            await self._async_write_ref(self._refs.get("lock_var"), True, force=True)
         except Exception as err:
             _LOGGER.error("Failed to lock %s: %s", self.name, err)
 
     async def async_unlock(self, **kwargs) -> None:
         try:
-            await self._async_write_ref(self._refs.get("unlock_var"), True)
-            await self.coordinator.async_request_refresh()
+            await self._async_write_ref(self._refs.get("unlock_var"), True, force=True)
         except Exception as err:
             _LOGGER.error("Failed to unlock %s: %s", self.name, err)
 
     async def async_open(self, **kwargs) -> None:
         try:
-            await self._async_write_ref(self._refs.get("open_var"), True)
-            await self.coordinator.async_request_refresh()
+            await self._async_write_ref(self._refs.get("open_var"), True, force=True)
         except Exception as err:
             _LOGGER.error("Failed to open lock %s: %s", self.name, err)
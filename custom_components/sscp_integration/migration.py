@@ -12,12 +12,34 @@ from .const import (
     COMM_MODE_SSCP,
     COMM_MODE_WEBPANEL,
     CONF_COMMUNICATION_MODE,
+    CONF_FAST_SCAN_INTERVAL_MS,
+    CONF_PIPELINE_DEPTH,
+    CONF_REDUNDANT_WRITE_MAX_AGE,
     CONF_SCAN_INTERVAL,
+    CONF_SESSION_COUNT,
+    CONF_SHARED_GATEWAY,
+    CONF_SLOW_SCAN_INTERVAL,
     CONF_WEBPANEL_CONNECTION,
     CONF_WEBPANEL_SCHEME,
+    CONF_WRITE_COALESCE_MS,
+    DEFAULT_FAST_SCAN_INTERVAL_MS,
+    DEFAULT_PIPELINE_DEPTH,
+    DEFAULT_REDUNDANT_WRITE_MAX_AGE,
     DEFAULT_SCAN_INTERVAL_SECONDS,
+    DEFAULT_SESSION_COUNT,
+    DEFAULT_SHARED_GATEWAY,
+    DEFAULT_SLOW_SCAN_INTERVAL_SECONDS,
+    DEFAULT_WRITE_COALESCE_MS,
+    MAX_FAST_SCAN_INTERVAL_MS,
+    MAX_PIPELINE_DEPTH,
+    MAX_REDUNDANT_WRITE_MAX_AGE,
+    MAX_SESSION_COUNT,
+    MAX_SLOW_SCAN_INTERVAL_SECONDS,
+    MAX_WRITE_COALESCE_MS,
+    MIN_FAST_SCAN_INTERVAL_MS,
+    SCAN_CLASS_NORMAL,
 )
-from .studio_models import build_variable_ref, detect_scheduler_blocks
+from .studio_models import build_variable_ref, detect_scheduler_blocks, normalize_scan_class
 from .transport import communication_mode_from_data
 from .vlist import (
     ALL_ENTITY_TYPES,
@@ -62,6 +84,48 @@ def _normalize_scan_interval(value: Any) -> int:
     return max(1, parsed)
 
 
+def _normalize_session_count(value: Any) -> int:
+    parsed = _optional_int(value)
+    if parsed is None:
+        return DEFAULT_SESSION_COUNT
+    return max(1, min(MAX_SESSION_COUNT, parsed))
+
+
+def _normalize_pipeline_depth(value: Any) -> int:
+    parsed = _optional_int(value)
+    if parsed is None:
+        return DEFAULT_PIPELINE_DEPTH
+    return max(1, min(MAX_PIPELINE_DEPTH, parsed))
+
+
+def _normalize_write_coalesce_ms(value: Any) -> int:
+    parsed = _optional_int(value)
+    if parsed is None:
+        return DEFAULT_WRITE_COALESCE_MS
+    return max(0, min(MAX_WRITE_COALESCE_MS, parsed))
+
+
+def _normalize_redundant_write_max_age(value: Any) -> int:
+    parsed = _optional_int(value)
+    if parsed is None:
+        return DEFAULT_REDUNDANT_WRITE_MAX_AGE
+    return max(0, min(MAX_REDUNDANT_WRITE_MAX_AGE, parsed))
+
+
+def _normalize_fast_scan_interval_ms(value: Any) -> int:
+    parsed = _optional_int(value)
+    if parsed is None:
+        return DEFAULT_FAST_SCAN_INTERVAL_MS
+    return max(MIN_FAST_SCAN_INTERVAL_MS, min(MAX_FAST_SCAN_INTERVAL_MS, parsed))
+
+
+def _normalize_slow_scan_interval(value: Any) -> int:
+    parsed = _optional_int(value)
+    if parsed is None:
+        return DEFAULT_SLOW_SCAN_INTERVAL_SECONDS
+    return max(1, min(MAX_SLOW_SCAN_INTERVAL_SECONDS, parsed))
+
+
 def _normalize_vlist_path(raw_value: Any) -> str:
     normalized = str(raw_value or "").strip()
     if not normalized:
@@ -314,6 +378,11 @@ def _normalize_variable(
         normalized["step"] = 1.0 if _optional_float(variable.get("step")) is None else float(variable["step"])
         mode = str(variable.get("mode") or "box").strip().lower()
         normalized["mode"] = mode if mode in {"box", "slider"} else "box"
+        write_interval_ms = _optional_int(variable.get("write_interval_ms"))
+        if write_interval_ms is not None and write_interval_ms > 0:
+            normalized["write_interval_ms"] = write_interval_ms
+        else:
+            normalized.pop("write_interval_ms", None)
         device_class = str(variable.get("device_class") or "").strip()
         if device_class:
             normalized["device_class"] = device_class
@@ -345,6 +414,17 @@ def _normalize_variable(
     else:
         normalized.pop("area_id", None)
 
+    if _as_bool(variable.get("always_write")):
+        normalized["always_write"] = True
+    else:
+        normalized.pop("always_write", None)
+
+    scan_class = normalize_scan_class(variable.get("scan_class"))
+    if scan_class != SCAN_CLASS_NORMAL:
+        normalized["scan_class"] = scan_class
+    else:
+        normalized.pop("scan_class", None)
+
     if entity_type == "select":
         normalized["select_options"] = _normalize_select_options(variable.get("select_options"))
 
@@ -424,6 +504,15 @@ def _normalize_composed_entity(
                 break
     normalized["name"] = entity_name or default_name
 
+    scan_class = normalize_scan_class(entity.get("scan_class"))
+    if scan_class != SCAN_CLASS_NORMAL:
+        normalized["scan_class"] = scan_class
+
+    if _as_bool(entity.get("always_write")):
+        normalized["always_write"] = True
+    else:
+        normalized.pop("always_write", None)
+
     return normalized
 
 
@@ -547,6 +636,7 @@ def _normalize_light_entity(
         {
             "suggested_display_precision": _normalize_precision(entity.get("suggested_display_precision")),
             "brightness_scale": _normalized_positive_float(entity.get("brightness_scale"), default=100.0),
+            "write_interval_ms": max(0, _optional_int(entity.get("write_interval_ms")) or 0),
             "min_mireds": min_mireds,
             "max_mireds": max_mireds,
             "power_var": _resolve_entity_variable_ref(entity, reference_catalog, "power_var", "power_name"),
@@ -1196,6 +1286,13 @@ async def async_migrate_entry_data(hass: HomeAssistant, data: dict[str, Any]) ->
             or "defaultConnection",
             CONF_WEBPANEL_SCHEME: webpanel_scheme,
             CONF_SCAN_INTERVAL: _normalize_scan_interval(data.get(CONF_SCAN_INTERVAL)),
+            CONF_SESSION_COUNT: _normalize_session_count(data.get(CONF_SESSION_COUNT)),
+            CONF_PIPELINE_DEPTH: _normalize_pipeline_depth(data.get(CONF_PIPELINE_DEPTH)),
+            CONF_WRITE_COALESCE_MS: _normalize_write_coalesce_ms(data.get(CONF_WRITE_COALESCE_MS)),
+            CONF_REDUNDANT_WRITE_MAX_AGE: _normalize_redundant_write_max_age(data.get(CONF_REDUNDANT_WRITE_MAX_AGE)),
+            CONF_FAST_SCAN_INTERVAL_MS: _normalize_fast_scan_interval_ms(data.get(CONF_FAST_SCAN_INTERVAL_MS)),
+            CONF_SLOW_SCAN_INTERVAL: _normalize_slow_scan_interval(data.get(CONF_SLOW_SCAN_INTERVAL)),
+            CONF_SHARED_GATEWAY: _as_bool(data.get(CONF_SHARED_GATEWAY, DEFAULT_SHARED_GATEWAY)),
         }
     )
 
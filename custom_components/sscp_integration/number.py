@@ -12,6 +12,7 @@ except ImportError:  # pragma: no cover - fallback for older HA builds
 from .const import DOMAIN
 from .entity import SSCPBaseEntity
 from .vlist import normalize_unit_of_measurement
+from .write_coalescer import SSCPWriteBehind
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -58,6 +59,12 @@ class SSCPNumber(SSCPBaseEntity, NumberEntity):
         self._max_value = config.get("max_value", float("65535"))
         self._step = config.get("step", 1)
         self._mode = config.get("mode", "box")
+        write_interval_ms = int(config.get("write_interval_ms") or 0)
+        self._write_behind = (
+            SSCPWriteBehind(write_interval_ms, self._async_write_latest, self._async_write_settled)
+            if write_interval_ms > 0
+            else None
+        )
 
     @property
     def native_min_value(self):
@@ -73,6 +80,8 @@ class SSCPNumber(SSCPBaseEntity, NumberEntity):
 
     @property
     def native_value(self):
+        if self._write_behind is not None and self._write_behind.pending:
+            return self._write_behind.value
         return self.current_value
 
     @property
@@ -80,7 +89,19 @@ class SSCPNumber(SSCPBaseEntity, NumberEntity):
         return NumberMode.SLIDER if self._mode == "slider" else NumberMode.BOX
 
     async def async_set_native_value(self, value):
+        if self._write_behind is not None:
+            self._write_behind.submit(value)
+            self.async_write_ha_state()
+            return
         try:
             await self.async_write_sscp_value(value)
         except Exception as err:
             _LOGGER.error("Failed to set value %s for number %s: %s", value, self.name, err)
+
+    async def _async_write_latest(self, value) -> None:
+        await self.coordinator.async_write_variables([self._write_request(value)], force=self._always_write)
+
+    async def _async_write_settled(self, error: BaseException | None) -> None:
+        if error is not None:
+            _LOGGER.error("Failed to set value %s for number %s: %s", self._write_behind.value, self.name, error)
+        self.async_write_ha_state()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections import Counter
 from datetime import UTC, datetime, timedelta
+from fnmatch import fnmatchcase
 from functools import partial
 import logging
 from pathlib import Path
@@ -15,13 +16,37 @@ from homeassistant.helpers.dispatcher import async_dispatcher_send
 from .const import (
     COMM_MODE_WEBPANEL,
     CONF_COMMUNICATION_MODE,
+    CONF_FAST_SCAN_INTERVAL_MS,
+    CONF_PIPELINE_DEPTH,
+    CONF_REDUNDANT_WRITE_MAX_AGE,
+    CONF_SESSION_COUNT,
+    CONF_SHARED_GATEWAY,
+    CONF_SLOW_SCAN_INTERVAL,
     CONF_WEBPANEL_CONNECTION,
     CONF_WEBPANEL_SCHEME,
+    CONF_WRITE_COALESCE_MS,
+    DEFAULT_FAST_SCAN_INTERVAL_MS,
+    DEFAULT_PIPELINE_DEPTH,
+    DEFAULT_REDUNDANT_WRITE_MAX_AGE,
+    DEFAULT_SESSION_COUNT,
+    DEFAULT_SHARED_GATEWAY,
+    DEFAULT_SLOW_SCAN_INTERVAL_SECONDS,
+    DEFAULT_WRITE_COALESCE_MS,
     DOMAIN,
+    MAX_FAST_SCAN_INTERVAL_MS,
+    MAX_PIPELINE_DEPTH,
+    MAX_REDUNDANT_WRITE_MAX_AGE,
+    MAX_SESSION_COUNT,
+    MAX_SLOW_SCAN_INTERVAL_SECONDS,
+    MAX_WRITE_COALESCE_MS,
+    MIN_FAST_SCAN_INTERVAL_MS,
+    SCAN_CLASS_NORMAL,
+    SCAN_CLASSES,
     SIGNAL_RUNTIME_STATE_UPDATED,
     SUPPORTED_COMMUNICATION_MODES,
 )
-from .coordinator import variable_key
+from .coordinator import COMPOSED_SECTIONS, same_plc_value, variable_key
+from .sscp_client import TYPE_LENGTHS
 from .studio_models import (
     build_variable_ref,
     climate_entity_payload,
@@ -34,6 +59,7 @@ from .studio_models import (
     light_entity_payload,
     lock_entity_payload,
     minutes_to_day_time,
+    normalize_scan_class,
     scheduler_entity_payload,
     scheduler_catalog_payload,
     schedule_value_from_ui,
@@ -42,7 +68,7 @@ from .studio_models import (
     vacuum_entity_payload,
     water_heater_entity_payload,
 )
-from .transport import PLCClientProtocol, communication_mode_from_data, has_connection_settings
+from .transport import PLCClientProtocol, async_call_client, communication_mode_from_data, has_connection_settings
 from .vlist import (
     ALL_ENTITY_TYPES,
     PLC_TYPE_TO_ENTITIES,
@@ -205,6 +231,68 @@ def _coerce_plc_write_value(raw_value: Any, plc_type: str) -> Any:
     return raw_value
 
 
+def _scheduler_requests(block: dict[str, Any], *, include_exceptions: bool = True) -> list[dict[str, Any]]:
+    requests: list[dict[str, Any]] = [{**block["defaultvalue"], "key": "defaultvalue"}]
+    for index, point in sorted(block["points"].items()):
+        requests.append({**point["starttime"], "key": f"point:{index}:starttime"})
+        requests.append({**point["state"], "key": f"point:{index}:value"})
+    if not include_exceptions:
+        return requests
+    for index, exception in sorted(block["exceptions"].items()):
+        start_ref = exception.get("starttime")
+        end_ref = exception.get("endtime")
+        state_ref = exception.get("state")
+        if start_ref and end_ref and state_ref:
+            requests.append({**start_ref, "key": f"exception:{index}:starttime"})
+            requests.append({**end_ref, "key": f"exception:{index}:endtime"})
+            requests.append({**state_ref, "key": f"exception:{index}:value"})
+    return requests
+
+
+def _scheduler_program_writes(
+    block: dict[str, Any],
+    default_value: Any,
+    compacted: list[dict[str, Any]],
+    current: dict[str, Any],
+) -> list[dict[str, Any]]:
+    """Return the writes that turn the block's current values into the given weekly program.
+
+    Slots that already hold their target are left alone, and so is the state of a
+    slot that stays unused, since the PLC ignores it behind a 65535 start time.
+    """
+    writes: list[dict[str, Any]] = []
+
+    def write(ref: dict[str, Any], key: str, value: Any) -> None:
+        plc_type = str(ref["type"])
+        if key in current and same_plc_value(value, current[key], plc_type):
+            return
+        writes.append(
+            {
+                "uid": int(ref["uid"]),
+                "offset": int(ref.get("offset", 0)),
+                "length": int(ref.get("length", 1)),
+                "type": plc_type,
+                "value": value,
+            }
+        )
+
+    write(block["defaultvalue"], "defaultvalue", _coerce_plc_write_value(default_value, str(block["defaultvalue"]["type"])))
+    for position, index in enumerate(sorted(block["points"])):
+        point = block["points"][index]
+        starttime_key = f"point:{index}:starttime"
+        if position < len(compacted):
+            item = compacted[position]
+            write(point["starttime"], starttime_key, int(item["starttime"]))
+            value = item["value"]
+        else:
+            write(point["starttime"], starttime_key, 65535)
+            if current.get(starttime_key) == 65535:
+                continue
+            value = default_value
+        write(point["state"], f"point:{index}:value", _coerce_plc_write_value(value, str(point["state"]["type"])))
+    return writes
+
+
 class SSCPRuntime:
     """Entry-scoped runtime state for diagnostics and panel operations."""
 
@@ -309,7 +397,7 @@ class SSCPRuntime:
             return
         self.vlist_data = await self.hass.async_add_executor_job(load_vlist_map, path)
 
-    def _refresh_sync(self) -> dict[str, Any]:
+    async def _async_refresh_state(self) -> dict[str, Any]:
         if self.client is None:
             raise ValueError("SSCP client is not configured.")
         state: dict[str, Any] = {
@@ -320,32 +408,36 @@ class SSCPRuntime:
         }
 
         try:
-            state["basic_info"] = self.client.get_basic_info(requested_size=0)
+            state["basic_info"] = await async_call_client(self.hass, self.client, "get_basic_info", requested_size=0)
         except Exception as err:
             state["basic_info_error"] = str(err)
 
         try:
-            state["plc_statistics"] = self.client.get_plc_statistics()
+            state["plc_statistics"] = await async_call_client(self.hass, self.client, "get_plc_statistics")
         except Exception as err:
             state["plc_statistics_error"] = str(err)
 
         try:
-            state["time"]["utc"] = self.client.get_time("utc")
+            state["time"]["utc"] = await async_call_client(self.hass, self.client, "get_time", "utc")
         except Exception as err:
             state["time"]["utc_error"] = str(err)
 
         try:
-            state["time"]["local"] = self.client.get_time("local")
+            state["time"]["local"] = await async_call_client(self.hass, self.client, "get_time", "local")
         except Exception as err:
             state["time"]["local_error"] = str(err)
 
         try:
-            state["time"]["timezone_offset"] = self.client.get_time_offset("timezone")
+            state["time"]["timezone_offset"] = await async_call_client(
+                self.hass, self.client, "get_time_offset", "timezone"
+            )
         except Exception as err:
             state["time"]["timezone_offset_error"] = str(err)
 
         try:
-            state["time"]["daylight_offset"] = self.client.get_time_offset("daylight")
+            state["time"]["daylight_offset"] = await async_call_client(
+                self.hass, self.client, "get_time_offset", "daylight"
+            )
         except Exception as err:
             state["time"]["daylight_offset_error"] = str(err)
 
@@ -359,7 +451,7 @@ class SSCPRuntime:
             async_dispatcher_send(self.hass, SIGNAL_RUNTIME_STATE_UPDATED, payload)
             return payload
         try:
-            self.protocol_state = await self.hass.async_add_executor_job(self._refresh_sync)
+            self.protocol_state = await self._async_refresh_state()
             self.last_error = None
         except Exception as err:
             self.last_error = str(err)
@@ -391,6 +483,9 @@ class SSCPRuntime:
             "step": variable.get("step"),
             "mode": variable.get("mode"),
             "press_time": variable.get("press_time"),
+            "write_interval_ms": variable.get("write_interval_ms"),
+            "always_write": bool(variable.get("always_write")),
+            "scan_class": normalize_scan_class(variable.get("scan_class")),
             "allowed_entity_types": allowed,
             "quick_entity_types": allowed,
             "default_entity_type": guess_default_entity_type(
@@ -520,6 +615,16 @@ class SSCPRuntime:
             "username": self.entry.data.get("username"),
             "password": self.entry.data.get("password"),
             "scan_interval": self.entry.data.get("scan_interval", 5),
+            "session_count": self.entry.data.get(CONF_SESSION_COUNT, DEFAULT_SESSION_COUNT),
+            "pipeline_depth": self.entry.data.get(CONF_PIPELINE_DEPTH, DEFAULT_PIPELINE_DEPTH),
+            "write_coalesce_ms": self.entry.data.get(CONF_WRITE_COALESCE_MS, DEFAULT_WRITE_COALESCE_MS),
+            "redundant_write_max_age": self.entry.data.get(
+                CONF_REDUNDANT_WRITE_MAX_AGE,
+                DEFAULT_REDUNDANT_WRITE_MAX_AGE,
+            ),
+            "fast_scan_interval_ms": self.entry.data.get(CONF_FAST_SCAN_INTERVAL_MS, DEFAULT_FAST_SCAN_INTERVAL_MS),
+            "slow_scan_interval": self.entry.data.get(CONF_SLOW_SCAN_INTERVAL, DEFAULT_SLOW_SCAN_INTERVAL_SECONDS),
+            "shared_gateway": self.entry.data.get(CONF_SHARED_GATEWAY, DEFAULT_SHARED_GATEWAY),
             "configuration_mode": self.entry.data.get("configuration_mode", "vlist"),
             "connection_ready": self.has_connection_settings,
             "connected": self.is_connected,
@@ -629,6 +734,8 @@ class SSCPRuntime:
         step: float | None = None,
         mode: str = "box",
         press_time: float | None = None,
+        write_interval_ms: int | None = None,
+        always_write: bool = False,
     ) -> dict[str, Any]:
         await self.async_ensure_vlist_data()
         if variable_name not in self.vlist_data:
@@ -654,6 +761,8 @@ class SSCPRuntime:
             raise ValueError("Number mode musi byt box nebo slider.")
         if chosen_entity_type == "number" and step is not None and step <= 0:
             raise ValueError("Krok number entity musi byt vetsi nez 0.")
+        if chosen_entity_type == "number" and write_interval_ms is not None and write_interval_ms < 0:
+            raise ValueError("Interval zapisu number entity nesmi byt zaporny.")
         if chosen_entity_type == "button" and press_time is not None and press_time <= 0:
             raise ValueError("Button press time musi byt vetsi nez 0.")
         if suggested_display_precision is not None and suggested_display_precision < 0:
@@ -673,6 +782,8 @@ class SSCPRuntime:
             mode=normalized_mode,
             press_time=press_time,
             select_options=normalized_select_options,
+            write_interval_ms=write_interval_ms,
+            always_write=always_write,
         )
         await self._update_variables([*current_variables, new_variable])
         return {"status": "reload_requested"}
@@ -693,6 +804,8 @@ class SSCPRuntime:
         step: float | None = None,
         mode: str = "box",
         press_time: float | None = None,
+        write_interval_ms: int | None = None,
+        always_write: bool | None = None,
     ) -> dict[str, Any]:
         updated_variables = list(self.configured_variables)
         target = next((item for item in updated_variables if variable_key(item) == variable_entry_key), None)
@@ -707,6 +820,8 @@ class SSCPRuntime:
             raise ValueError("Number mode musi byt box nebo slider.")
         if entity_type == "number" and step is not None and step <= 0:
             raise ValueError("Krok number entity musi byt vetsi nez 0.")
+        if entity_type == "number" and write_interval_ms is not None and write_interval_ms < 0:
+            raise ValueError("Interval zapisu number entity nesmi byt zaporny.")
         if entity_type == "button" and press_time is not None and press_time <= 0:
             raise ValueError("Button press time musi byt vetsi nez 0.")
         if suggested_display_precision is not None and suggested_display_precision < 0:
@@ -741,11 +856,19 @@ class SSCPRuntime:
             target["area_id"] = str(area_id).strip()
         else:
             target.pop("area_id", None)
+        if always_write:
+            target["always_write"] = True
+        elif always_write is not None:
+            target.pop("always_write", None)
         if entity_type == "number":
             target["min_value"] = 0.0 if min_value is None else min_value
             target["max_value"] = 100.0 if max_value is None else max_value
             target["step"] = 1.0 if step is None else step
             target["mode"] = normalized_mode
+            if write_interval_ms:
+                target["write_interval_ms"] = int(write_interval_ms)
+            else:
+                target.pop("write_interval_ms", None)
         if entity_type == "button":
             target["press_time"] = 0.1 if press_time is None else float(press_time)
         if entity_type == "select":
@@ -781,6 +904,11 @@ class SSCPRuntime:
         if existing_index is None:
             updated.append(entity)
         else:
+            # The composer popups edit neither the scan class nor always_write; keep those set from the entity list.
+            for option in ("scan_class", "always_write"):
+                value = items[existing_index].get(option)
+                if value and option not in entity:
+                    entity = {**entity, option: value}
             updated[existing_index] = entity
         return updated
 
@@ -899,6 +1027,7 @@ class SSCPRuntime:
         white_name: str = "",
         effect_name: str = "",
         effect_map: dict[str, str] | None = None,
+        write_interval_ms: int | None = None,
     ) -> dict[str, Any]:
         await self.async_ensure_vlist_data()
         entity_name = str(name or "").strip()
@@ -910,6 +1039,8 @@ class SSCPRuntime:
         normalized_brightness_scale = 100.0 if brightness_scale is None else float(brightness_scale)
         if normalized_brightness_scale <= 0:
             raise ValueError("Brightness scale musi byt vetsi nez 0.")
+        if write_interval_ms is not None and write_interval_ms < 0:
+            raise ValueError("Interval zapisu jasu nesmi byt zaporny.")
 
         normalized_min_mireds = None if min_mireds in (None, "") else int(min_mireds)
         normalized_max_mireds = None if max_mireds in (None, "") else int(max_mireds)
@@ -957,6 +1088,7 @@ class SSCPRuntime:
             "white_var": self._resolve_vlist_variable_ref(white_name),
             "effect_var": effect_var,
             "effect_map": normalized_effect_map,
+            "write_interval_ms": int(write_interval_ms or 0),
         }
         if not any(
             light_entry.get(key)
@@ -1510,6 +1642,8 @@ class SSCPRuntime:
         mode: str = "box",
         press_time: float | None = None,
         select_options: dict[str, str] | None = None,
+        write_interval_ms: int | None = None,
+        always_write: bool = False,
     ) -> dict[str, Any]:
         normalized_name = variable_name.strip()
         if not normalized_name:
@@ -1535,6 +1669,8 @@ class SSCPRuntime:
             raise ValueError("Number mode musi byt box nebo slider.")
         if normalized_entity_type == "number" and step is not None and step <= 0:
             raise ValueError("Krok number entity musi byt vetsi nez 0.")
+        if normalized_entity_type == "number" and write_interval_ms is not None and write_interval_ms < 0:
+            raise ValueError("Interval zapisu number entity nesmi byt zaporny.")
         if suggested_display_precision is not None and suggested_display_precision < 0:
             raise ValueError("Presnost zobrazeni musi byt 0 nebo vetsi.")
 
@@ -1572,6 +1708,8 @@ class SSCPRuntime:
             mode=normalized_mode,
             press_time=press_time,
             select_options=normalized_select_options,
+            write_interval_ms=write_interval_ms,
+            always_write=always_write,
         )
         await self._update_variables([*current_variables, new_variable])
         return {"status": "reload_requested"}
@@ -1591,6 +1729,13 @@ class SSCPRuntime:
         scan_interval: int,
         vlist_file_name: str,
         configuration_mode: str = "vlist",
+        session_count: int = DEFAULT_SESSION_COUNT,
+        pipeline_depth: int = DEFAULT_PIPELINE_DEPTH,
+        write_coalesce_ms: int = DEFAULT_WRITE_COALESCE_MS,
+        redundant_write_max_age: int = DEFAULT_REDUNDANT_WRITE_MAX_AGE,
+        fast_scan_interval_ms: int = DEFAULT_FAST_SCAN_INTERVAL_MS,
+        slow_scan_interval: int = DEFAULT_SLOW_SCAN_INTERVAL_SECONDS,
+        shared_gateway: bool = DEFAULT_SHARED_GATEWAY,
     ) -> dict[str, Any]:
         vlist_path = ""
         if vlist_file_name:
@@ -1611,6 +1756,16 @@ class SSCPRuntime:
             CONF_WEBPANEL_CONNECTION: webpanel_connection.strip() or "defaultConnection",
             CONF_WEBPANEL_SCHEME: str(webpanel_scheme or "http").strip().lower() or "http",
             "scan_interval": max(1, int(scan_interval)),
+            CONF_SESSION_COUNT: max(1, min(MAX_SESSION_COUNT, int(session_count))),
+            CONF_PIPELINE_DEPTH: max(1, min(MAX_PIPELINE_DEPTH, int(pipeline_depth))),
+            CONF_WRITE_COALESCE_MS: max(0, min(MAX_WRITE_COALESCE_MS, int(write_coalesce_ms))),
+            CONF_REDUNDANT_WRITE_MAX_AGE: max(0, min(MAX_REDUNDANT_WRITE_MAX_AGE, int(redundant_write_max_age))),
+            CONF_FAST_SCAN_INTERVAL_MS: max(
+                MIN_FAST_SCAN_INTERVAL_MS,
+                min(MAX_FAST_SCAN_INTERVAL_MS, int(fast_scan_interval_ms)),
+            ),
+            CONF_SLOW_SCAN_INTERVAL: max(1, min(MAX_SLOW_SCAN_INTERVAL_SECONDS, int(slow_scan_interval))),
+            CONF_SHARED_GATEWAY: bool(shared_gateway),
             "configuration_mode": configuration_mode or "vlist",
             "vlist_file": vlist_path,
         }
@@ -1655,6 +1810,56 @@ class SSCPRuntime:
         await self._update_variables(updated)
         return {"status": "reload_requested"}
 
+    async def async_set_scan_class(self, *, section: str, key: str, scan_class: str) -> dict[str, Any]:
+        """Assign a configured variable or composed entity to a scan class."""
+        normalized_class = str(scan_class or "").strip().lower()
+        if normalized_class not in SCAN_CLASSES:
+            raise ValueError(f"Neznama trida cteni {scan_class}.")
+        if section == "variables":
+            items = list(self.configured_variables)
+            index = next((index for index, item in enumerate(items) if variable_key(item) == key), None)
+        elif section in COMPOSED_SECTIONS:
+            items = list(self.entry.data.get(section, []))
+            index = next((index for index, item in enumerate(items) if str(item.get("entity_key")) == str(key)), None)
+        else:
+            raise ValueError(f"Sekce {section} nema tridu cteni.")
+        if index is None:
+            raise ValueError("Entita pro zmenu tridy cteni nebyla nalezena.")
+
+        target = dict(items[index])
+        if normalize_scan_class(target.get("scan_class")) == normalized_class:
+            return {"status": "ok"}
+        if normalized_class == SCAN_CLASS_NORMAL:
+            target.pop("scan_class", None)
+        else:
+            target["scan_class"] = normalized_class
+        items[index] = target
+        if section == "variables":
+            await self._update_variables(items)
+        else:
+            await self._update_entry_section(section, items)
+        return {"status": "reload_requested"}
+
+    async def async_set_always_write(self, *, section: str, key: str, always_write: bool) -> dict[str, Any]:
+        """Let a composed entity send its writes even when the PLC already holds the values."""
+        if section not in COMPOSED_SECTIONS or section == "scheduler_entities":
+            raise ValueError(f"Sekce {section} nema volbu vzdy zapisovat.")
+        items = list(self.entry.data.get(section, []))
+        index = next((index for index, item in enumerate(items) if str(item.get("entity_key")) == str(key)), None)
+        if index is None:
+            raise ValueError("Entita pro zmenu zapisu nebyla nalezena.")
+
+        target = dict(items[index])
+        if bool(target.get("always_write")) == always_write:
+            return {"status": "ok"}
+        if always_write:
+            target["always_write"] = True
+        else:
+            target.pop("always_write", None)
+        items[index] = target
+        await self._update_entry_section(section, items)
+        return {"status": "reload_requested"}
+
     async def async_reload_from_vlist(self) -> dict[str, Any]:
         # Always refresh from the currently selected file instead of reusing a stale cache.
         self.vlist_data = {}
@@ -1892,7 +2097,7 @@ class SSCPRuntime:
             raise ValueError("Připojení ještě není nakonfigurované.")
         if self.communication_mode == COMM_MODE_WEBPANEL:
             raise ValueError("Synchronizace PLC času je dostupná jen v SSCP režimu.")
-        await self.hass.async_add_executor_job(partial(self.client.sync_time, mode=mode))
+        await async_call_client(self.hass, self.client, "sync_time", mode=mode)
         payload = await self.async_refresh_protocol_state()
         return {"status": "ok", "payload": payload}
 
@@ -1903,9 +2108,9 @@ class SSCPRuntime:
             raise ValueError("Nastavení PLC času je dostupné jen v SSCP režimu.")
         normalized_mode = "local" if str(mode or "local").strip().lower() == "local" else "utc"
         target_value = _parse_ui_datetime(value, normalized_mode)
-        if not hasattr(self.client, "set_time"):
+        if not hasattr(self.client, "set_time") and not hasattr(self.client, "async_set_time"):
             raise ValueError("Aktualni backend neumí nastavení PLC času.")
-        await self.hass.async_add_executor_job(partial(self.client.set_time, target_value, mode=normalized_mode))
+        await async_call_client(self.hass, self.client, "set_time", target_value, mode=normalized_mode)
         await self._async_refresh_entry_coordinators()
         payload = await self.async_refresh_protocol_state()
         return {"status": "ok", "payload": payload}
@@ -1918,20 +2123,7 @@ class SSCPRuntime:
         if block is None:
             raise ValueError("Vybrany tydenni program nebyl ve vlistu nalezen.")
 
-        requests: list[dict[str, Any]] = [{**block["defaultvalue"], "key": "defaultvalue"}]
-        for index, point in sorted(block["points"].items()):
-            requests.append({**point["starttime"], "key": f"point:{index}:starttime"})
-            requests.append({**point["state"], "key": f"point:{index}:value"})
-        for index, exception in sorted(block["exceptions"].items()):
-            start_ref = exception.get("starttime")
-            end_ref = exception.get("endtime")
-            state_ref = exception.get("state")
-            if start_ref and end_ref and state_ref:
-                requests.append({**start_ref, "key": f"exception:{index}:starttime"})
-                requests.append({**end_ref, "key": f"exception:{index}:endtime"})
-                requests.append({**state_ref, "key": f"exception:{index}:value"})
-
-        values = await self.hass.async_add_executor_job(self.client.read_variables, requests)
+        values = await async_call_client(self.hass, self.client, "read_variables", _scheduler_requests(block))
 
         weekly_items: list[dict[str, Any]] = []
         for index in sorted(block["points"]):
@@ -1998,71 +2190,219 @@ class SSCPRuntime:
             raise ValueError(f"Tydenni program podporuje maximalne {point_capacity} zlomu.")
 
         normalized_default = schedule_value_from_ui(default_value, block["kind"])
-        ordered_points = [block["points"][index] for index in sorted(block["points"])]
-
-        await self.hass.async_add_executor_job(
-            partial(
-                self.client.write_variable,
-                int(block["defaultvalue"]["uid"]),
-                _coerce_plc_write_value(normalized_default, str(block["defaultvalue"]["type"])),
-                offset=int(block["defaultvalue"].get("offset", 0)),
-                length=int(block["defaultvalue"].get("length", 1)),
-                type_data=str(block["defaultvalue"]["type"]),
-            )
+        # One read of the block lets the save send only the slots that actually change.
+        current = await async_call_client(
+            self.hass,
+            self.client,
+            "read_variables",
+            _scheduler_requests(block, include_exceptions=False),
         )
-
-        for point, item in zip(ordered_points, compacted, strict=False):
-            await self.hass.async_add_executor_job(
-                partial(
-                    self.client.write_variable,
-                    int(point["starttime"]["uid"]),
-                    int(item["starttime"]),
-                    offset=int(point["starttime"].get("offset", 0)),
-                    length=int(point["starttime"].get("length", 1)),
-                    type_data=str(point["starttime"]["type"]),
-                )
-            )
-            await self.hass.async_add_executor_job(
-                partial(
-                    self.client.write_variable,
-                    int(point["state"]["uid"]),
-                    _coerce_plc_write_value(item["value"], str(point["state"]["type"])),
-                    offset=int(point["state"].get("offset", 0)),
-                    length=int(point["state"].get("length", 1)),
-                    type_data=str(point["state"]["type"]),
-                )
-            )
-
-        for point in ordered_points[len(compacted) :]:
-            await self.hass.async_add_executor_job(
-                partial(
-                    self.client.write_variable,
-                    int(point["starttime"]["uid"]),
-                    65535,
-                    offset=int(point["starttime"].get("offset", 0)),
-                    length=int(point["starttime"].get("length", 1)),
-                    type_data=str(point["starttime"]["type"]),
-                )
-            )
-            await self.hass.async_add_executor_job(
-                partial(
-                    self.client.write_variable,
-                    int(point["state"]["uid"]),
-                    _coerce_plc_write_value(normalized_default, str(point["state"]["type"])),
-                    offset=int(point["state"].get("offset", 0)),
-                    length=int(point["state"].get("length", 1)),
-                    type_data=str(point["state"]["type"]),
-                )
-            )
+        writes = _scheduler_program_writes(block, normalized_default, compacted, current)
+        if writes:
+            await async_call_client(self.hass, self.client, "write_variables", writes)
 
         await self._async_refresh_entry_coordinators()
         return {
             "status": "ok",
             "root_name": root_name,
             "saved_points": len(compacted),
+            "written_values": len(writes),
             "ignored_exceptions": len(block["exceptions"]),
         }
 
+    async def async_apply_scheduler(
+        self,
+        *,
+        source_root_name: str,
+        targets: list[str] | str,
+    ) -> dict[str, Any]:
+        """Copy one weekly program to every block matching targets, names or glob patterns.
+
+        All targets are read in one call and their changed slots go out in one batched
+        write; a failed read or write batch is retried target by target so each gets its own result.
+        """
+        source = await self.async_get_scheduler(root_name=source_root_name)
+        if source["default_value"] is None:
+            raise ValueError("Vychozi hodnotu zdrojoveho tydenniho programu se nepodarilo precist.")
+        patterns = [str(item).strip() for item in ([targets] if isinstance(targets, str) else targets or [])]
+        patterns = [pattern for pattern in patterns if pattern]
+        if not patterns:
+            raise ValueError("Nebyly zadany cilove tydenni programy.")
+
+        blocks = self._scheduler_blocks()
+        target_names = sorted(
+            name
+            for name in blocks
+            if name != source_root_name and any(fnmatchcase(name, pattern) for pattern in patterns)
+        )
+        if not target_names:
+            raise ValueError("Zadanym cilum neodpovida zadny tydenni program ve vlistu.")
+
+        kind = source["kind"]
+        compacted = compact_weekly_items(source["weekly_items"], kind)
+        default_value = schedule_value_from_ui(source["default_value"], kind)
+        results: dict[str, dict[str, Any]] = {}
+        planned: list[tuple[str, dict[str, Any]]] = []
+        for name in target_names:
+            block = blocks[name]
+            point_capacity = len(block["points"])
+            if block["kind"] != kind:
+                results[name] = {"status": "error", "message": f"Tydenni program je typu {block['kind']}, zdroj je {kind}."}
+            elif len(compacted) > point_capacity:
+                results[name] = {
+                    "status": "error",
+                    "message": f"Tydenni program podporuje maximalne {point_capacity} zlomu.",
+                }
+            else:
+                planned.append((name, block))
+
+        requests = [
+            {**request, "key": f"{position}/{request['key']}"}
+            for position, (_name, block) in enumerate(planned)
+            for request in _scheduler_requests(block, include_exceptions=False)
+        ]
+        current_by_name: dict[str, dict[str, Any]] = {}
+        try:
+            values = await async_call_client(self.hass, self.client, "read_variables", requests) if requests else {}
+        except Exception as err:  # noqa: BLE001 - retried per target below
+            _LOGGER.debug("Batched weekly program read failed (%s); reading target by target", err)
+            for name, block in planned:
+                try:
+                    current_by_name[name] = await async_call_client(
+                        self.hass,
+                        self.client,
+                        "read_variables",
+                        _scheduler_requests(block, include_exceptions=False),
+                    )
+                except Exception as target_err:  # noqa: BLE001 - reported in the target result
+                    results[name] = {
+                        "status": "error",
+                        "message": f"Cteni tydenniho programu selhalo: {str(target_err) or type(target_err).__name__}",
+                    }
+        else:
+            for position, (name, _block) in enumerate(planned):
+                prefix = f"{position}/"
+                current_by_name[name] = {
+                    key.removeprefix(prefix): value for key, value in values.items() if key.startswith(prefix)
+                }
+        batches: list[tuple[str, list[dict[str, Any]]]] = [
+            (name, _scheduler_program_writes(block, default_value, compacted, current_by_name[name]))
+            for name, block in planned
+            if name in current_by_name
+        ]
+
+        writes = [write for _name, target_writes in batches for write in target_writes]
+        try:
+            if writes:
+                await async_call_client(self.hass, self.client, "write_variables", writes)
+        except Exception as err:  # noqa: BLE001 - retried per target below
+            _LOGGER.debug("Batched weekly program apply failed (%s); retrying target by target", err)
+            for name, target_writes in batches:
+                try:
+                    if target_writes:
+                        await async_call_client(self.hass, self.client, "write_variables", target_writes)
+                except Exception as target_err:  # noqa: BLE001 - reported in the target result
+                    results[name] = {"status": "error", "message": str(target_err) or type(target_err).__name__}
+                else:
+                    results[name] = {"status": "ok", "written_values": len(target_writes)}
+        else:
+            for name, target_writes in batches:
+                results[name] = {"status": "ok", "written_values": len(target_writes)}
+
+        await self._async_refresh_entry_coordinators()
+        applied = sum(1 for result in results.values() if result["status"] == "ok")
+        return {
+            "status": "ok" if applied == len(results) else "partial" if applied else "error",
+            "root_name": source_root_name,
+            "saved_points": len(compacted),
+            "targets": {name: results[name] for name in target_names},
+        }
+
+    def _resolve_plc_ref(self, item: Any) -> tuple[str, dict[str, Any]]:
+        """Turn a vlist name or a uid/offset/length/type mapping into a keyed data point ref."""
+        if isinstance(item, str):
+            item = {"name": item}
+        if not isinstance(item, dict):
+            raise ValueError("Datovy bod musi byt nazev z vlistu nebo uid/offset/length/type.")
+        name = str(item.get("name") or "").strip()
+        if name:
+            variable = self.vlist_data.get(name)
+            if variable is None:
+                raise ValueError(f"Promenna {name} nebyla ve vlistu nalezena.")
+            return name, build_variable_ref(variable)
+        if item.get("uid") in (None, "") or not item.get("type"):
+            raise ValueError("Datovy bod bez nazvu musi mit uid a type.")
+        plc_type = str(item["type"]).strip().upper()
+        if plc_type not in SUPPORTED_PLC_TYPES:
+            raise ValueError(f"Nepodporovaný PLC typ {item['type']}.")
+        ref = {
+            "uid": int(item["uid"]),
+            "offset": int(item.get("offset") or 0),
+            "length": int(item.get("length") or TYPE_LENGTHS.get(plc_type, 1)),
+            "type": plc_type,
+        }
+        return f"{ref['uid']}:{ref['offset']}:{ref['length']}", ref
+
+    async def async_read_plc_variables(self, *, variables: list[Any]) -> dict[str, Any]:
+        """Read many data points in one batched client call, keyed by the name or uid:offset:length given."""
+        if self.client is None:
+            raise ValueError("Připojení ještě není nakonfigurované.")
+        await self.async_ensure_vlist_data()
+        requests: dict[str, dict[str, Any]] = {}
+        for item in variables:
+            key, ref = self._resolve_plc_ref(item)
+            requests[key] = {**ref, "key": key}
+        if not requests:
+            raise ValueError("Nebyly zadany zadne datove body.")
+        values = await async_call_client(self.hass, self.client, "read_variables", list(requests.values()))
+        return {"values": {key: _json_safe(values.get(key)) for key in requests}}
+
+    async def async_write_plc_variables(
+        self,
+        *,
+        variables: list[dict[str, Any]] | dict[str, Any],
+        force: bool = False,
+    ) -> dict[str, Any]:
+        """Write many data points in one batch; takes name -> value or a list of refs with a value.
+
+        With force, values the PLC already holds are written too, e.g. to re-arm a trigger.
+        """
+        if self.client is None:
+            raise ValueError("Připojení ještě není nakonfigurované.")
+        await self.async_ensure_vlist_data()
+        if isinstance(variables, dict):
+            variables = [{"name": name, "value": value} for name, value in variables.items()]
+        writes: list[dict[str, Any]] = []
+        for item in variables:
+            if not isinstance(item, dict) or "value" not in item:
+                raise ValueError("Kazdy zapisovany datovy bod musi mit hodnotu value.")
+            key, ref = self._resolve_plc_ref(item)
+            try:
+                value = _coerce_plc_write_value(item["value"], ref["type"])
+            except (TypeError, ValueError) as err:
+                raise ValueError(f"Hodnotu pro {key} nelze prevest na {ref['type']}.") from err
+            writes.append(
+                {
+                    "uid": ref["uid"],
+                    "offset": ref["offset"],
+                    "length": ref["length"],
+                    "type": ref["type"],
+                    "value": value,
+                }
+            )
+        if not writes:
+            raise ValueError("Nebyly zadany zadne datove body.")
+
+        coordinator = self.hass.data.get(DOMAIN, {}).get(self.entry.entry_id, {}).get("coordinator")
+        if coordinator is not None:
+            # Through the coordinator, entities built on these points update and get confirmed too.
+            written = await coordinator.async_write_variables(writes, force=force)
+        else:
+            await async_call_client(self.hass, self.client, "write_variables", writes)
+            written = True
+        # "skipped" means the PLC already held every value and redundant writes are suppressed.
+        return {"status": "ok" if written else "skipped", "requested_values": len(writes)}
+
     async def _async_refresh_entry_coordinators(self) -> None:
         entry_state = self.hass.data.get(DOMAIN, {}).get(self.entry.entry_id, {})
         coordinator = entry_state.get("coordinator")
@@ -10,8 +10,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import COMM_MODE_WEBPANEL, DOMAIN
 from .coordinator import SSCPDataCoordinator, SSCPDiagnosticsCoordinator
-from .coordinator import variable_key
-from .entity import SSCPBaseEntity, async_apply_entity_area, build_plc_device_info
+from .entity import SSCPBaseEntity, SSCPRefValues, async_apply_entity_area, build_plc_device_info, ref_data_keys
 from .vlist import normalize_unit_of_measurement
 
 _LOGGER = logging.getLogger(__name__)
@@ -142,6 +141,7 @@ COMMON_DIAGNOSTIC_SENSORS: list[dict[str, Any]] = [
         "key": "last_diag_refresh",
         "name": "Last Diagnostics Refresh",
         "path": ("updated_at",),
+        "sections": ("metrics",),
         "device_class": SensorDeviceClass.TIMESTAMP,
         "extra_attributes": _coordinator_metrics_attributes,
     },
@@ -192,6 +192,29 @@ SSCP_DIAGNOSTIC_SENSORS: list[dict[str, Any]] = [
         "path": ("basic_info", "platform_id"),
         "extra_attributes": lambda data: dict(_dig(data, "basic_info") or {}),
     },
+    {
+        "key": "link_state",
+        "name": "Link State",
+        "path": ("link", "circuit", "state"),
+        "extra_attributes": lambda data: dict(_dig(data, "link", "circuit") or {}),
+    },
+    {
+        "key": "round_trip_time",
+        "name": "Round Trip Time",
+        "path": ("link", "rtt_ms"),
+        "unit": "ms",
+        "state_class": SensorStateClass.MEASUREMENT,
+        "extra_attributes": lambda data: {
+            key: value for key, value in dict(_dig(data, "link") or {}).items() if key != "circuit"
+        },
+    },
+    {
+        "key": "quarantined_points",
+        "name": "Quarantined Points",
+        "path": ("metrics", "quarantined_variable_count"),
+        "state_class": SensorStateClass.MEASUREMENT,
+        "extra_attributes": lambda data: {"variables": list(_dig(data, "metrics", "quarantined_variables") or [])},
+    },
     {
         "key": "proxy_status",
         "name": "Proxy Status",
@@ -288,6 +311,10 @@ class SSCPSchedulerSensor(CoordinatorEntity[SSCPDataCoordinator], SensorEntity):
         suggested_display_precision = config.get("suggested_display_precision")
         self._attr_name = str(config.get("name") or "Scheduler")
         self._attr_unique_id = f"{entry_id}_scheduler_{config.get('entity_key')}"
+        self._values = SSCPRefValues(
+            coordinator,
+            {"out_var": config.get("out_var"), "default_value_var": config.get("default_value_var")},
+        )
         self._attr_suggested_display_precision = (
             int(suggested_display_precision) if suggested_display_precision is not None else None
         )
@@ -302,22 +329,23 @@ class SSCPSchedulerSensor(CoordinatorEntity[SSCPDataCoordinator], SensorEntity):
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_key_listener(
+                ref_data_keys({"out_var": self._config.get("out_var"), "default_value_var": self._config.get("default_value_var")}),
+                self._handle_coordinator_update,
+            )
+        )
         await async_apply_entity_area(self.hass, getattr(self, "entity_id", None), self._config.get("area_id"))
 
-    def _coordinator_value(self, ref: dict[str, Any] | None) -> Any:
-        if not isinstance(ref, dict):
-            return None
-        return self.coordinator.data.get(variable_key(ref))
-
     @property
     def available(self) -> bool:
         return super().available and self.coordinator.data is not None
 
     @property
     def native_value(self):
-        output = self._coordinator_value(self._config.get("out_var"))
+        output = self._values.get("out_var")
         if output is None:
-            output = self._coordinator_value(self._config.get("default_value_var"))
+            output = self._values.get("default_value_var")
         if self._config.get("kind") == "bool":
             if output is None:
                 return None
@@ -332,8 +360,8 @@ class SSCPSchedulerSensor(CoordinatorEntity[SSCPDataCoordinator], SensorEntity):
             "supports_exceptions": bool(self._config.get("supports_exceptions")),
             "point_capacity": self._config.get("point_capacity"),
             "exception_capacity": self._config.get("exception_capacity"),
-            "default_value": self._coordinator_value(self._config.get("default_value_var")),
-            "output_value": self._coordinator_value(self._config.get("out_var")),
+            "default_value": self._values.get("default_value_var"),
+            "output_value": self._values.get("out_var"),
             "editor_hint": "Pouzij SSCP Studio nebo budouci dashboard kartu pro upravu tydenniho programu.",
         }
         return attributes
@@ -369,6 +397,11 @@ class SSCPDiagnosticSensor(CoordinatorEntity[SSCPDiagnosticsCoordinator], Sensor
             "model": f"{transport_name} PLC",
         }
 
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        sections = self._descriptor.get("sections") or self._descriptor["path"][:1]
+        self.async_on_remove(self.coordinator.async_add_section_listener(sections))
+
     @property
     def available(self) -> bool:
         return super().available and self.coordinator.data is not None
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import voluptuous as vol
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 
 from .const import DOMAIN
 from .runtime import resolve_runtime
@@ -10,6 +10,9 @@ SERVICE_REFRESH_RUNTIME = "refresh_runtime"
 SERVICE_SYNC_TIME = "sync_time"
 SERVICE_SET_PLC_TIME = "set_plc_time"
 SERVICE_RELOAD_FROM_VLIST = "reload_from_vlist"
+SERVICE_APPLY_SCHEDULER = "apply_scheduler"
+SERVICE_READ_VARIABLES = "read_variables"
+SERVICE_WRITE_VARIABLES = "write_variables"
 
 
 async def async_register_services(hass: HomeAssistant) -> None:
@@ -50,6 +53,27 @@ async def async_register_services(hass: HomeAssistant) -> None:
         if runtime is not None:
             await runtime.async_reload_from_vlist()
 
+    async def _apply_scheduler(call: ServiceCall) -> ServiceResponse:
+        runtime = resolve_runtime(hass, call.data.get("entry_id"))
+        if runtime is None:
+            raise ValueError("PLC pro zadane entry_id nebylo nalezeno.")
+        return await runtime.async_apply_scheduler(
+            source_root_name=call.data["source"],
+            targets=call.data["targets"],
+        )
+
+    async def _read_variables(call: ServiceCall) -> ServiceResponse:
+        runtime = resolve_runtime(hass, call.data.get("entry_id"))
+        if runtime is None:
+            raise ValueError("PLC pro zadane entry_id nebylo nalezeno.")
+        return await runtime.async_read_plc_variables(variables=call.data["variables"])
+
+    async def _write_variables(call: ServiceCall) -> ServiceResponse:
+        runtime = resolve_runtime(hass, call.data.get("entry_id"))
+        if runtime is None:
+            raise ValueError("PLC pro zadane entry_id nebylo nalezeno.")
+        return await runtime.async_write_plc_variables(variables=call.data["variables"], force=call.data["force"])
+
     hass.services.async_register(
         DOMAIN,
         SERVICE_REFRESH_RUNTIME,
@@ -86,4 +110,43 @@ async def async_register_services(hass: HomeAssistant) -> None:
         schema=vol.Schema({vol.Optional("entry_id"): str}),
     )
 
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_SCHEDULER,
+        _apply_scheduler,
+        schema=vol.Schema(
+            {
+                vol.Optional("entry_id"): str,
+                vol.Required("source"): str,
+                vol.Required("targets"): vol.Any(str, [str]),
+            }
+        ),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_READ_VARIABLES,
+        _read_variables,
+        schema=vol.Schema(
+            {
+                vol.Optional("entry_id"): str,
+                vol.Required("variables"): vol.All([vol.Any(str, dict)], vol.Length(min=1)),
+            }
+        ),
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_WRITE_VARIABLES,
+        _write_variables,
+        schema=vol.Schema(
+            {
+                vol.Optional("entry_id"): str,
+                vol.Required("variables"): vol.Any(dict, vol.All([dict], vol.Length(min=1))),
+                vol.Optional("force", default=False): bool,
+            }
+        ),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
     hass.data[f"{DOMAIN}_services_registered"] = True
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
-from functools import partial
 import logging
 from typing import Any
 
 from homeassistant.components.siren import SirenEntity, SirenEntityFeature
 
 from .const import DOMAIN
-from .coordinator import SSCPDataCoordinator, variable_key
-from .entity import async_apply_entity_area, build_plc_device_info
+from .coordinator import SSCPDataCoordinator
+from .entity import SSCPRefValues, SSCPWriteTransaction, async_apply_entity_area, build_plc_device_info, ref_data_keys
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -85,6 +84,7 @@ class SSCPComposedSiren(SirenEntity):
             "duration_var": config.get("duration_var"),
             "volume_var": config.get("volume_var"),
         }
+        self._values = SSCPRefValues(coordinator, self._refs)
         self._tone_map = {
             str(key): str(value).strip()
             for key, value in (config.get("tone_map") or {}).items()
@@ -107,29 +107,26 @@ class SSCPComposedSiren(SirenEntity):
     async def async_added_to_hass(self) -> None:
         if hasattr(self.coordinator, "async_add_listener"):
             self.async_on_remove(self.coordinator.async_add_listener(self.async_write_ha_state))
+            self.async_on_remove(
+                self.coordinator.async_add_key_listener(ref_data_keys(self._refs), self.async_write_ha_state)
+            )
         await async_apply_entity_area(self.hass, getattr(self, "entity_id", None), self._config.get("area_id"))
 
     @property
     def available(self) -> bool:
         return self.coordinator.last_update_success if self.coordinator else False
 
-    def _coordinator_value(self, ref: dict[str, Any] | None) -> Any:
-        if not isinstance(ref, dict):
-            return None
-        return self.coordinator.data.get(variable_key(ref))
-
-    async def _async_write_ref(self, ref: dict[str, Any] | None, raw_value: Any) -> None:
-        if not isinstance(ref, dict):
-            raise ValueError("Chybi datovy bod pro zapis.")
-        await self.hass.async_add_executor_job(
-            partial(
-                self._client.write_variable,
-                int(ref["uid"]),
-                _coerce_write_value(raw_value, str(ref["type"])),
-                offset=int(ref.get("offset", 0)),
-                length=int(ref.get("length", 1)),
-                type_data=str(ref["type"]),
-            )
+    async def _async_write_ref(self, ref: dict[str, Any] | None, raw_value: Any, *, force: bool = False) -> None:
+        writes = self._write_transaction()
+        writes.add(ref, raw_value, force=force)
+        await writes.async_commit()
+
+    def _write_transaction(self) -> SSCPWriteTransaction:
+        return SSCPWriteTransaction(
+            self.coordinator,
+            _coerce_write_value,
+            read_back=self._refs.values(),
+            force=bool(self._config.get("always_write")),
         )
 
     @property
@@ -145,7 +142,7 @@ class SSCPComposedSiren(SirenEntity):
 
     @property
     def is_on(self) -> bool | None:
-        value = self._coordinator_value(self._refs.get("state_var"))
+        value = self._values.get("state_var")
         if value is None:
             return None
         return bool(value)
@@ -157,6 +154,7 @@ class SSCPComposedSiren(SirenEntity):
         return list(dict.fromkeys(self._tone_map.values()))
 
     async def async_turn_on(self, **kwargs) -> None:
+        writes = self._write_transaction()
         try:
             tone = kwargs.get("tone")
             duration = kwargs.get("duration")
@@ -165,45 +163,44 @@ class SSCPComposedSiren(SirenEntity):
                 raw_value = self._tone_reverse_map.get(str(tone))
                 if raw_value is None:
                     raise ValueError(f"Tone {tone} neni v mapovani definovan.")
-                await self._async_write_ref(self._refs.get("tone_var"), raw_value)
+                writes.add(self._refs.get("tone_var"), raw_value)
             if duration is not None and self._refs.get("duration_var"):
-                await self._async_write_ref(self._refs.get("duration_var"), int(duration))
+                writes.add(self._refs.get("duration_var"), int(duration))
             if volume_level is not None and self._refs.get("volume_var"):
                 scaled = max(0.0, min(1.0, float(volume_level))) * max(1.0, self._volume_scale)
-                await self._async_write_ref(self._refs.get("volume_var"), scaled)
+                writes.add(self._refs.get("volume_var"), scaled)
 
             if self._refs.get("turn_on_var"):
-                await self._async_write_ref(self._refs.get("turn_on_var"), True)
+                writes.add(self._refs.get("turn_on_var"), True, force=True)
             elif self._refs.get("state_var"):
-                await self._async_write_ref(self._refs.get("state_var"), True)
+                writes.add(self._refs.get("state_var"), True)
             else:
                 raise ValueError("Siren nema definovan turn on ani state point.")
-            await self.coordinator.async_request_refresh()
+            await writes.async_commit()
         except Exception as err:
             _LOGGER.error("Failed to turn on siren %s: %s", self.name, err)
 
     async def async_turn_off(self, **kwargs) -> None:
         try:
             if self._refs.get("turn_off_var"):
-                await self._async_write_ref(self._refs.get("turn_off_var"), True)
+                await self._async_write_ref(self._refs.get("turn_off_var"), True, force=True)
             elif self._refs.get("state_var"):
                 await self._async_write_ref(self._refs.get("state_var"), False)
             else:
                 raise ValueError("Siren nema definovan turn off ani state point.")
-            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to turn off siren %s: %s", self.name, err)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         attributes: dict[str, Any] = {}
-        tone_value = self._coordinator_value(self._refs.get("tone_var"))
+        tone_value = self._values.get("tone_var")
         if tone_value is not None:
             attributes["tone"] = self._tone_map.get(_value_key(tone_value), _value_key(tone_value))
-        duration_value = self._coordinator_value(self._refs.get("duration_var"))
+        duration_value = self._values.get("duration_var")
         if duration_value is not None:
             attributes["duration"] = int(duration_value)
-        volume_value = self._coordinator_value(self._refs.get("volume_var"))
+        volume_value = self._values.get("volume_var")
         if volume_value is not None:
             attributes["volume_level"] = max(0.0, min(1.0, float(volume_value) / max(1.0, self._volume_scale)))
         return attributes or None
@@ -0,0 +1,960 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import Context, ContextVar
+from datetime import datetime, timedelta
+from functools import partial
+import heapq
+import inspect
+from itertools import count
+import logging
+import struct
+from time import monotonic, perf_counter
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, BinaryIO, Callable, Iterable, Sequence
+
+from .const import DEFAULT_PIPELINE_DEPTH, MAX_PIPELINE_DEPTH
+from .sscp_client import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_NAMES,
+    PRIORITY_POLL,
+    WRITE_VARIABLE_LIMIT,
+    SSCPClientBase,
+    SSCPCommandError,
+    SSCPConnectionError,
+    SSCPError,
+    SSCPFrameReader,
+    SSCPProtocolError,
+    SSCPReadChunk,
+    SSCPReadPass,
+    SSCPReadPlan,
+    SSCPResponse,
+    crc16,
+    current_request_priority,
+    request_priority,
+    ticks_to_datetime,
+    ticks_to_timedelta,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# How long trailing pipelined responses may lag behind the first one before the
+# PLC is assumed to drop requests that arrive while it is still busy.
+PIPELINE_PROBE_TIMEOUT = 2.0
+
+
+async def _iter_file_source(
+    source: bytes | bytearray | memoryview | BinaryIO | Iterable[bytes] | AsyncIterable[bytes],
+    chunk_size: int,
+) -> AsyncIterator[bytes | memoryview]:
+    """Yield chunk_size pieces of a file source; only the last one may be shorter.
+
+    File objects are read in the executor; plain iterables are consumed in the event loop.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source).cast("B")
+        for start in range(0, len(view), chunk_size):
+            yield view[start : start + chunk_size]
+        return
+
+    buffered = bytearray()
+    if hasattr(source, "read"):
+        pieces: AsyncIterator[bytes] = _read_in_executor(source, chunk_size)
+    elif isinstance(source, AsyncIterable):
+        pieces = aiter(source)
+    else:
+        pieces = _as_async_iterator(source)
+    async for piece in pieces:
+        buffered.extend(piece)
+        while len(buffered) >= chunk_size:
+            yield bytes(buffered[:chunk_size])
+            del buffered[:chunk_size]
+    if buffered:
+        yield bytes(buffered)
+
+
+async def _as_async_iterator(pieces: Iterable[bytes]) -> AsyncIterator[bytes]:
+    for piece in pieces:
+        yield piece
+
+
+async def _read_in_executor(source: BinaryIO, chunk_size: int) -> AsyncIterator[bytes]:
+    loop = asyncio.get_running_loop()
+    while piece := await loop.run_in_executor(None, source.read, chunk_size):
+        yield piece
+
+
+class SSCPFrameProtocol(asyncio.BufferedProtocol):
+    """Receives SSCP frames into a shared frame buffer and resolves waiting requests in order.
+
+    Waiters are queued per SSCP address, so several PLCs behind one gateway can
+    share the connection: each PLC answers its own requests in order, while
+    responses from different addresses may interleave freely.
+    """
+
+    def __init__(self) -> None:
+        self._reader = SSCPFrameReader()
+        self._transport: asyncio.Transport | None = None
+        self._waiters: dict[int, deque[asyncio.Future[SSCPResponse]]] = {}
+        self.closed = False
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._transport = transport  # type: ignore[assignment]
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self.closed = True
+        self._transport = None
+        waiters, self._waiters = self._waiters, {}
+        for queue in waiters.values():
+            for waiter in queue:
+                if not waiter.done():
+                    error = SSCPConnectionError("Connection closed by remote host.")
+                    if exc is not None:
+                        error.__cause__ = exc
+                    waiter.set_exception(error)
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self._reader.get_buffer()
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self._reader.advance(nbytes)
+        while (response := self._reader.next_frame()) is not None:
+            queue = self._waiters.get(response.address)
+            if not queue:
+                _LOGGER.debug(
+                    "Dropping unsolicited SSCP frame 0x%04X from address %s",
+                    response.function_id,
+                    response.address,
+                )
+                continue
+            waiter = queue.popleft()
+            if not waiter.done():
+                waiter.set_result(response)
+
+    def eof_received(self) -> bool | None:
+        return None
+
+    def send(self, frame: bytes) -> None:
+        if self._transport is None or self.closed:
+            raise SSCPConnectionError("Socket is not connected.")
+        self._transport.write(frame)
+
+    def expect_frame(self, address: int) -> asyncio.Future[SSCPResponse]:
+        waiter: asyncio.Future[SSCPResponse] = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(address, deque()).append(waiter)
+        return waiter
+
+    def close(self) -> None:
+        # Pending waiters fail in connection_lost; on a shared gateway they belong to other clients.
+        self.closed = True
+        if self._transport is not None:
+            self._transport.close()
+
+
+class SSCPGateway:
+    """One TCP connection to a host:port, shared by the SSCP addresses reached through it.
+
+    Every client keeps its own login session per address; the gateway only owns
+    the socket. SSCP frames carry no sequence number, so a request that times out
+    leaves its address's response order unknown. Responses are queued per address,
+    so that client alone moves to a socket of its own. A transport failure such as
+    a reset closes the connection for all users, and each reconnects and logs in
+    again on the next call, over one new socket rather than one per entry.
+
+    Each SSCP address is used by at most one client per gateway: a second login
+    to the same PLC would replace the first one's session and /var/direct file.
+    """
+
+    def __init__(self, host: str, port: int, *, shared: bool = False) -> None:
+        self.host = host
+        self.port = port
+        self.shared = shared
+        self.addresses: set[int] = set()
+        self._protocol: SSCPFrameProtocol | None = None
+        self._lock = asyncio.Lock()
+
+    async def async_protocol(self, timeout: float) -> SSCPFrameProtocol:
+        """Return the open connection, dialling the gateway if there is none."""
+        async with self._lock:
+            if self._protocol is None or self._protocol.closed:
+                _LOGGER.debug("Connecting to SSCP server at %s:%s", self.host, self.port)
+                _transport, self._protocol = await asyncio.wait_for(
+                    asyncio.get_running_loop().create_connection(SSCPFrameProtocol, self.host, self.port),
+                    timeout=timeout,
+                )
+            return self._protocol
+
+    def discard(self, protocol: SSCPFrameProtocol) -> None:
+        """Close a connection whose response order can no longer be trusted."""
+        if protocol is self._protocol:
+            self._protocol = None
+        protocol.close()
+
+    @property
+    def users(self) -> int:
+        return len(self.addresses)
+
+    def release(self, address: int) -> None:
+        self.addresses.discard(address)
+        if self.addresses:
+            return
+        if self._protocol is not None:
+            self._protocol.close()
+            self._protocol = None
+        if self.shared and _GATEWAYS.get((self.host, self.port)) is self:
+            del _GATEWAYS[(self.host, self.port)]
+
+
+_GATEWAYS: dict[tuple[str, int], SSCPGateway] = {}
+
+
+def acquire_gateway(host: str, port: int, address: int, *, shared: bool = True) -> SSCPGateway:
+    """Return the gateway connection for host:port, reusing one other clients already hold.
+
+    A client for an address the shared gateway already serves gets a connection of its own.
+    """
+    if not shared:
+        gateway = SSCPGateway(host, port)
+    elif (gateway := _GATEWAYS.get((host, port))) is None:
+        gateway = _GATEWAYS[(host, port)] = SSCPGateway(host, port, shared=True)
+    elif address in gateway.addresses:
+        gateway = SSCPGateway(host, port)
+    gateway.addresses.add(address)
+    return gateway
+
+
+class SSCPRequestScheduler:
+    """Hands a client's connection to one request at a time, highest priority class first.
+
+    Requests take the class set with request_priority, else their own, and keep
+    arrival order within a class. Multi-frame operations queue again for every
+    frame or pipelined window, so a toggle waiting behind a long poll, a file
+    transfer or a diagnostics sweep goes out after the frame currently on the wire.
+    Sequences that must not be interleaved keep the connection with hold instead.
+    """
+
+    def __init__(self) -> None:
+        self._held: ContextVar[bool] = ContextVar(f"sscp_slot_held_{id(self)}", default=False)
+        self._busy = False
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = count()
+        self._requests = [0] * len(PRIORITY_NAMES)
+        self._waited = [0.0] * len(PRIORITY_NAMES)
+        self._max_wait = [0.0] * len(PRIORITY_NAMES)
+
+    @asynccontextmanager
+    async def slot(self, priority: int = PRIORITY_POLL) -> AsyncIterator[None]:
+        if self._held.get():
+            # The caller already holds the connection; frames of its sequence go straight out.
+            yield
+            return
+        priority = current_request_priority(priority)
+        started = monotonic()
+        if self._busy or self._waiters:
+            waiter = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (priority, next(self._sequence), waiter))
+            try:
+                await waiter
+            except BaseException:
+                # Cancelled waiters stay in the heap and are skipped; one already handed the slot passes it on.
+                if waiter.done() and not waiter.cancelled():
+                    self._release()
+                raise
+        else:
+            self._busy = True
+
+        waited = monotonic() - started
+        self._requests[priority] += 1
+        self._waited[priority] += waited
+        self._max_wait[priority] = max(self._max_wait[priority], waited)
+        try:
+            yield
+        finally:
+            self._release()
+
+    @asynccontextmanager
+    async def hold(self, priority: int = PRIORITY_POLL) -> AsyncIterator[None]:
+        """Keep the connection across several frames, e.g. a /var/direct spool and the request using it."""
+        async with self.slot(priority):
+            token = self._held.set(True)
+            try:
+                yield
+            finally:
+                self._held.reset(token)
+
+    def _release(self) -> None:
+        while self._waiters:
+            _priority, _sequence, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                # The slot passes straight to the waiter, so nothing arriving meanwhile can take it.
+                waiter.set_result(None)
+                return
+        self._busy = False
+
+    def as_dict(self) -> dict[str, Any]:
+        queued = [0] * len(PRIORITY_NAMES)
+        for priority, _sequence, waiter in self._waiters:
+            if not waiter.done():
+                queued[priority] += 1
+        return {
+            name: {
+                "requests": self._requests[priority],
+                "queued": queued[priority],
+                "wait_avg_ms": (
+                    round(self._waited[priority] / self._requests[priority] * 1000, 1)
+                    if self._requests[priority]
+                    else None
+                ),
+                "wait_max_ms": round(self._max_wait[priority] * 1000, 1),
+            }
+            for priority, name in enumerate(PRIORITY_NAMES)
+        }
+
+
+class AsyncSSCPClient(SSCPClientBase):
+    """SSCP client on an asyncio buffered protocol, awaited directly from the event loop."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int | str,
+        username: str,
+        password: str,
+        sscp_address: str | int,
+        name_plc: str,
+        *,
+        pipeline_depth: int = DEFAULT_PIPELINE_DEPTH,
+        shared_gateway: bool = True,
+    ) -> None:
+        super().__init__(host, port, username, password, sscp_address, name_plc)
+        self.pipeline_depth = max(1, min(MAX_PIPELINE_DEPTH, int(pipeline_depth)))
+        self.pipelining_verified = False
+        self.shared_gateway = shared_gateway
+        self._gateway: SSCPGateway | None = None
+        self._protocol: SSCPFrameProtocol | None = None
+        self._probe_task: asyncio.Task[None] | None = None
+        self.scheduler = SSCPRequestScheduler()
+
+    async def _async_connect_locked(self) -> None:
+        if self.connected and self._protocol is not None and not self._protocol.closed:
+            return
+        if self._gateway is None:
+            self._gateway = acquire_gateway(self.host, self.port, self.sscp_address, shared=self.shared_gateway)
+        protocol = await self._gateway.async_protocol(self.rtt.timeout)
+        if protocol is not self._protocol:
+            # A new or replaced gateway connection carries no session for this address yet.
+            self._protocol = protocol
+            self.loggedin = False
+        self.connected = True
+
+    async def _async_close_locked(self) -> None:
+        protocol = self._protocol
+        self._protocol = None
+        self.connected = False
+        self.loggedin = False
+        if protocol is not None and self._gateway is not None:
+            self._gateway.discard(protocol)
+
+    async def _async_drop_link_locked(self, err: BaseException, *, order_lost: bool = False) -> None:
+        """Give up the connection after err without cutting off other users of a shared gateway.
+
+        A timeout, or order_lost, only garbles this address's responses; the client then
+        leaves the shared socket, where late answers to its address are dropped as unsolicited.
+        """
+        gateway = self._gateway
+        if (
+            (order_lost or isinstance(err, TimeoutError))
+            and self._protocol is not None
+            and gateway is not None
+            and gateway.users > 1
+        ):
+            self.shared_gateway = False
+            await self._async_detach_locked()
+        else:
+            await self._async_close_locked()
+
+    async def _async_detach_locked(self) -> None:
+        """Drop this client's session and gateway reference without cutting off other users."""
+        self._protocol = None
+        self.connected = False
+        self.loggedin = False
+        if self._gateway is not None:
+            self._gateway.release(self.sscp_address)
+            self._gateway = None
+
+    async def _async_exchange_locked(
+        self,
+        function_id: int,
+        data: bytes = b"",
+        *,
+        expect_response: bool = True,
+    ) -> SSCPResponse | None:
+        protocol = self._protocol
+        if protocol is None:
+            raise SSCPConnectionError("Socket is not connected.")
+        if not expect_response:
+            protocol.send(self._build_frame(function_id, data))
+            return None
+        waiter = protocol.expect_frame(self.sscp_address)
+        started = perf_counter()
+        protocol.send(self._build_frame(function_id, data))
+        try:
+            async with asyncio.timeout(self.rtt.timeout):
+                response = await waiter
+        except TimeoutError:
+            self.rtt.record_timeout()
+            raise
+        self.rtt.add_sample(perf_counter() - started)
+        self._validate_response(function_id, response)
+        return response
+
+    async def _async_exchange_pipelined_locked(
+        self,
+        function_id: int,
+        payloads: Sequence[bytes],
+    ) -> list[SSCPResponse | SSCPCommandError]:
+        protocol = self._protocol
+        if protocol is None:
+            raise SSCPConnectionError("Socket is not connected.")
+        waiters = []
+        started = perf_counter()
+        outcomes: list[SSCPResponse | SSCPCommandError] = []
+        try:
+            for payload in payloads:
+                waiters.append(protocol.expect_frame(self.sscp_address))
+                protocol.send(self._build_frame(function_id, payload))
+
+            for index, waiter in enumerate(waiters):
+                timeout = self.rtt.timeout if index == 0 or self.pipelining_verified else PIPELINE_PROBE_TIMEOUT
+                async with asyncio.timeout(timeout):
+                    response = await waiter
+                if index == 0:
+                    self.rtt.add_sample(perf_counter() - started)
+                try:
+                    self._validate_response(function_id, response)
+                except SSCPCommandError as err:
+                    outcomes.append(err)
+                else:
+                    outcomes.append(response)
+        except BaseException:
+            # Requests still in flight have nobody left to receive their outcome.
+            for waiter in waiters:
+                waiter.cancel()
+            raise
+        return outcomes
+
+    async def _async_login_locked(self) -> dict[str, Any]:
+        try:
+            response = await self._async_exchange_locked(0x0100, self._build_login_payload())
+        except SSCPCommandError as err:
+            if not self._downgrade_client_max_data_size(err):
+                raise
+            response = await self._async_exchange_locked(0x0100, self._build_login_payload())
+        return self._apply_login_response(response)
+
+    async def _async_send_frame(
+        self,
+        function_id: int,
+        data: bytes = b"",
+        *,
+        expect_response: bool = True,
+        require_login: bool = True,
+        priority: int = PRIORITY_POLL,
+    ) -> SSCPResponse | None:
+        self.breaker.check()
+        attempts = 2 if require_login else 1
+
+        for attempt in range(attempts):
+            async with self.scheduler.slot(priority):
+                try:
+                    await self._async_connect_locked()
+                    if require_login and not self.loggedin:
+                        await self._async_login_locked()
+                    response = await self._async_exchange_locked(
+                        function_id,
+                        data,
+                        expect_response=expect_response,
+                    )
+                except (OSError, SSCPConnectionError) as err:
+                    await self._async_drop_link_locked(err)
+                    if attempt + 1 < attempts:
+                        continue
+                    self._record_link_failure(err)
+                    if isinstance(err, SSCPConnectionError):
+                        raise
+                    raise SSCPConnectionError(str(err) or type(err).__name__) from err
+                except SSCPError:
+                    self.breaker.record_success()
+                    raise
+            self.breaker.record_success()
+            return response
+
+        raise SSCPConnectionError("Unable to communicate with PLC.")
+
+    def _record_link_failure(self, err: BaseException) -> None:
+        if self.breaker.record_failure(err) and (self._probe_task is None or self._probe_task.done()):
+            self._probe_task = asyncio.get_running_loop().create_task(
+                self._async_probe_until_reachable(),
+                name=f"SSCP probe {self.name_plc}",
+                # A fresh context, so the probe never inherits the class of the call that failed.
+                context=Context(),
+            )
+
+    async def _async_probe_until_reachable(self) -> None:
+        """Reconnect and log in on the breaker's backoff until the PLC answers again."""
+        while self.breaker.is_open:
+            await asyncio.sleep(max(0.0, (self.breaker.next_probe_at or 0.0) - monotonic()))
+            self.breaker.begin_probe()
+            async with self.scheduler.slot(PRIORITY_BACKGROUND):
+                try:
+                    await self._async_connect_locked()
+                    await self._async_login_locked()
+                except SSCPCommandError:
+                    # The PLC answered; the login problem surfaces on the next real call.
+                    pass
+                except (OSError, SSCPError) as err:
+                    await self._async_drop_link_locked(err)
+                    self.breaker.record_failure(err)
+                    _LOGGER.debug("PLC %s probe failed: %s", self.name_plc, err)
+                    continue
+            self.breaker.record_success()
+
+    async def _async_send_pipelined(
+        self,
+        function_id: int,
+        payloads: Sequence[bytes],
+        *,
+        priority: int = PRIORITY_POLL,
+    ) -> list[SSCPResponse | SSCPCommandError] | None:
+        """Keep all payloads in flight at once; None tells the caller to repeat them lock-step."""
+        self.breaker.check()
+        async with self.scheduler.slot(priority):
+            try:
+                await self._async_connect_locked()
+                if not self.loggedin:
+                    await self._async_login_locked()
+            except (OSError, SSCPConnectionError) as err:
+                await self._async_drop_link_locked(err)
+                self._record_link_failure(err)
+                if isinstance(err, SSCPConnectionError):
+                    raise
+                raise SSCPConnectionError(str(err) or type(err).__name__) from err
+
+            try:
+                outcomes = await self._async_exchange_pipelined_locked(function_id, payloads)
+            except (OSError, SSCPConnectionError, SSCPProtocolError) as err:
+                # A failed probe must not cut off the other entries on the gateway.
+                await self._async_drop_link_locked(err, order_lost=not self.pipelining_verified)
+                if not self.pipelining_verified:
+                    self.pipeline_depth = 1
+                    _LOGGER.warning(
+                        "PLC %s does not answer pipelined SSCP requests (%s); falling back to lock-step",
+                        self.name_plc,
+                        str(err) or type(err).__name__,
+                    )
+                return None
+
+            self.pipelining_verified = True
+            return outcomes
+
+    async def _async_ensure_session(self) -> None:
+        """Log in before planning so chunks are packed against the negotiated budget."""
+        if self.loggedin:
+            return
+        self.breaker.check()
+        async with self.scheduler.slot():
+            try:
+                await self._async_connect_locked()
+                if not self.loggedin:
+                    await self._async_login_locked()
+            except (OSError, SSCPConnectionError) as err:
+                await self._async_drop_link_locked(err)
+                self._record_link_failure(err)
+                if isinstance(err, SSCPConnectionError):
+                    raise
+                raise SSCPConnectionError(str(err) or type(err).__name__) from err
+
+    async def async_connect(self) -> None:
+        async with self.scheduler.slot():
+            try:
+                await self._async_connect_locked()
+            except OSError as err:
+                self._record_link_failure(err)
+                raise SSCPConnectionError(str(err) or type(err).__name__) from err
+        self.breaker.record_success()
+
+    async def async_disconnect(self) -> None:
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            self._probe_task = None
+        self.breaker.reset()
+        async with self.scheduler.slot():
+            await self._async_detach_locked()
+
+    async def async_login(self) -> dict[str, Any]:
+        async with self.scheduler.slot():
+            try:
+                await self._async_connect_locked()
+                login = await self._async_login_locked()
+            except (OSError, SSCPConnectionError) as err:
+                await self._async_drop_link_locked(err)
+                self._record_link_failure(err)
+                if isinstance(err, SSCPConnectionError):
+                    raise
+                raise SSCPConnectionError(str(err) or type(err).__name__) from err
+        self.breaker.record_success()
+        return login
+
+    async def async_logout(self) -> None:
+        if not self.connected:
+            return
+        try:
+            await self._async_send_frame(0x0101, expect_response=False)
+        finally:
+            await self.async_disconnect()
+
+    async def async_get_basic_info(self, *, requested_size: int = 0, start_offset: int = 0) -> dict[str, Any]:
+        response = await self._async_send_frame(
+            0x0000,
+            self._build_basic_info_payload(requested_size, start_offset),
+            require_login=requested_size != 0,
+            priority=PRIORITY_BACKGROUND,
+        )
+        return self._parse_basic_info(response)
+
+    async def async_get_plc_statistics(self) -> dict[str, Any]:
+        response = await self._async_send_frame(0x0300, priority=PRIORITY_BACKGROUND)
+        if response is None:
+            return {}
+        return self._parse_plc_statistics(response.data)
+
+    async def async_get_task_statistics(self, task_id: int) -> dict[str, Any]:
+        response = await self._async_send_frame(0x0301, bytes([task_id]), priority=PRIORITY_BACKGROUND)
+        if response is None:
+            return {}
+        return self._parse_task_statistics(response.data)
+
+    async def async_get_channel_statistics(self, channel: str | int) -> dict[str, Any]:
+        channel_id = self._channel_id(channel)
+        response = await self._async_send_frame(0x0310, struct.pack(">I", channel_id), priority=PRIORITY_BACKGROUND)
+        if response is None:
+            return {}
+        return self._parse_channel_statistics(channel_id, response.data)
+
+    async def async_get_time(self, mode: str = "utc") -> datetime | None:
+        response = await self._async_send_frame(0x0604, self._build_get_time_payload(mode), priority=PRIORITY_BACKGROUND)
+        if response is None or not response.data:
+            return None
+        return ticks_to_datetime(struct.unpack(">Q", response.data)[0])
+
+    async def async_get_time_offset(self, mode: str = "timezone") -> timedelta | None:
+        response = await self._async_send_frame(0x0604, self._build_get_time_offset_payload(mode), priority=PRIORITY_BACKGROUND)
+        if response is None or not response.data:
+            return None
+        return ticks_to_timedelta(struct.unpack(">Q", response.data)[0])
+
+    async def async_set_time(self, value: datetime, mode: str = "utc") -> None:
+        await self._async_send_frame(0x0604, self._build_set_time_payload(value, mode), priority=PRIORITY_BACKGROUND)
+
+    async def async_sync_time(self, mode: str = "utc") -> datetime:
+        now = self._sync_time_target(mode)
+        await self.async_set_time(now, mode=mode)
+        refreshed = await self.async_get_time(mode="utc" if mode == "utc" else "local")
+        return refreshed or now
+
+    def _file_window(self, window: int | None) -> int:
+        # Chunks are only pipelined once variable reads proved the PLC answers that way;
+        # a fallback mid-transfer would drop the file session the PLC keeps for this socket.
+        if not self.pipelining_verified:
+            return 1
+        return max(1, min(MAX_PIPELINE_DEPTH, int(window if window is not None else self.pipeline_depth)))
+
+    async def _async_send_file_window(
+        self,
+        function_id: int,
+        payloads: list[bytes],
+    ) -> list[SSCPResponse | SSCPCommandError | None]:
+        if len(payloads) == 1:
+            return [await self._async_send_frame(function_id, payloads[0], priority=PRIORITY_BACKGROUND)]
+        outcomes = await self._async_send_pipelined(function_id, payloads, priority=PRIORITY_BACKGROUND)
+        if outcomes is None:
+            raise SSCPConnectionError("File transfer interrupted.")
+        return outcomes
+
+    async def async_write_file(
+        self,
+        file_name: str,
+        data: bytes,
+        *,
+        timestamp: datetime | None = None,
+        chunk_size: int | None = None,
+    ) -> None:
+        await self.async_write_file_from(file_name, data, size=len(data), timestamp=timestamp, chunk_size=chunk_size)
+
+    async def async_write_file_from(
+        self,
+        file_name: str,
+        source: bytes | bytearray | memoryview | BinaryIO | Iterable[bytes] | AsyncIterable[bytes],
+        *,
+        size: int,
+        timestamp: datetime | None = None,
+        chunk_size: int | None = None,
+        window: int | None = None,
+    ) -> None:
+        """Send a file chunk by chunk from bytes, a binary file object or a (async) iterable of bytes.
+
+        File objects are read in the executor, so disk reads never block the event loop.
+
+        Up to window chunks (the pipeline depth by default) are in flight at once and
+        the CRC is computed as the chunks go out, so the file never has to be in memory.
+        """
+        await self._async_send_frame(
+            0x0200,
+            self._build_file_send_payload(file_name, size, timestamp),
+            priority=PRIORITY_BACKGROUND,
+        )
+
+        window_size = self._file_window(window)
+        crc = crc16(b"")
+        offset = 0
+        pending: list[tuple[int, bytes | memoryview]] = []
+
+        async def send_pending() -> None:
+            outcomes = await self._async_send_file_window(
+                0x0201,
+                [struct.pack(">I", chunk_offset) + chunk for chunk_offset, chunk in pending],
+            )
+            for (chunk_offset, _chunk), outcome in zip(pending, outcomes):
+                if isinstance(outcome, SSCPCommandError):
+                    raise outcome
+                self._check_chunk_acknowledgement(outcome, chunk_offset)
+            pending.clear()
+
+        async for chunk in _iter_file_source(source, self._file_chunk_size(chunk_size)):
+            pending.append((offset, chunk))
+            crc = crc16(chunk, crc)
+            offset += len(chunk)
+            if len(pending) >= window_size:
+                await send_pending()
+        if pending:
+            await send_pending()
+        if offset != size:
+            raise ValueError(f"File source for {file_name} yielded {offset} bytes, expected {size}.")
+
+        await self._async_send_frame(0x0202, struct.pack(">H", crc), priority=PRIORITY_BACKGROUND)
+
+    async def async_read_file(self, file_name: str) -> dict[str, Any]:
+        received = bytearray()
+        info = await self.async_read_file_to(file_name, received.extend)
+        return {**info, "data": bytes(received)}
+
+    async def async_read_file_to(
+        self,
+        file_name: str,
+        sink: BinaryIO | Callable[[memoryview], Awaitable[Any] | Any],
+        *,
+        window: int | None = None,
+    ) -> dict[str, Any]:
+        """Stream a file into sink chunk by chunk.
+
+        sink is a binary file object, written in the executor, or a callable that
+        runs in the event loop and must not block; it may return an awaitable.
+
+        Chunk offsets after the first are predicted from its length, so up to window
+        requests (the pipeline depth by default) stay in flight. Chunks are read-only
+        views and the CRC is checked incrementally; on a mismatch the sink has already
+        received the data and SSCPProtocolError is raised at the end.
+        """
+        response = await self._async_send_frame(
+            0x0210,
+            self._build_file_receive_payload(file_name),
+            priority=PRIORITY_BACKGROUND,
+        )
+        total_size, timestamp, expected_crc = self._parse_file_receive_header(response)
+        if hasattr(sink, "write"):
+            sink = partial(asyncio.get_running_loop().run_in_executor, None, sink.write)
+
+        window_size = self._file_window(window)
+        crc = crc16(b"")
+        offset = 0
+        chunk_length = 0
+        while offset < total_size:
+            if chunk_length:
+                offsets = range(offset, min(total_size, offset + window_size * chunk_length), chunk_length)
+            else:
+                offsets = range(offset, offset + 1)
+            outcomes = await self._async_send_file_window(
+                0x0211,
+                [struct.pack(">I", chunk_offset) for chunk_offset in offsets],
+            )
+            for chunk_offset, outcome in zip(offsets, outcomes):
+                if isinstance(outcome, SSCPCommandError):
+                    raise outcome
+                chunk = self._parse_file_chunk(outcome, chunk_offset)
+                if not chunk:
+                    offset = total_size
+                    break
+                chunk = chunk[: total_size - offset]
+                if inspect.isawaitable(result := sink(chunk)):
+                    await result
+                crc = crc16(chunk, crc)
+                offset += len(chunk)
+                chunk_length = chunk_length or len(chunk)
+                if len(chunk) != chunk_length:
+                    # A short chunk before the end shifts every later offset; predict again from here.
+                    break
+
+        if crc != expected_crc:
+            raise SSCPProtocolError(
+                f"CRC mismatch while reading {file_name}: expected 0x{expected_crc:04X}, got 0x{crc:04X}"
+            )
+        return {
+            "file_name": file_name,
+            "size": total_size,
+            "timestamp": timestamp,
+            "crc": expected_crc,
+        }
+
+    async def async_read_variables(
+        self,
+        variables: Sequence[dict[str, Any]] | SSCPReadPlan,
+        *,
+        use_file_transfer: bool = True,
+    ) -> dict[str, Any]:
+        if not variables:
+            return {}
+
+        # Polls queue as polls, overflow fetches from /var/direct included; an enclosing class such as a read-back wins.
+        with request_priority(PRIORITY_POLL):
+            await self._async_ensure_session()
+            read_pass = self._start_read_pass(variables, use_file_transfer)
+            while read_pass.pending:
+                await self._async_read_window(self._take_read_window(read_pass.pending), read_pass)
+
+        return read_pass.results
+
+    def _take_read_window(self, pending: deque[SSCPReadChunk]) -> list[SSCPReadChunk]:
+        """Pop the chunks to keep in flight together; file-mode chunks always go alone."""
+        window = [pending.popleft()]
+        if self.pipeline_depth <= 1 or window[0].file_mode:
+            return window
+        while pending and len(window) < self.pipeline_depth and not pending[0].file_mode:
+            window.append(pending.popleft())
+        return window
+
+    async def _async_read_window(self, window: list[SSCPReadChunk], read_pass: SSCPReadPass) -> None:
+        if not read_pass.use_file_transfer:
+            await self._async_read_window_held(window, read_pass)
+            return
+        # Any chunk may overflow into /var/direct; no write may spool its own blob there before it is fetched.
+        async with self.scheduler.hold():
+            await self._async_read_window_held(window, read_pass)
+
+    async def _async_read_window_held(self, window: list[SSCPReadChunk], read_pass: SSCPReadPass) -> None:
+        if len(window) > 1:
+            outcomes = await self._async_send_pipelined(
+                0x0500,
+                [self._read_chunk_payload(chunk, read_pass.use_file_transfer)[0] for chunk in window],
+            )
+            if outcomes is not None:
+                for chunk, outcome in zip(window, outcomes):
+                    if isinstance(outcome, SSCPCommandError) and outcome.error_code == 0x010E:
+                        # /var/direct holds only one overflowed response; fetch this one lock-step.
+                        await self._async_read_chunk(chunk, read_pass)
+                        continue
+                    await self._async_finish_read_chunk(chunk, outcome, False, read_pass)
+                return
+
+        for chunk in window:
+            await self._async_read_chunk(chunk, read_pass)
+
+    async def _async_read_chunk(self, chunk: SSCPReadChunk, read_pass: SSCPReadPass) -> None:
+        """Read one planned chunk into the pass results; refused chunks are requeued smaller."""
+        payload, file_mode = self._read_chunk_payload(chunk, read_pass.use_file_transfer)
+        try:
+            outcome: SSCPResponse | SSCPCommandError | None = await self._async_send_frame(0x0500, payload)
+        except SSCPCommandError as err:
+            outcome = err
+        await self._async_finish_read_chunk(chunk, outcome, file_mode, read_pass)
+
+    async def _async_finish_read_chunk(
+        self,
+        chunk: SSCPReadChunk,
+        outcome: SSCPResponse | SSCPCommandError | None,
+        file_mode: bool,
+        read_pass: SSCPReadPass,
+    ) -> None:
+        if isinstance(outcome, SSCPCommandError):
+            if self._requeue_failed_read(chunk, outcome, read_pass):
+                return
+            if outcome.error_code != 0x010E or not read_pass.use_file_transfer:
+                raise outcome
+            file_mode = True
+            raw_payload: bytes | memoryview = b""
+        else:
+            raw_payload = outcome.data if outcome is not None else b""
+
+        if file_mode and not raw_payload:
+            file_payload = await self.async_read_file("/var/direct")
+            raw_payload = file_payload["data"]
+        self._decode_read_chunk(raw_payload, chunk, read_pass.results)
+
+    async def async_read_variable(self, uid: int, offset: int, length: int, type_data: str) -> Any:
+        result = await self.async_read_variables([self._single_read_request(uid, offset, length, type_data)])
+        return result["__single__"]
+
+    async def async_write_variables(
+        self,
+        variables: Sequence[dict[str, Any]],
+        *,
+        use_file_transfer: bool = True,
+    ) -> None:
+        if not variables:
+            return
+
+        # Writes answer a user action; their /var/direct spooling shares the class.
+        with request_priority(PRIORITY_INTERACTIVE):
+            for start in range(0, len(variables), WRITE_VARIABLE_LIMIT):
+                chunk = list(variables[start : start + WRITE_VARIABLE_LIMIT])
+                payload, file_blob = self._plan_write_chunk(chunk, use_file_transfer=use_file_transfer)
+                if file_blob is None:
+                    await self._async_send_frame(0x0510, payload)
+                    continue
+                # The blob must still be in /var/direct when 0x0510 commits it.
+                async with self.scheduler.hold():
+                    await self.async_write_file("/var/direct", file_blob)
+                    await self._async_send_frame(0x0510, payload)
+
+    async def async_write_variable(
+        self,
+        uid: int,
+        value: Any,
+        *,
+        offset: int = 0,
+        length: int = 0,
+        type_data: str = "BYTE",
+    ) -> None:
+        await self.async_write_variables(
+            [
+                self._single_write_request(
+                    uid,
+                    value,
+                    offset=offset,
+                    length=length,
+                    type_data=type_data,
+                )
+            ]
+        )
+
+    def link_state(self) -> dict[str, Any]:
+        return {**super().link_state(), "queue": self.scheduler.as_dict()}
+
+    def capabilities(self) -> dict[str, Any]:
+        return {
+            **super().capabilities(),
+            "pipeline_depth": self.pipeline_depth,
+            "pipelining_verified": self.pipelining_verified,
+            "gateway_users": self._gateway.users if self._gateway is not None else 0,
+        }
@@ -0,0 +1,203 @@
+"""Compare lock-step and pipelined SSCP polling against a local stand-in server.
+
+Run from a Home Assistant development environment:
+
+    python -m custom_components.sscp_integration.sscp_bench --rtt-ms 30 --depth 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass
+import struct
+from time import perf_counter
+from typing import Any
+
+from .const import MAX_PIPELINE_DEPTH
+from .sscp_async_client import AsyncSSCPClient
+from .sscp_client import READ_ITEM_STRUCT
+
+
+class StandInSSCPServer:
+    """Minimal SSCP endpoint answering login and variable reads after a simulated link delay.
+
+    Responses are delayed without blocking the reader, so requests that arrive while
+    earlier ones are still "on the wire" overlap the way they would on a real link.
+    With pipelining disabled, frames received while a response is pending are dropped,
+    which is how a PLC without pipelining support looks from the client side.
+    """
+
+    def __init__(
+        self,
+        *,
+        address: int = 1,
+        rtt: float = 0.03,
+        max_data_size: int = 1024,
+        pipelining: bool = True,
+    ) -> None:
+        self.address = address
+        self.rtt = rtt
+        self.max_data_size = max_data_size
+        self.pipelining = pipelining
+        self.frames = 0
+        self._server: asyncio.Server | None = None
+        self._handlers: set[asyncio.Task[None]] = set()
+
+    async def start(self) -> int:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        loop = asyncio.get_running_loop()
+        handler = asyncio.current_task()
+        if handler is not None:
+            self._handlers.add(handler)
+            handler.add_done_callback(self._handlers.discard)
+        in_flight = 0
+
+        def deliver(frame: bytes) -> None:
+            nonlocal in_flight
+            in_flight -= 1
+            if not writer.is_closing():
+                writer.write(frame)
+
+        try:
+            while True:
+                header = await reader.readexactly(5)
+                address, function_id, data_length = struct.unpack(">BHH", header)
+                data = await reader.readexactly(data_length)
+                if in_flight and not self.pipelining:
+                    continue
+                self.frames += 1
+                response = self._dispatch(function_id, data)
+                if response is None:
+                    continue
+                response_id, payload = response
+                in_flight += 1
+                frame = struct.pack(">BHH", address, response_id, len(payload)) + payload
+                loop.call_later(self.rtt, deliver, frame)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def _dispatch(self, function_id: int, data: bytes) -> tuple[int, bytes] | None:
+        if function_id == 0x0100:
+            return 0x8100, bytes([7]) + struct.pack(">H", self.max_data_size) + bytes([0x80]) + bytes(16)
+        if function_id == 0x0101:
+            return None
+        if function_id == 0x0500:
+            payload = bytearray()
+            for index in range(1, len(data), READ_ITEM_STRUCT.size):
+                uid, offset, length = READ_ITEM_STRUCT.unpack_from(data, index)
+                payload.extend(bytes((uid + offset + step) & 0xFF for step in range(length)))
+            if len(payload) > self.max_data_size:
+                return 0xC500, struct.pack(">I", 0x010E)
+            return 0x8500, bytes(payload)
+        return function_id | 0xC000, struct.pack(">I", 0x0106)
+
+
+@dataclass
+class BenchResult:
+    pipeline_depth: int
+    polls: int
+    frames: int
+    seconds: float
+    pipelining_verified: bool
+
+    @property
+    def ms_per_poll(self) -> float:
+        return self.seconds * 1000 / self.polls
+
+    @property
+    def frames_per_second(self) -> float:
+        return self.frames / self.seconds if self.seconds else 0.0
+
+
+def _bench_variables(count: int) -> list[dict[str, Any]]:
+    return [
+        {"uid": 1000 + index, "offset": 0, "length": 8, "type": "LREAL", "key": f"var_{index}"}
+        for index in range(count)
+    ]
+
+
+async def async_run_bench(
+    *,
+    variables: int = 1000,
+    polls: int = 10,
+    depth: int = 4,
+    rtt: float = 0.03,
+    max_data_size: int = 1024,
+    server_pipelining: bool = True,
+) -> list[BenchResult]:
+    server = StandInSSCPServer(rtt=rtt, max_data_size=max_data_size, pipelining=server_pipelining)
+    port = await server.start()
+    requests = _bench_variables(variables)
+    results: list[BenchResult] = []
+    try:
+        for pipeline_depth in (1, depth):
+            client = AsyncSSCPClient("127.0.0.1", port, "bench", "", 1, "bench", pipeline_depth=pipeline_depth)
+            try:
+                plan = client.build_read_plan(requests)
+                await client.async_read_variables(plan)
+                frames_before = server.frames
+                started = perf_counter()
+                for _ in range(polls):
+                    await client.async_read_variables(plan)
+                results.append(
+                    BenchResult(
+                        pipeline_depth=pipeline_depth,
+                        polls=polls,
+                        frames=server.frames - frames_before,
+                        seconds=perf_counter() - started,
+                        pipelining_verified=client.pipelining_verified,
+                    )
+                )
+            finally:
+                await client.async_disconnect()
+    finally:
+        await server.stop()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--variables", type=int, default=1000, help="LREAL variables per poll")
+    parser.add_argument("--polls", type=int, default=10, help="timed polls per mode")
+    parser.add_argument("--depth", type=int, default=4, help=f"pipeline depth to compare (2-{MAX_PIPELINE_DEPTH})")
+    parser.add_argument("--rtt-ms", type=float, default=30.0, help="simulated round trip time")
+    parser.add_argument("--max-data-size", type=int, default=1024, help="server frame budget")
+    parser.add_argument(
+        "--no-server-pipelining",
+        action="store_true",
+        help="drop frames that arrive while a response is pending, to exercise the lock-step fallback",
+    )
+    args = parser.parse_args()
+
+    results = asyncio.run(
+        async_run_bench(
+            variables=args.variables,
+            polls=args.polls,
+            depth=max(2, min(MAX_PIPELINE_DEPTH, args.depth)),
+            rtt=args.rtt_ms / 1000,
+            max_data_size=args.max_data_size,
+            server_pipelining=not args.no_server_pipelining,
+        )
+    )
+    print(f"{'depth':>5} {'frames':>7} {'ms/poll':>9} {'frames/s':>9}  pipelined")
+    for result in results:
+        print(
+            f"{result.pipeline_depth:>5} {result.frames:>7} {result.ms_per_poll:>9.1f} "
+            f"{result.frames_per_second:>9.1f}  {'yes' if result.pipelining_verified else 'no'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
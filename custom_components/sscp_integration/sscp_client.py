@@ -1,19 +1,29 @@
 from __future__ import annotations
 
 import binascii
-from dataclasses import dataclass
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
+from functools import partial
 import hashlib
 import logging
 import socket
 import struct
 import threading
-from typing import Any, Sequence
+from time import monotonic, perf_counter
+from typing import Any, Callable, Iterator, Sequence
 
 from .const import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_MAX_PROBE_DELAY,
+    CIRCUIT_MIN_PROBE_DELAY,
     DEFAULT_CLIENT_MAX_DATA_SIZE,
+    MAX_CLIENT_MAX_DATA_SIZE,
     DEFAULT_PROTOCOL_VERSION,
     DEFAULT_SOCKET_TIMEOUT,
+    MIN_SOCKET_TIMEOUT,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -32,6 +42,43 @@ TYPE_LENGTHS = {
     "DT": 8,
 }
 
+READ_REQUEST_HEADER_SIZE = 1
+READ_REQUEST_ITEM_SIZE = 12
+DEFAULT_READ_VARIABLE_LIMIT = 255
+WRITE_VARIABLE_LIMIT = 64
+
+READ_ITEM_STRUCT = struct.Struct(">III")
+
+# Errors a read chunk gets because of one of its references rather than the frame as a whole.
+ISOLATABLE_READ_ERRORS = frozenset({0x0103, 0x0106, 0x0111, 0x0112})
+QUARANTINE_RETRY_SECONDS = 60.0
+QUARANTINE_MAX_RETRY_SECONDS = 3600.0
+
+# Request classes of the async client scheduler, served in this order when they queue up.
+PRIORITY_INTERACTIVE = 0
+PRIORITY_POLL = 1
+PRIORITY_BACKGROUND = 2
+PRIORITY_NAMES = ("interactive", "poll", "background")
+
+FRAME_HEADER_STRUCT = struct.Struct(">BHH")
+FRAME_HEADER_SIZE = FRAME_HEADER_STRUCT.size
+FRAME_BUFFER_SIZE = FRAME_HEADER_SIZE + MAX_CLIENT_MAX_DATA_SIZE + 1
+
+# Struct codes for values that decode natively; anything else is unpacked as raw bytes and converted.
+STRUCT_DECODE_CODES = {
+    ("BOOL", 1): "?",
+    ("BYTE", 1): "B",
+    ("WORD", 2): "H",
+    ("INT", 2): "h",
+    ("UINT", 2): "H",
+    ("DINT", 4): "i",
+    ("UDINT", 4): "I",
+    ("LINT", 8): "q",
+    ("REAL", 4): "f",
+    ("LREAL", 8): "d",
+    ("DT", 8): "Q",
+}
+
 RIGHT_GROUPS = {
     0x10: "Read only",
     0x80: "Full control",
@@ -133,7 +180,281 @@ CLIENT_STATUSES = {
 class SSCPResponse:
     address: int
     function_id: int
-    data: bytes
+    data: bytes | memoryview
+
+
+class SSCPRoundTripEstimator:
+    """Smoothed round-trip time and the response timeout derived from it, the way TCP sizes its RTO.
+
+    Until the first sample the fixed default applies. Every timeout doubles the next
+    one until a response arrives again; the result stays within the configured bounds.
+    """
+
+    def __init__(self) -> None:
+        self.srtt: float | None = None
+        self.rttvar = 0.0
+        self.last_sample: float | None = None
+        self._backoff = 1
+
+    def add_sample(self, seconds: float) -> None:
+        self.last_sample = seconds
+        self._backoff = 1
+        if self.srtt is None:
+            self.srtt = seconds
+            self.rttvar = seconds / 2
+            return
+        self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - seconds)
+        self.srtt = 0.875 * self.srtt + 0.125 * seconds
+
+    def record_timeout(self) -> None:
+        self._backoff = min(self._backoff * 2, 64)
+
+    @property
+    def timeout(self) -> float:
+        if self.srtt is None:
+            return DEFAULT_SOCKET_TIMEOUT
+        base = max(MIN_SOCKET_TIMEOUT, self.srtt + 4 * self.rttvar)
+        return min(DEFAULT_SOCKET_TIMEOUT, base * self._backoff)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "rtt_ms": round(self.srtt * 1000, 1) if self.srtt is not None else None,
+            "rtt_variance_ms": round(self.rttvar * 1000, 1) if self.srtt is not None else None,
+            "last_rtt_ms": round(self.last_sample * 1000, 1) if self.last_sample is not None else None,
+            "timeout_s": round(self.timeout, 2),
+        }
+
+
+class SSCPCircuitBreaker:
+    """Fails calls fast once the PLC stopped answering, until a probe reaches it again.
+
+    The circuit opens after CIRCUIT_FAILURE_THRESHOLD consecutive connection failures.
+    Probe delays grow exponentially between CIRCUIT_MIN_PROBE_DELAY and
+    CIRCUIT_MAX_PROBE_DELAY; any success closes the circuit and resets them.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_count = 0
+        self.rejected_count = 0
+        self.last_error: str | None = None
+        self.opened_at: float | None = None
+        self.next_probe_at: float | None = None
+        self._probe_delay = CIRCUIT_MIN_PROBE_DELAY
+
+    @property
+    def is_open(self) -> bool:
+        return self.state != self.CLOSED
+
+    def check(self, *, allow_probe: bool = False) -> None:
+        """Raise SSCPCircuitOpenError while open; with allow_probe, let one due call through."""
+        if self.state == self.CLOSED:
+            return
+        if allow_probe and self.state == self.OPEN and monotonic() >= (self.next_probe_at or 0.0):
+            self.begin_probe()
+            return
+        self.rejected_count += 1
+        retry_in = max(0.0, (self.next_probe_at or 0.0) - monotonic())
+        raise SSCPCircuitOpenError(
+            f"PLC {self.name} is unreachable ({self.last_error}); next connection attempt in {retry_in:.0f} s"
+        )
+
+    def begin_probe(self) -> None:
+        self.state = self.HALF_OPEN
+
+    def record_success(self) -> None:
+        if self.state != self.CLOSED:
+            _LOGGER.info("PLC %s is reachable again", self.name)
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.next_probe_at = None
+        self._probe_delay = CIRCUIT_MIN_PROBE_DELAY
+
+    def record_failure(self, err: BaseException) -> bool:
+        """Count a connection failure; True when it just opened the circuit."""
+        self.consecutive_failures += 1
+        self.last_error = str(err) or type(err).__name__
+        if self.state == self.HALF_OPEN:
+            self.state = self.OPEN
+            self.schedule_probe()
+            return False
+        if self.state == self.OPEN or self.consecutive_failures < CIRCUIT_FAILURE_THRESHOLD:
+            return False
+        self.state = self.OPEN
+        self.opened_count += 1
+        self.opened_at = monotonic()
+        self._probe_delay = CIRCUIT_MIN_PROBE_DELAY
+        self.schedule_probe()
+        _LOGGER.warning(
+            "PLC %s failed %d times in a row (%s); failing calls fast until it answers again",
+            self.name,
+            self.consecutive_failures,
+            self.last_error,
+        )
+        return True
+
+    def schedule_probe(self) -> float:
+        """Set and return the delay before the next probe, growing it for the one after."""
+        delay = self._probe_delay
+        self.next_probe_at = monotonic() + delay
+        self._probe_delay = min(CIRCUIT_MAX_PROBE_DELAY, self._probe_delay * 2)
+        return delay
+
+    def reset(self) -> None:
+        self.record_success()
+        self.last_error = None
+
+    def as_dict(self) -> dict[str, Any]:
+        now = monotonic()
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "opened_count": self.opened_count,
+            "rejected_count": self.rejected_count,
+            "last_error": self.last_error,
+            "open_for_s": round(now - self.opened_at, 1) if self.opened_at is not None else None,
+            "next_probe_in_s": max(0.0, round(self.next_probe_at - now, 1)) if self.next_probe_at is not None else None,
+        }
+
+
+class SSCPFrameReader:
+    """Reassembles SSCP frames received straight into a preallocated buffer.
+
+    Frames are handed out as memoryview slices of that buffer. Bytes that were
+    handed out are never overwritten: once the buffer is full, the unconsumed tail
+    moves to a fresh buffer and the old one lives for as long as views reference it.
+    """
+
+    def __init__(self, capacity: int = FRAME_BUFFER_SIZE) -> None:
+        self._capacity = capacity
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self._start = 0
+        self._end = 0
+
+    def _pending_frame_size(self) -> int:
+        if self._end - self._start < FRAME_HEADER_SIZE:
+            return FRAME_HEADER_SIZE
+        _address, _function_id, data_length = FRAME_HEADER_STRUCT.unpack_from(self._buffer, self._start)
+        return FRAME_HEADER_SIZE + data_length
+
+    def get_buffer(self) -> memoryview:
+        """Return the writable tail of the buffer, with room for the frame in progress."""
+        needed = self._pending_frame_size()
+        if self._end == len(self._buffer) or self._start + needed > len(self._buffer):
+            buffer = bytearray(max(self._capacity, needed))
+            tail = self._end - self._start
+            buffer[:tail] = self._view[self._start : self._end]
+            self._buffer = buffer
+            self._view = memoryview(buffer)
+            self._start = 0
+            self._end = tail
+        return self._view[self._end :]
+
+    def advance(self, count: int) -> None:
+        self._end += count
+
+    def next_frame(self) -> SSCPResponse | None:
+        """Return the next complete frame, or None until more bytes have arrived."""
+        if self._end - self._start < FRAME_HEADER_SIZE:
+            return None
+        address, function_id, data_length = FRAME_HEADER_STRUCT.unpack_from(self._buffer, self._start)
+        data_start = self._start + FRAME_HEADER_SIZE
+        data_end = data_start + data_length
+        if data_end > self._end:
+            return None
+        self._start = data_end
+        return SSCPResponse(address=address, function_id=function_id, data=self._view[data_start:data_end])
+
+
+@dataclass
+class SSCPReadRange:
+    """Contiguous bytes of one UID read once and sliced back out for every consumer."""
+
+    uid: int
+    offset: int
+    length: int
+    consumers: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def end(self) -> int:
+        return self.offset + self.length
+
+
+@dataclass
+class SSCPReadChunk:
+    """One 0x0500 request worth of ranges packed against the frame budget."""
+
+    ranges: list[SSCPReadRange] = field(default_factory=list)
+    response_size: int = 0
+    file_mode: bool = False
+    variables: list[dict[str, Any]] = field(default_factory=list)
+    payload: bytes = b""
+    keys: tuple[str, ...] = ()
+    aliases: tuple[tuple[int, str], ...] = ()
+    decoders: tuple[tuple[struct.Struct, int], ...] = ()
+    converters: tuple[tuple[int, Callable[[Any], Any]], ...] = ()
+
+
+@dataclass
+class SSCPQuarantinedRead:
+    """A variable reference the PLC rejects, left out of polls and re-probed with backoff."""
+
+    uid: int
+    offset: int
+    length: int
+    keys: list[str]
+    error: str
+    failures: int = 0
+    retry_at: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "uid": self.uid,
+            "offset": self.offset,
+            "length": self.length,
+            "keys": list(self.keys),
+            "error": self.error,
+            "failures": self.failures,
+            "retry_in_s": max(0.0, round(self.retry_at - monotonic(), 1)),
+        }
+
+
+@dataclass
+class SSCPReadPass:
+    """State of one read_variables call, shared by every chunk and session serving it."""
+
+    pending: deque[SSCPReadChunk]
+    use_file_transfer: bool = True
+    isolate_failures: bool = False
+    results: dict[str, Any] = field(default_factory=dict)
+
+
+class SSCPReadPlan:
+    """Compiled read requests for one variable set, reused across polls.
+
+    The chunks are recompiled lazily whenever the client's frame budget changes,
+    for example after a re-login negotiated a different max_data_size. Reads of a
+    plan isolate failing references instead of failing the whole call.
+    """
+
+    def __init__(self, variables: Sequence[dict[str, Any]]) -> None:
+        self.variables = list(variables)
+        self.chunks: list[SSCPReadChunk] = []
+        self.budget: tuple[int, int] | None = None
+
+    def __len__(self) -> int:
+        return len(self.variables)
+
+    def __bool__(self) -> bool:
+        return bool(self.variables)
 
 
 class SSCPError(Exception):
@@ -148,6 +469,10 @@ class SSCPProtocolError(SSCPError):
     """Raised when the protocol response is malformed."""
 
 
+class SSCPCircuitOpenError(SSCPConnectionError):
+    """Raised without touching the network while the PLC is considered unreachable."""
+
+
 class SSCPCommandError(SSCPError):
     """Raised when the PLC returns a command-specific error."""
 
@@ -209,8 +534,31 @@ def ticks_to_timedelta(value: int) -> timedelta:
     return timedelta(microseconds=value / 10)
 
 
-def crc16(data: bytes) -> int:
-    return binascii.crc_hqx(data, 0xFFFF)
+_request_priority: ContextVar[int | None] = ContextVar("sscp_request_priority", default=None)
+
+
+def current_request_priority(default: int = PRIORITY_POLL) -> int:
+    """Return the class set by an enclosing request_priority, else the caller's own default."""
+    priority = _request_priority.get()
+    return default if priority is None else priority
+
+
+@contextmanager
+def request_priority(priority: int) -> Iterator[None]:
+    """Queue the client calls made inside in one priority class; an enclosing class takes precedence."""
+    if _request_priority.get() is not None:
+        yield
+        return
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+def crc16(data: bytes | memoryview, crc: int = 0xFFFF) -> int:
+    """CRC of data; pass the previous result as crc to continue over a stream."""
+    return binascii.crc_hqx(data, crc)
 
 
 def fnv1_32(value: str) -> int:
@@ -221,6 +569,35 @@ def fnv1_32(value: str) -> int:
     return result
 
 
+def encode_value(value: Any, type_data: str) -> bytes:
+    """Return the PLC byte representation of value, as written by a 0x0510 frame."""
+    type_name = type_data.upper()
+
+    if type_name == "BOOL":
+        return (1 if bool(value) else 0).to_bytes(1, "big")
+    if type_name == "BYTE":
+        return int(value).to_bytes(1, "big", signed=False)
+    if type_name == "WORD":
+        return int(value).to_bytes(2, "big", signed=False)
+    if type_name == "INT":
+        return int(value).to_bytes(2, "big", signed=True)
+    if type_name == "UINT":
+        return int(value).to_bytes(2, "big", signed=False)
+    if type_name == "DINT":
+        return int(value).to_bytes(4, "big", signed=True)
+    if type_name == "UDINT":
+        return int(value).to_bytes(4, "big", signed=False)
+    if type_name == "LINT":
+        return int(value).to_bytes(8, "big", signed=True)
+    if type_name == "REAL":
+        return struct.pack(">f", float(value))
+    if type_name == "LREAL":
+        return struct.pack(">d", float(value))
+    if type_name == "DT":
+        return struct.pack(">Q", datetime_to_ticks(value))
+    raise ValueError(f"Unsupported type: {type_name}")
+
+
 def _read_u16(data: bytes, offset: int) -> tuple[int, int]:
     return struct.unpack_from(">H", data, offset)[0], offset + 2
 
@@ -242,7 +619,12 @@ def _decode_best_effort_text(raw: bytes) -> str:
     return raw.hex()
 
 
-class SSCPClient:
+
+class SSCPClientBase:
+    """Transport-independent SSCP session state, payload builders and parsers."""
+
+    transport_name = "sscp"
+
     def __init__(
         self,
         host: str,
@@ -259,17 +641,19 @@ class SSCPClient:
         self.sscp_address = _parse_address(sscp_address)
         self.name_plc = name_plc
 
-        self.socket: socket.socket | None = None
         self.connected = False
         self.loggedin = False
 
         self.protocol_version = DEFAULT_PROTOCOL_VERSION
-        self.client_max_data_size = DEFAULT_CLIENT_MAX_DATA_SIZE
+        self.client_max_data_size = MAX_CLIENT_MAX_DATA_SIZE
         self.server_max_data_size = DEFAULT_CLIENT_MAX_DATA_SIZE
+        self.read_variable_limit = DEFAULT_READ_VARIABLE_LIMIT
+        self.read_quarantine: dict[tuple[int, int, int], SSCPQuarantinedRead] = {}
+        self.breaker = SSCPCircuitBreaker(name_plc)
+        self.rtt = SSCPRoundTripEstimator()
         self.right_group: int | None = None
         self.image_guid: str | None = None
         self.device_tags: dict[str, Any] = {}
-        self._lock = threading.RLock()
 
     @property
     def max_data_size(self) -> int:
@@ -281,104 +665,12 @@ class SSCPClient:
             return "Unknown"
         return RIGHT_GROUPS.get(self.right_group, f"0x{self.right_group:02X}")
 
-    def connect(self) -> None:
-        with self._lock:
-            if self.connected and self.socket is not None:
-                return
-            _LOGGER.debug("Connecting to SSCP server at %s:%s", self.host, self.port)
-            self.socket = socket.create_connection(
-                (self.host, self.port),
-                timeout=DEFAULT_SOCKET_TIMEOUT,
-            )
-            self.socket.settimeout(DEFAULT_SOCKET_TIMEOUT)
-            self.connected = True
-            self.loggedin = False
-
-    def disconnect(self) -> None:
-        with self._lock:
-            if self.socket is not None:
-                try:
-                    self.socket.close()
-                except OSError:
-                    pass
-            self.socket = None
-            self.connected = False
-            self.loggedin = False
-
-    def reconnect(self) -> None:
-        with self._lock:
-            self.disconnect()
-            self.connect()
-            self.login()
-
-    def ensure_connected(self) -> None:
-        if not self.connected or self.socket is None:
-            self.connect()
-        if not self.loggedin:
-            self.login()
-
-    def _require_socket(self) -> socket.socket:
-        if self.socket is None:
-            raise SSCPConnectionError("Socket is not connected.")
-        return self.socket
-
-    def _recv_exact(self, size: int) -> bytes:
-        sock = self._require_socket()
-        chunks = bytearray()
-        while len(chunks) < size:
-            chunk = sock.recv(size - len(chunks))
-            if not chunk:
-                raise SSCPConnectionError("Connection closed by remote host.")
-            chunks.extend(chunk)
-        return bytes(chunks)
-
-    def _read_frame(self) -> SSCPResponse:
-        address = self._recv_exact(1)[0]
-        header = self._recv_exact(4)
-        function_id, data_length = struct.unpack(">HH", header)
-        data = self._recv_exact(data_length)
-        return SSCPResponse(address=address, function_id=function_id, data=data)
-
-    def _send_frame(
-        self,
-        function_id: int,
-        data: bytes = b"",
-        *,
-        expect_response: bool = True,
-        require_login: bool = True,
-    ) -> SSCPResponse | None:
-        attempts = 2 if require_login else 1
-        last_error: Exception | None = None
-
-        for attempt in range(attempts):
-            with self._lock:
-                if require_login:
-                    self.ensure_connected()
-                elif not self.connected or self.socket is None:
-                    self.connect()
-
-                frame = bytearray()
-                frame.append(self.sscp_address)
-                frame.extend(struct.pack(">HH", function_id, len(data)))
-                frame.extend(data)
-
-                try:
-                    self._require_socket().sendall(frame)
-                    if not expect_response:
-                        return None
-                    response = self._read_frame()
-                    self._validate_response(function_id, response)
-                    return response
-                except (BrokenPipeError, ConnectionResetError, TimeoutError, OSError) as err:
-                    last_error = err
-                    self.disconnect()
-                    if attempt + 1 < attempts:
-                        continue
-                    raise SSCPConnectionError(str(err)) from err
-
-        if last_error is not None:
-            raise SSCPConnectionError(str(last_error)) from last_error
-        raise SSCPConnectionError("Unable to communicate with PLC.")
+    def _build_frame(self, function_id: int, data: bytes = b"") -> bytes:
+        frame = bytearray()
+        frame.append(self.sscp_address)
+        frame.extend(struct.pack(">HH", function_id, len(data)))
+        frame.extend(data)
+        return bytes(frame)
 
     def _validate_response(self, function_id: int, response: SSCPResponse) -> None:
         if response.address != self.sscp_address:
@@ -387,11 +679,11 @@ class SSCPClient:
             )
 
         if response.function_id == 0xFFFF:
-            raise SSCPCommandError(function_id, None, "Insufficient rights", optional_data=response.data)
+            raise SSCPCommandError(function_id, None, "Insufficient rights", optional_data=bytes(response.data))
         if response.function_id == 0xFFFE:
-            raise SSCPCommandError(function_id, None, "Invalid function", optional_data=response.data)
+            raise SSCPCommandError(function_id, None, "Invalid function", optional_data=bytes(response.data))
         if response.function_id == 0xFFFD:
-            raise SSCPCommandError(function_id, None, "Invalid protocol version", optional_data=response.data)
+            raise SSCPCommandError(function_id, None, "Invalid protocol version", optional_data=bytes(response.data))
 
         if response.function_id == (function_id | 0xC000):
             if len(response.data) < 4:
@@ -402,7 +694,7 @@ class SSCPClient:
                 function_id,
                 error_code,
                 f"{error_name} (0x{error_code:04X})",
-                optional_data=response.data[4:],
+                optional_data=bytes(response.data[4:]),
             )
 
         expected_response = function_id | 0x8000
@@ -411,7 +703,7 @@ class SSCPClient:
                 f"Unexpected function id 0x{response.function_id:04X}, expected 0x{expected_response:04X}"
             )
 
-    def login(self) -> dict[str, Any]:
+    def _build_login_payload(self) -> bytes:
         username_bytes = self.username.encode("utf-8")
         password_hash = hashlib.md5(self.password.encode("utf-8")).digest()
 
@@ -423,12 +715,28 @@ class SSCPClient:
         payload.append(len(password_hash))
         payload.extend(password_hash)
         payload.append(0x00)
+        return bytes(payload)
+
+    def _downgrade_client_max_data_size(self, err: SSCPCommandError) -> bool:
+        """Fall back to the conservative size when the PLC rejects the larger offer."""
+        if self.client_max_data_size <= DEFAULT_CLIENT_MAX_DATA_SIZE:
+            return False
+        if err.error_code not in (0x0106, 0x010D):
+            return False
+        _LOGGER.debug(
+            "PLC %s rejected client max data size %d, retrying login with %d",
+            self.name_plc,
+            self.client_max_data_size,
+            DEFAULT_CLIENT_MAX_DATA_SIZE,
+        )
+        self.client_max_data_size = DEFAULT_CLIENT_MAX_DATA_SIZE
+        return True
 
-        response = self._send_frame(0x0100, bytes(payload), require_login=False)
+    def _apply_login_response(self, response: SSCPResponse | None) -> dict[str, Any]:
         if response is None:
             raise SSCPProtocolError("Missing login response.")
 
-        data = response.data
+        data = bytes(response.data)
         if len(data) < 20:
             raise SSCPProtocolError("Login response is shorter than expected.")
 
@@ -448,14 +756,6 @@ class SSCPClient:
             "device_tags": self.device_tags,
         }
 
-    def logout(self) -> None:
-        if not self.connected:
-            return
-        try:
-            self._send_frame(0x0101, expect_response=False)
-        finally:
-            self.disconnect()
-
     def _parse_login_tags(self, data: bytes) -> dict[str, Any]:
         tags: dict[str, Any] = {}
         if not data or data[0] != 0x3E:
@@ -551,7 +851,7 @@ class SSCPClient:
             break
         return tags
 
-    def get_basic_info(self, *, requested_size: int = 0, start_offset: int = 0) -> dict[str, Any]:
+    def _build_basic_info_payload(self, requested_size: int, start_offset: int) -> bytes:
         username_bytes = self.username.encode("utf-8")
         password_hash = hashlib.md5(self.password.encode("utf-8")).digest()
 
@@ -563,16 +863,13 @@ class SSCPClient:
         payload.append(len(password_hash))
         payload.extend(password_hash)
         payload.extend(struct.pack(">HH", start_offset, requested_size))
+        return bytes(payload)
 
-        response = self._send_frame(
-            0x0000,
-            bytes(payload),
-            require_login=requested_size != 0,
-        )
+    def _parse_basic_info(self, response: SSCPResponse | None) -> dict[str, Any]:
         if response is None:
             raise SSCPProtocolError("Missing basic info response.")
 
-        data = response.data
+        data = bytes(response.data)
         index = 0
         config_size, index = _read_u16(data, index)
         serial_length = data[index]
@@ -597,10 +894,11 @@ class SSCPClient:
             "info_tags": info_tags,
         }
 
-    def _parse_plc_statistics(self, data: bytes) -> dict[str, Any]:
+    def _parse_plc_statistics(self, data: bytes | memoryview) -> dict[str, Any]:
         if not data:
             return {}
 
+        data = bytes(data)
         index = 0
         statistics_version = data[index]
         index += 1
@@ -680,17 +978,7 @@ class SSCPClient:
 
         return result
 
-    def get_plc_statistics(self) -> dict[str, Any]:
-        response = self._send_frame(0x0300)
-        if response is None:
-            return {}
-        return self._parse_plc_statistics(response.data)
-
-    def get_task_statistics(self, task_id: int) -> dict[str, Any]:
-        response = self._send_frame(0x0301, bytes([task_id]))
-        if response is None:
-            return {}
-        data = response.data
+    def _parse_task_statistics(self, data: bytes) -> dict[str, Any]:
         if len(data) < 33:
             raise SSCPProtocolError("Task statistics response is too short.")
 
@@ -724,13 +1012,10 @@ class SSCPClient:
 
         return result
 
-    def get_channel_statistics(self, channel: str | int) -> dict[str, Any]:
-        channel_id = fnv1_32(channel) if isinstance(channel, str) else int(channel)
-        response = self._send_frame(0x0310, struct.pack(">I", channel_id))
-        if response is None:
-            return {}
+    def _channel_id(self, channel: str | int) -> int:
+        return fnv1_32(channel) if isinstance(channel, str) else int(channel)
 
-        data = response.data
+    def _parse_channel_statistics(self, channel_id: int, data: bytes) -> dict[str, Any]:
         if len(data) < 23:
             raise SSCPProtocolError("Channel statistics response is too short.")
 
@@ -768,45 +1053,26 @@ class SSCPClient:
             "endpoints": endpoints,
         }
 
-    def get_time(self, mode: str = "utc") -> datetime | None:
+    def _build_get_time_payload(self, mode: str) -> bytes:
         commands = {"utc": 0x01, "local": 0x02}
-        command = commands[mode]
-        response = self._send_frame(0x0604, bytes([command, 0x00]))
-        if response is None or not response.data:
-            return None
-        return ticks_to_datetime(struct.unpack(">Q", response.data)[0])
+        return bytes([commands[mode], 0x00])
 
-    def get_time_offset(self, mode: str = "timezone") -> timedelta | None:
+    def _build_get_time_offset_payload(self, mode: str) -> bytes:
         commands = {"timezone": 0x20, "daylight": 0x21}
-        command = commands[mode]
-        response = self._send_frame(0x0604, bytes([command, 0x00]))
-        if response is None or not response.data:
-            return None
-        return ticks_to_timedelta(struct.unpack(">Q", response.data)[0])
+        return bytes([commands[mode], 0x00])
 
-    def set_time(self, value: datetime, mode: str = "utc") -> None:
+    def _build_set_time_payload(self, value: datetime, mode: str) -> bytes:
         commands = {"utc": 0x10, "local": 0x11}
-        command = commands[mode]
         ticks = datetime_to_ticks(value)
-        payload = bytes([command, 0x00]) + struct.pack(">Q", ticks)
-        self._send_frame(0x0604, payload)
+        return bytes([commands[mode], 0x00]) + struct.pack(">Q", ticks)
 
-    def sync_time(self, mode: str = "utc") -> datetime:
+    def _sync_time_target(self, mode: str) -> datetime:
         now = datetime.now(UTC)
         if mode == "local":
             now = now.astimezone()
-        self.set_time(now, mode=mode)
-        refreshed = self.get_time(mode="utc" if mode == "utc" else "local")
-        return refreshed or now
+        return now
 
-    def write_file(
-        self,
-        file_name: str,
-        data: bytes,
-        *,
-        timestamp: datetime | None = None,
-        chunk_size: int | None = None,
-    ) -> None:
+    def _build_file_send_payload(self, file_name: str, size: int, timestamp: datetime | None) -> bytes:
         if timestamp is None:
             timestamp = datetime.now(UTC)
         file_name_bytes = file_name.encode("utf-8")
@@ -814,55 +1080,53 @@ class SSCPClient:
         payload = bytearray()
         payload.append(len(file_name_bytes))
         payload.extend(file_name_bytes)
-        payload.extend(struct.pack(">I", len(data)))
+        payload.extend(struct.pack(">I", size))
         payload.extend(struct.pack(">Q", datetime_to_ticks(timestamp)))
-        self._send_frame(0x0200, bytes(payload))
+        return bytes(payload)
 
-        effective_chunk = chunk_size or max(16, self.max_data_size - 4)
-        offset = 0
-        while offset < len(data):
-            chunk = data[offset : offset + effective_chunk]
-            response = self._send_frame(0x0201, struct.pack(">I", offset) + chunk)
-            if response is None or len(response.data) != 4:
-                raise SSCPProtocolError("Invalid send chunk acknowledgement.")
-            acknowledged = struct.unpack(">I", response.data)[0]
-            if acknowledged != offset:
-                raise SSCPProtocolError(
-                    f"Chunk acknowledgement mismatch: expected {offset}, got {acknowledged}"
-                )
-            offset += len(chunk)
+    def _file_chunk_size(self, chunk_size: int | None) -> int:
+        return chunk_size or max(16, self.max_data_size - 4)
 
-        finish_payload = struct.pack(">H", crc16(data))
-        self._send_frame(0x0202, finish_payload)
+    def _check_chunk_acknowledgement(self, response: SSCPResponse | None, offset: int) -> None:
+        if response is None or len(response.data) != 4:
+            raise SSCPProtocolError("Invalid send chunk acknowledgement.")
+        acknowledged = struct.unpack(">I", response.data)[0]
+        if acknowledged != offset:
+            raise SSCPProtocolError(
+                f"Chunk acknowledgement mismatch: expected {offset}, got {acknowledged}"
+            )
 
-    def read_file(self, file_name: str) -> dict[str, Any]:
+    def _build_file_receive_payload(self, file_name: str) -> bytes:
         file_name_bytes = file_name.encode("utf-8")
-        payload = bytes([len(file_name_bytes)]) + file_name_bytes
-        response = self._send_frame(0x0210, payload)
+        return bytes([len(file_name_bytes)]) + file_name_bytes
+
+    def _parse_file_receive_header(self, response: SSCPResponse | None) -> tuple[int, datetime | None, int]:
         if response is None or len(response.data) < 14:
             raise SSCPProtocolError("Invalid file receive response.")
 
         total_size = struct.unpack_from(">I", response.data, 0)[0]
         timestamp = ticks_to_datetime(struct.unpack_from(">Q", response.data, 4)[0])
         expected_crc = struct.unpack_from(">H", response.data, 12)[0]
+        return total_size, timestamp, expected_crc
 
-        offset = 0
-        received = bytearray()
-        while offset < total_size:
-            chunk_response = self._send_frame(0x0211, struct.pack(">I", offset))
-            if chunk_response is None or len(chunk_response.data) < 4:
-                raise SSCPProtocolError("Invalid file chunk response.")
-            chunk_offset = struct.unpack_from(">I", chunk_response.data, 0)[0]
-            if chunk_offset != offset:
-                raise SSCPProtocolError(
-                    f"Chunk offset mismatch: expected {offset}, got {chunk_offset}"
-                )
-            chunk = chunk_response.data[4:]
-            if not chunk:
-                break
-            received.extend(chunk)
-            offset += len(chunk)
+    def _parse_file_chunk(self, response: SSCPResponse | None, offset: int) -> bytes:
+        if response is None or len(response.data) < 4:
+            raise SSCPProtocolError("Invalid file chunk response.")
+        chunk_offset = struct.unpack_from(">I", response.data, 0)[0]
+        if chunk_offset != offset:
+            raise SSCPProtocolError(
+                f"Chunk offset mismatch: expected {offset}, got {chunk_offset}"
+            )
+        return response.data[4:]
 
+    def _finish_file_read(
+        self,
+        file_name: str,
+        total_size: int,
+        timestamp: datetime | None,
+        expected_crc: int,
+        received: bytearray,
+    ) -> dict[str, Any]:
         data_bytes = bytes(received[:total_size])
         actual_crc = crc16(data_bytes)
         if actual_crc != expected_crc:
@@ -920,31 +1184,7 @@ class SSCPClient:
         raise ValueError(f"Unsupported type: {type_name}")
 
     def _encode_value(self, value: Any, type_data: str) -> bytes:
-        type_name = type_data.upper()
-
-        if type_name == "BOOL":
-            return (1 if bool(value) else 0).to_bytes(1, "big")
-        if type_name == "BYTE":
-            return int(value).to_bytes(1, "big", signed=False)
-        if type_name == "WORD":
-            return int(value).to_bytes(2, "big", signed=False)
-        if type_name == "INT":
-            return int(value).to_bytes(2, "big", signed=True)
-        if type_name == "UINT":
-            return int(value).to_bytes(2, "big", signed=False)
-        if type_name == "DINT":
-            return int(value).to_bytes(4, "big", signed=True)
-        if type_name == "UDINT":
-            return int(value).to_bytes(4, "big", signed=False)
-        if type_name == "LINT":
-            return int(value).to_bytes(8, "big", signed=True)
-        if type_name == "REAL":
-            return struct.pack(">f", float(value))
-        if type_name == "LREAL":
-            return struct.pack(">d", float(value))
-        if type_name == "DT":
-            return struct.pack(">Q", datetime_to_ticks(value))
-        raise ValueError(f"Unsupported type: {type_name}")
+        return encode_value(value, type_data)
 
     def _build_read_payload(
         self,
@@ -952,12 +1192,15 @@ class SSCPClient:
         *,
         response_format: int = 0,
         uid_type_vm: bool = False,
+        file_mode: bool = False,
         task_id: int | None = None,
     ) -> bytes:
         flags = response_format & 0x07
         flags |= 0x80
         if uid_type_vm:
             flags |= 0x40
+        if file_mode:
+            flags |= 0x20
         if task_id is not None:
             flags |= 0x10
 
@@ -973,78 +1216,298 @@ class SSCPClient:
 
         return bytes(payload)
 
-    def _split_raw_values(
-        self,
-        payload: bytes,
-        variables: Sequence[dict[str, Any]],
-    ) -> list[bytes]:
-        index = 0
-        result: list[bytes] = []
-        for variable in variables:
-            value_length = self._resolved_length(variable)
-            chunk = payload[index : index + value_length]
-            if len(chunk) != value_length:
-                raise SSCPProtocolError("Variable response payload is shorter than expected.")
-            result.append(chunk)
-            index += value_length
-
-        if index != len(payload):
-            _LOGGER.debug(
-                "Read payload contains %d trailing bytes after decoding %d variables.",
-                len(payload) - index,
-                len(variables),
-            )
-        return result
+    def _coalesce_read_ranges(self, variables: Sequence[dict[str, Any]]) -> list[SSCPReadRange]:
+        """Merge overlapping or adjacent slices of one UID into single range reads.
+
+        Ranges come out ordered by UID and offset, identical slices end up in the same range
+        and a merge never grows a range past the response budget.
+        """
+        budget = self.max_data_size
+        ordered = sorted(variables, key=lambda item: (int(item["uid"]), int(item.get("offset", 0))))
+        ranges: list[SSCPReadRange] = []
+        current: SSCPReadRange | None = None
+        for variable in ordered:
+            uid = int(variable["uid"])
+            offset = int(variable.get("offset", 0))
+            end = offset + self._resolved_length(variable)
+            if current is not None and current.uid == uid and offset <= current.end:
+                merged_end = max(current.end, end)
+                if merged_end - current.offset <= max(budget, current.length):
+                    current.length = merged_end - current.offset
+                    current.consumers.append(variable)
+                    continue
+            current = SSCPReadRange(uid=uid, offset=offset, length=end - offset, consumers=[variable])
+            ranges.append(current)
+        return ranges
+
+    def _read_chunks(self, variables: Sequence[dict[str, Any]]) -> list[SSCPReadChunk]:
+        """Pack coalesced ranges into as few 0x0500 frames as the negotiated budget allows.
+
+        Request and response both have to fit into max_data_size. Ranges whose value alone
+        exceeds the response budget are grouped into file-mode chunks served through /var/direct.
+        """
+        budget = self.max_data_size
+        item_limit = max(1, min(self.read_variable_limit, (budget - READ_REQUEST_HEADER_SIZE) // READ_REQUEST_ITEM_SIZE))
+        chunks: list[SSCPReadChunk] = []
+        direct = SSCPReadChunk()
+        oversized = SSCPReadChunk(file_mode=True)
+
+        for read_range in self._coalesce_read_ranges(variables):
+            if read_range.length > budget:
+                if len(oversized.ranges) >= item_limit:
+                    chunks.append(oversized)
+                    oversized = SSCPReadChunk(file_mode=True)
+                oversized.ranges.append(read_range)
+                oversized.response_size += read_range.length
+                continue
+            if len(direct.ranges) >= item_limit or direct.response_size + read_range.length > budget:
+                chunks.append(direct)
+                direct = SSCPReadChunk()
+            direct.ranges.append(read_range)
+            direct.response_size += read_range.length
+
+        for chunk in (direct, oversized):
+            if chunk.ranges:
+                chunks.append(chunk)
+        for chunk in chunks:
+            self._compile_read_chunk(chunk)
+        return chunks
+
+    def _build_range_payload(self, ranges: Sequence[SSCPReadRange], *, file_mode: bool) -> bytes:
+        payload = bytearray(self._build_read_payload((), file_mode=file_mode))
+        for read_range in ranges:
+            payload.extend(READ_ITEM_STRUCT.pack(read_range.uid, read_range.offset, read_range.length))
+        return bytes(payload)
 
-    def read_variables(
+    def _compile_read_chunk(self, chunk: SSCPReadChunk) -> None:
+        """Pre-encode the request and build the structs that slice every consumer out of the response.
+
+        Consumers that tile the response without overlapping share one struct; an overlapping
+        slice starts a new struct at its own position.
+        """
+        chunk.payload = self._build_range_payload(chunk.ranges, file_mode=chunk.file_mode)
+        chunk.variables = [variable for read_range in chunk.ranges for variable in read_range.consumers]
+
+        slots: dict[tuple[int, int, str], list[str]] = {}
+        position = 0
+        for read_range in chunk.ranges:
+            for variable in read_range.consumers:
+                slot = (
+                    position + int(variable.get("offset", 0)) - read_range.offset,
+                    self._resolved_length(variable),
+                    str(variable["type"]).upper(),
+                )
+                slots.setdefault(slot, []).append(self._variable_result_key(variable))
+            position += read_range.length
+
+        decoders: list[tuple[struct.Struct, int]] = []
+        codes: list[str] = []
+        run_start = 0
+        run_end = -1
+        keys: list[str] = []
+        aliases: list[tuple[int, str]] = []
+        converters: list[tuple[int, Callable[[Any], Any]]] = []
+        for index, ((start, value_length, type_name), slot_keys) in enumerate(sorted(slots.items())):
+            if start < run_end or run_end < 0:
+                if codes:
+                    decoders.append((struct.Struct(">" + "".join(codes)), run_start))
+                codes = []
+                run_start = run_end = start
+            if start > run_end:
+                codes.append(f"{start - run_end}x")
+            code = STRUCT_DECODE_CODES.get((type_name, value_length))
+            if code is None:
+                codes.append(f"{value_length}s")
+                converters.append((index, partial(self._decode_value, type_data=type_name)))
+            else:
+                codes.append(code)
+                if type_name == "DT":
+                    converters.append((index, ticks_to_datetime))
+            run_end = start + value_length
+            keys.append(slot_keys[0])
+            aliases.extend((index, key) for key in slot_keys[1:])
+        if codes:
+            decoders.append((struct.Struct(">" + "".join(codes)), run_start))
+
+        chunk.response_size = position
+        chunk.keys = tuple(keys)
+        chunk.aliases = tuple(aliases)
+        chunk.decoders = tuple(decoders)
+        chunk.converters = tuple(converters)
+
+    def build_read_plan(self, variables: Sequence[dict[str, Any]]) -> SSCPReadPlan:
+        plan = SSCPReadPlan(variables)
+        self._compiled_read_chunks(plan)
+        return plan
+
+    def _compiled_read_chunks(self, plan: SSCPReadPlan) -> list[SSCPReadChunk]:
+        budget = (self.max_data_size, self.read_variable_limit)
+        if plan.budget != budget:
+            plan.chunks = self._read_chunks(plan.variables)
+            plan.budget = budget
+        return plan.chunks
+
+    def _start_read_pass(
         self,
-        variables: Sequence[dict[str, Any]],
-        *,
-        use_file_transfer: bool = True,
-    ) -> dict[str, Any]:
-        results: dict[str, Any] = {}
-        if not variables:
-            return results
-
-        for start in range(0, len(variables), 64):
-            chunk = list(variables[start : start + 64])
-            payload = self._build_read_payload(chunk)
-
-            try:
-                response = self._send_frame(0x0500, payload)
-                raw_payload = response.data if response is not None else b""
-            except SSCPCommandError as err:
-                if err.error_code == 0x010E and use_file_transfer:
-                    file_payload = self.read_file("/var/direct")
-                    raw_payload = file_payload["data"]
-                else:
-                    raise
+        variables: Sequence[dict[str, Any]] | SSCPReadPlan,
+        use_file_transfer: bool,
+    ) -> SSCPReadPass:
+        if not isinstance(variables, SSCPReadPlan):
+            return SSCPReadPass(deque(self._read_chunks(variables)), use_file_transfer)
+        chunks = self._compiled_read_chunks(variables)
+        if self.read_quarantine:
+            chunks = self._without_quarantined_reads(chunks)
+        return SSCPReadPass(deque(chunks), use_file_transfer, isolate_failures=True)
+
+    def _read_ref(self, variable: dict[str, Any]) -> tuple[int, int, int]:
+        return int(variable["uid"]), int(variable.get("offset", 0)), self._resolved_length(variable)
+
+    def _without_quarantined_reads(self, chunks: Sequence[SSCPReadChunk]) -> list[SSCPReadChunk]:
+        """Repack chunks that hold quarantined references; those due for a re-probe are read alone."""
+        now = monotonic()
+        planned: list[SSCPReadChunk] = []
+        probes: dict[tuple[int, int, int], list[dict[str, Any]]] = {}
+        for chunk in chunks:
+            healthy: list[dict[str, Any]] = []
+            for variable in chunk.variables:
+                ref = self._read_ref(variable)
+                entry = self.read_quarantine.get(ref)
+                if entry is None:
+                    healthy.append(variable)
+                elif entry.retry_at <= now:
+                    probes.setdefault(ref, []).append(variable)
+            if len(healthy) == len(chunk.variables):
+                planned.append(chunk)
+            elif healthy:
+                planned.extend(self._read_chunks(healthy))
+        for variables in probes.values():
+            planned.extend(self._read_chunks(variables))
+        return planned
+
+    def _isolate_read_failure(self, chunk: SSCPReadChunk, err: SSCPCommandError) -> list[SSCPReadChunk] | None:
+        """Bisect a chunk the PLC rejects because of one of its references; quarantine a lone culprit."""
+        if err.error_code not in ISOLATABLE_READ_ERRORS:
+            return None
+        refs: dict[tuple[int, int, int], list[dict[str, Any]]] = {}
+        for variable in chunk.variables:
+            refs.setdefault(self._read_ref(variable), []).append(variable)
+        if len(refs) > 1:
+            groups = list(refs.values())
+            half = len(groups) // 2
+            return [
+                *self._read_chunks([variable for group in groups[:half] for variable in group]),
+                *self._read_chunks([variable for group in groups[half:] for variable in group]),
+            ]
 
-            raw_values = self._split_raw_values(raw_payload, chunk)
-            for variable, raw_value in zip(chunk, raw_values, strict=True):
-                key = str(
-                    variable.get("key")
-                    or variable.get("name_vlist")
-                    or variable.get("name")
-                    or f"{variable['uid']}:{variable.get('offset', 0)}"
-                )
-                results[key] = self._decode_value(raw_value, str(variable["type"]))
+        (ref, variables), = refs.items()
+        entry = self.read_quarantine.get(ref)
+        if entry is None:
+            uid, offset, length = ref
+            entry = SSCPQuarantinedRead(
+                uid=uid,
+                offset=offset,
+                length=length,
+                keys=[self._variable_result_key(variable) for variable in variables],
+                error=str(err),
+            )
+            self.read_quarantine[ref] = entry
+            _LOGGER.warning(
+                "PLC %s rejects reading %s (uid %s, offset %s, length %s): %s; skipping it in polls",
+                self.name_plc,
+                ", ".join(entry.keys),
+                uid,
+                offset,
+                length,
+                err,
+            )
+        entry.failures += 1
+        entry.error = str(err)
+        entry.retry_at = monotonic() + min(
+            QUARANTINE_MAX_RETRY_SECONDS,
+            QUARANTINE_RETRY_SECONDS * 2 ** (entry.failures - 1),
+        )
+        return []
+
+    def _release_quarantined_reads(self, chunk: SSCPReadChunk) -> None:
+        for variable in chunk.variables:
+            entry = self.read_quarantine.pop(self._read_ref(variable), None)
+            if entry is not None:
+                _LOGGER.info("PLC %s serves %s again", self.name_plc, ", ".join(entry.keys))
+
+    def _requeue_failed_read(self, chunk: SSCPReadChunk, err: SSCPCommandError, read_pass: SSCPReadPass) -> bool:
+        """Queue smaller chunks for a refused read; False leaves the error to the caller."""
+        smaller_chunks = self._split_read_chunk(chunk, err)
+        if smaller_chunks is None and read_pass.isolate_failures:
+            smaller_chunks = self._isolate_read_failure(chunk, err)
+        if smaller_chunks is None:
+            return False
+        read_pass.pending.extendleft(reversed(smaller_chunks))
+        return True
+
+    def quarantined_reads(self) -> list[dict[str, Any]]:
+        return [entry.as_dict() for entry in self.read_quarantine.values()]
+
+    def _read_chunk_payload(self, chunk: SSCPReadChunk, use_file_transfer: bool) -> tuple[bytes, bool]:
+        if chunk.file_mode and not use_file_transfer:
+            return self._build_range_payload(chunk.ranges, file_mode=False), False
+        return chunk.payload, chunk.file_mode
+
+    def _split_read_chunk(self, chunk: SSCPReadChunk, err: SSCPCommandError) -> list[SSCPReadChunk] | None:
+        """Lower the per-frame variable limit when the PLC reports VariableCountLimitExceed."""
+        if err.error_code != 0x0110 or len(chunk.ranges) <= 1:
+            return None
+        self.read_variable_limit = max(1, len(chunk.ranges) // 2)
+        _LOGGER.debug("PLC %s limits reads to %d variables per frame", self.name_plc, self.read_variable_limit)
+        return self._read_chunks(chunk.variables)
+
+    def _variable_result_key(self, variable: dict[str, Any]) -> str:
+        return str(
+            variable.get("key")
+            or variable.get("name_vlist")
+            or variable.get("name")
+            or f"{variable['uid']}:{variable.get('offset', 0)}"
+        )
 
-        return results
+    def _decode_read_chunk(
+        self,
+        raw_payload: bytes,
+        chunk: SSCPReadChunk,
+        results: dict[str, Any],
+    ) -> None:
+        if len(raw_payload) < chunk.response_size:
+            raise SSCPProtocolError("Variable response payload is shorter than expected.")
+        if len(raw_payload) != chunk.response_size:
+            _LOGGER.debug(
+                "Read payload contains %d trailing bytes after decoding %d variables.",
+                len(raw_payload) - chunk.response_size,
+                len(chunk.variables),
+            )
 
-    def read_variable(self, uid: int, offset: int, length: int, type_data: str) -> Any:
-        result = self.read_variables(
-            [
-                {
-                    "uid": uid,
-                    "offset": offset,
-                    "length": length,
-                    "type": type_data,
-                    "key": "__single__",
-                }
-            ]
-        )
-        return result["__single__"]
+        if len(chunk.decoders) == 1:
+            decoder, start = chunk.decoders[0]
+            values = decoder.unpack_from(raw_payload, start)
+        else:
+            values = []
+            for decoder, start in chunk.decoders:
+                values.extend(decoder.unpack_from(raw_payload, start))
+        if chunk.converters:
+            values = list(values)
+            for index, converter in chunk.converters:
+                values[index] = converter(values[index])
+        results.update(zip(chunk.keys, values))
+        for index, key in chunk.aliases:
+            results[key] = values[index]
+        if self.read_quarantine:
+            self._release_quarantined_reads(chunk)
+
+    def _single_read_request(self, uid: int, offset: int, length: int, type_data: str) -> dict[str, Any]:
+        return {
+            "uid": uid,
+            "offset": offset,
+            "length": length,
+            "type": type_data,
+            "key": "__single__",
+        }
 
     def _build_write_payload(
         self,
@@ -1081,6 +1544,339 @@ class SSCPClient:
 
         return bytes(payload), bytes(data_blob)
 
+    def write_payload_size(self, variables: Sequence[dict[str, Any]]) -> int:
+        """Return the size of the direct-mode 0x0510 payload that would carry variables."""
+        return len(self._build_write_payload(variables, file_mode=False)[0])
+
+    def _plan_write_chunk(
+        self,
+        chunk: Sequence[dict[str, Any]],
+        *,
+        use_file_transfer: bool,
+    ) -> tuple[bytes, bytes | None]:
+        """Return the 0x0510 payload and the /var/direct blob when file mode is needed."""
+        direct_payload, raw_values = self._build_write_payload(chunk, file_mode=False)
+        if len(direct_payload) <= self.max_data_size:
+            return direct_payload, None
+        if not use_file_transfer:
+            raise ValueError("Write payload is too large for direct mode and file transfer is disabled.")
+        file_payload, raw_values = self._build_write_payload(chunk, file_mode=True)
+        return file_payload, raw_values
+
+    def _single_write_request(
+        self,
+        uid: int,
+        value: Any,
+        *,
+        offset: int,
+        length: int,
+        type_data: str,
+    ) -> dict[str, Any]:
+        variable_length = length or TYPE_LENGTHS.get(type_data.upper(), length or 1)
+        return {
+            "uid": uid,
+            "offset": offset,
+            "length": variable_length,
+            "type": type_data,
+            "value": value,
+        }
+
+    def link_state(self) -> dict[str, Any]:
+        return {"circuit": self.breaker.as_dict(), **self.rtt.as_dict()}
+
+    def capabilities(self) -> dict[str, Any]:
+        return {
+            "protocol_version": self.protocol_version,
+            "server_max_data_size": self.server_max_data_size,
+            "client_max_data_size": self.client_max_data_size,
+            "read_variable_limit": self.read_variable_limit,
+            "right_group": self.right_group,
+            "right_group_label": self.right_group_label,
+            "image_guid": self.image_guid,
+            "device_tags": self.device_tags,
+        }
+
+
+class SSCPClient(SSCPClientBase):
+    """Blocking SSCP client used from executor threads and the config flow."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int | str,
+        username: str,
+        password: str,
+        sscp_address: str | int,
+        name_plc: str,
+    ) -> None:
+        super().__init__(host, port, username, password, sscp_address, name_plc)
+        self.socket: socket.socket | None = None
+        self._frame_reader = SSCPFrameReader()
+        self._lock = threading.RLock()
+
+    def connect(self) -> None:
+        with self._lock:
+            if self.connected and self.socket is not None:
+                return
+            _LOGGER.debug("Connecting to SSCP server at %s:%s", self.host, self.port)
+            self.socket = socket.create_connection(
+                (self.host, self.port),
+                timeout=self.rtt.timeout,
+            )
+            self._frame_reader = SSCPFrameReader()
+            self.connected = True
+            self.loggedin = False
+
+    def disconnect(self) -> None:
+        with self._lock:
+            if self.socket is not None:
+                try:
+                    self.socket.close()
+                except OSError:
+                    pass
+            self.socket = None
+            self.connected = False
+            self.loggedin = False
+
+    def reconnect(self) -> None:
+        with self._lock:
+            self.disconnect()
+            self.connect()
+            self.login()
+
+    def ensure_connected(self) -> None:
+        if not self.connected or self.socket is None:
+            self.connect()
+        if not self.loggedin:
+            self.login()
+
+    def _require_socket(self) -> socket.socket:
+        if self.socket is None:
+            raise SSCPConnectionError("Socket is not connected.")
+        return self.socket
+
+    def _read_frame(self) -> SSCPResponse:
+        sock = self._require_socket()
+        reader = self._frame_reader
+        while (response := reader.next_frame()) is None:
+            received = sock.recv_into(reader.get_buffer())
+            if not received:
+                raise SSCPConnectionError("Connection closed by remote host.")
+            reader.advance(received)
+        return response
+
+    def _send_frame(
+        self,
+        function_id: int,
+        data: bytes = b"",
+        *,
+        expect_response: bool = True,
+        require_login: bool = True,
+    ) -> SSCPResponse | None:
+        self.breaker.check(allow_probe=True)
+        try:
+            response = self._transmit(
+                function_id,
+                data,
+                expect_response=expect_response,
+                require_login=require_login,
+            )
+        except (OSError, SSCPConnectionError) as err:
+            self.breaker.record_failure(err)
+            if isinstance(err, SSCPConnectionError):
+                raise
+            raise SSCPConnectionError(str(err) or type(err).__name__) from err
+        except SSCPError:
+            self.breaker.record_success()
+            raise
+        self.breaker.record_success()
+        return response
+
+    def _transmit(
+        self,
+        function_id: int,
+        data: bytes = b"",
+        *,
+        expect_response: bool = True,
+        require_login: bool = True,
+    ) -> SSCPResponse | None:
+        attempts = 2 if require_login else 1
+        last_error: Exception | None = None
+
+        for attempt in range(attempts):
+            with self._lock:
+                if require_login:
+                    self.ensure_connected()
+                elif not self.connected or self.socket is None:
+                    self.connect()
+
+                frame = self._build_frame(function_id, data)
+
+                try:
+                    sock = self._require_socket()
+                    sock.settimeout(self.rtt.timeout)
+                    started = perf_counter()
+                    sock.sendall(frame)
+                    if not expect_response:
+                        return None
+                    response = self._read_frame()
+                    self.rtt.add_sample(perf_counter() - started)
+                    self._validate_response(function_id, response)
+                    return response
+                except (BrokenPipeError, ConnectionResetError, TimeoutError, OSError) as err:
+                    if isinstance(err, TimeoutError):
+                        self.rtt.record_timeout()
+                    last_error = err
+                    self.disconnect()
+                    if attempt + 1 < attempts:
+                        continue
+                    raise SSCPConnectionError(str(err)) from err
+
+        if last_error is not None:
+            raise SSCPConnectionError(str(last_error)) from last_error
+        raise SSCPConnectionError("Unable to communicate with PLC.")
+
+    def login(self) -> dict[str, Any]:
+        try:
+            response = self._transmit(0x0100, self._build_login_payload(), require_login=False)
+        except SSCPCommandError as err:
+            if not self._downgrade_client_max_data_size(err):
+                raise
+            response = self._transmit(0x0100, self._build_login_payload(), require_login=False)
+        return self._apply_login_response(response)
+
+    def logout(self) -> None:
+        if not self.connected:
+            return
+        try:
+            self._send_frame(0x0101, expect_response=False)
+        finally:
+            self.disconnect()
+
+    def get_basic_info(self, *, requested_size: int = 0, start_offset: int = 0) -> dict[str, Any]:
+        response = self._send_frame(
+            0x0000,
+            self._build_basic_info_payload(requested_size, start_offset),
+            require_login=requested_size != 0,
+        )
+        return self._parse_basic_info(response)
+
+    def get_plc_statistics(self) -> dict[str, Any]:
+        response = self._send_frame(0x0300)
+        if response is None:
+            return {}
+        return self._parse_plc_statistics(response.data)
+
+    def get_task_statistics(self, task_id: int) -> dict[str, Any]:
+        response = self._send_frame(0x0301, bytes([task_id]))
+        if response is None:
+            return {}
+        return self._parse_task_statistics(response.data)
+
+    def get_channel_statistics(self, channel: str | int) -> dict[str, Any]:
+        channel_id = self._channel_id(channel)
+        response = self._send_frame(0x0310, struct.pack(">I", channel_id))
+        if response is None:
+            return {}
+        return self._parse_channel_statistics(channel_id, response.data)
+
+    def get_time(self, mode: str = "utc") -> datetime | None:
+        response = self._send_frame(0x0604, self._build_get_time_payload(mode))
+        if response is None or not response.data:
+            return None
+        return ticks_to_datetime(struct.unpack(">Q", response.data)[0])
+
+    def get_time_offset(self, mode: str = "timezone") -> timedelta | None:
+        response = self._send_frame(0x0604, self._build_get_time_offset_payload(mode))
+        if response is None or not response.data:
+            return None
+        return ticks_to_timedelta(struct.unpack(">Q", response.data)[0])
+
+    def set_time(self, value: datetime, mode: str = "utc") -> None:
+        self._send_frame(0x0604, self._build_set_time_payload(value, mode))
+
+    def sync_time(self, mode: str = "utc") -> datetime:
+        now = self._sync_time_target(mode)
+        self.set_time(now, mode=mode)
+        refreshed = self.get_time(mode="utc" if mode == "utc" else "local")
+        return refreshed or now
+
+    def write_file(
+        self,
+        file_name: str,
+        data: bytes,
+        *,
+        timestamp: datetime | None = None,
+        chunk_size: int | None = None,
+    ) -> None:
+        self._send_frame(0x0200, self._build_file_send_payload(file_name, len(data), timestamp))
+
+        effective_chunk = self._file_chunk_size(chunk_size)
+        offset = 0
+        while offset < len(data):
+            chunk = data[offset : offset + effective_chunk]
+            response = self._send_frame(0x0201, struct.pack(">I", offset) + chunk)
+            self._check_chunk_acknowledgement(response, offset)
+            offset += len(chunk)
+
+        finish_payload = struct.pack(">H", crc16(data))
+        self._send_frame(0x0202, finish_payload)
+
+    def read_file(self, file_name: str) -> dict[str, Any]:
+        response = self._send_frame(0x0210, self._build_file_receive_payload(file_name))
+        total_size, timestamp, expected_crc = self._parse_file_receive_header(response)
+
+        offset = 0
+        received = bytearray()
+        while offset < total_size:
+            chunk_response = self._send_frame(0x0211, struct.pack(">I", offset))
+            chunk = self._parse_file_chunk(chunk_response, offset)
+            if not chunk:
+                break
+            received.extend(chunk)
+            offset += len(chunk)
+
+        return self._finish_file_read(file_name, total_size, timestamp, expected_crc, received)
+
+    def read_variables(
+        self,
+        variables: Sequence[dict[str, Any]] | SSCPReadPlan,
+        *,
+        use_file_transfer: bool = True,
+    ) -> dict[str, Any]:
+        if not variables:
+            return {}
+
+        with self._lock:
+            self.ensure_connected()
+        read_pass = self._start_read_pass(variables, use_file_transfer)
+        results = read_pass.results
+        while read_pass.pending:
+            chunk = read_pass.pending.popleft()
+            payload, file_mode = self._read_chunk_payload(chunk, use_file_transfer)
+
+            try:
+                response = self._send_frame(0x0500, payload)
+                raw_payload = response.data if response is not None else b""
+            except SSCPCommandError as err:
+                if self._requeue_failed_read(chunk, err, read_pass):
+                    continue
+                if err.error_code == 0x010E and use_file_transfer:
+                    file_mode = True
+                    raw_payload = b""
+                else:
+                    raise
+
+            if file_mode and not raw_payload:
+                raw_payload = self.read_file("/var/direct")["data"]
+            self._decode_read_chunk(raw_payload, chunk, results)
+
+        return results
+
+    def read_variable(self, uid: int, offset: int, length: int, type_data: str) -> Any:
+        result = self.read_variables([self._single_read_request(uid, offset, length, type_data)])
+        return result["__single__"]
+
     def write_variables(
         self,
         variables: Sequence[dict[str, Any]],
@@ -1090,20 +1886,12 @@ class SSCPClient:
         if not variables:
             return
 
-        for start in range(0, len(variables), 64):
-            chunk = list(variables[start : start + 64])
-            direct_payload, raw_values = self._build_write_payload(chunk, file_mode=False)
-            file_mode = len(direct_payload) > self.max_data_size
-
-            if file_mode and not use_file_transfer:
-                raise ValueError("Write payload is too large for direct mode and file transfer is disabled.")
-
-            if file_mode:
-                file_payload, raw_values = self._build_write_payload(chunk, file_mode=True)
-                self.write_file("/var/direct", raw_values)
-                self._send_frame(0x0510, file_payload)
-            else:
-                self._send_frame(0x0510, direct_payload)
+        for start in range(0, len(variables), WRITE_VARIABLE_LIMIT):
+            chunk = list(variables[start : start + WRITE_VARIABLE_LIMIT])
+            payload, file_blob = self._plan_write_chunk(chunk, use_file_transfer=use_file_transfer)
+            if file_blob is not None:
+                self.write_file("/var/direct", file_blob)
+            self._send_frame(0x0510, payload)
 
     def write_variable(
         self,
@@ -1114,26 +1902,14 @@ class SSCPClient:
         length: int = 0,
         type_data: str = "BYTE",
     ) -> None:
-        variable_length = length or TYPE_LENGTHS.get(type_data.upper(), length or 1)
         self.write_variables(
             [
-                {
-                    "uid": uid,
-                    "offset": offset,
-                    "length": variable_length,
-                    "type": type_data,
-                    "value": value,
-                }
+                self._single_write_request(
+                    uid,
+                    value,
+                    offset=offset,
+                    length=length,
+                    type_data=type_data,
+                )
             ]
         )
-
-    def capabilities(self) -> dict[str, Any]:
-        return {
-            "protocol_version": self.protocol_version,
-            "server_max_data_size": self.server_max_data_size,
-            "client_max_data_size": self.client_max_data_size,
-            "right_group": self.right_group,
-            "right_group_label": self.right_group_label,
-            "image_guid": self.image_guid,
-            "device_tags": self.device_tags,
-        }
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Sequence
+
+from .const import DEFAULT_PIPELINE_DEPTH, DEFAULT_SESSION_COUNT, MAX_SESSION_COUNT
+from .sscp_async_client import AsyncSSCPClient
+from .sscp_client import (
+    PRIORITY_POLL,
+    SSCPCommandError,
+    SSCPConnectionError,
+    SSCPError,
+    SSCPReadPass,
+    SSCPReadPlan,
+    request_priority,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AsyncSSCPClientPool(AsyncSSCPClient):
+    """Async SSCP client that spreads read chunks over several sessions to the same PLC.
+
+    The pool itself is the primary session and keeps serving writes, file transfer
+    and diagnostics. Secondary sessions are opened on demand for polls that plan
+    more than one chunk; when the PLC refuses a session, the pool shrinks to the
+    number of sessions it actually accepted.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int | str,
+        username: str,
+        password: str,
+        sscp_address: str | int,
+        name_plc: str,
+        *,
+        session_count: int = DEFAULT_SESSION_COUNT,
+        pipeline_depth: int = DEFAULT_PIPELINE_DEPTH,
+        shared_gateway: bool = True,
+    ) -> None:
+        super().__init__(
+            host,
+            port,
+            username,
+            password,
+            sscp_address,
+            name_plc,
+            pipeline_depth=pipeline_depth,
+            shared_gateway=shared_gateway,
+        )
+        self.session_limit = max(1, min(MAX_SESSION_COUNT, int(session_count)))
+        self._sessions: list[AsyncSSCPClient] = []
+
+    def _new_session(self) -> AsyncSSCPClient:
+        session = AsyncSSCPClient(
+            self.host,
+            self.port,
+            self.username,
+            self.password,
+            self.sscp_address,
+            self.name_plc,
+            pipeline_depth=self.pipeline_depth,
+            # Parallel reads need sockets of their own; a shared gateway would serialize them again.
+            shared_gateway=False,
+        )
+        session.read_quarantine = self.read_quarantine
+        return session
+
+    async def _async_open_sessions(self, wanted: int) -> list[AsyncSSCPClient]:
+        """Return up to wanted logged-in secondary sessions, shrinking the limit on refusal.
+
+        Only a login the PLC answers with a command error counts as refused; link
+        errors leave the limit alone and the session is tried again on a later poll.
+        """
+        wanted = min(wanted, self.session_limit - 1)
+        while len(self._sessions) < wanted:
+            self._sessions.append(self._new_session())
+
+        sessions = self._sessions[:wanted]
+        outcomes = await asyncio.gather(
+            *(session._async_ensure_session() for session in sessions),
+            return_exceptions=True,
+        )
+        ready: list[AsyncSSCPClient] = []
+        refused: list[AsyncSSCPClient] = []
+        for session, outcome in zip(sessions, outcomes):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, (OSError, SSCPError)):
+                    raise outcome
+                await session.async_disconnect()
+                # A PLC out of sessions answers the login with a command error, e.g. 0x0119.
+                if isinstance(outcome, SSCPCommandError):
+                    refused.append(session)
+                else:
+                    _LOGGER.debug("Secondary SSCP session to %s failed: %s", self.name_plc, outcome)
+                continue
+            ready.append(session)
+
+        if refused:
+            limit = 1 + len(sessions) - len(refused)
+            _LOGGER.warning(
+                "PLC %s refused %s of %s SSCP sessions; limiting the pool to %s",
+                self.name_plc,
+                len(refused),
+                1 + len(sessions),
+                limit,
+            )
+            self.session_limit = limit
+            kept = [session for session in self._sessions if session not in refused]
+            for session in kept[limit - 1 :]:
+                await session.async_disconnect()
+            self._sessions = kept[: limit - 1]
+        return ready
+
+    async def _async_drain_chunks(self, session: AsyncSSCPClient, read_pass: SSCPReadPass) -> None:
+        while read_pass.pending:
+            window = session._take_read_window(read_pass.pending)
+            try:
+                await session._async_read_window(window, read_pass)
+            except SSCPConnectionError:
+                if session is self:
+                    raise
+                # Another session, or the primary once all have finished, reads the chunks instead.
+                read_pass.pending.extendleft(reversed(window))
+                await session.async_disconnect()
+                return
+
+    async def async_read_variables(
+        self,
+        variables: Sequence[dict[str, Any]] | SSCPReadPlan,
+        *,
+        use_file_transfer: bool = True,
+    ) -> dict[str, Any]:
+        if self.session_limit <= 1:
+            return await super().async_read_variables(variables, use_file_transfer=use_file_transfer)
+
+        if not variables:
+            return {}
+
+        with request_priority(PRIORITY_POLL):
+            await self._async_ensure_session()
+            read_pass = self._start_read_pass(variables, use_file_transfer)
+            if len(read_pass.pending) > 1:
+                sessions = await self._async_open_sessions(len(read_pass.pending) - 1)
+            else:
+                sessions = []
+
+            try:
+                async with asyncio.TaskGroup() as group:
+                    for session in (self, *sessions):
+                        group.create_task(self._async_drain_chunks(session, read_pass))
+            except ExceptionGroup as err:
+                raise err.exceptions[0]
+            # A secondary session may have requeued chunks after the primary already ran out of work.
+            await self._async_drain_chunks(self, read_pass)
+
+        return read_pass.results
+
+    async def async_disconnect(self) -> None:
+        for session in self._sessions:
+            await session.async_disconnect()
+        await super().async_disconnect()
+
+    def capabilities(self) -> dict[str, Any]:
+        return {
+            **super().capabilities(),
+            "session_limit": self.session_limit,
+            "open_sessions": 1 + sum(1 for session in self._sessions if session.loggedin),
+        }
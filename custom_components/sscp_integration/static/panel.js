@@ -203,6 +203,12 @@ const LOCK_STATE_OPTIONS = ["locked", "unlocked", "locking", "unlocking", "jamme
 const VALVE_DEVICE_CLASS_OPTIONS = ["water", "gas"];
 const VACUUM_STATUS_OPTIONS = ["cleaning", "docked", "returning", "idle", "paused", "error"];
 const SCHEDULER_DAY_LABELS = ["Pondeli", "Utery", "Streda", "Ctvrtek", "Patek", "Sobota", "Nedele"];
+const SCAN_CLASS_OPTIONS = [
+  ["fast", "rychle cteni"],
+  ["normal", "bezne cteni"],
+  ["slow", "pomale cteni"],
+  ["on_demand", "jen na vyzadani"],
+];
 
 const escapeHtml = (value) =>
   String(value ?? "")
@@ -305,6 +311,8 @@ class SSCPIntegrationPanel extends HTMLElement {
       max_value: "",
       step: "",
       mode: "box",
+      write_interval_ms: "",
+      always_write: false,
       error: "",
     };
     this._treeBasicPopup = this._treeBasicPopupDefaults();
@@ -602,6 +610,26 @@ class SSCPIntegrationPanel extends HTMLElement {
     return match?.name || areaId || "";
   }
 
+  _renderScanClassSelect(section, key, scanClass) {
+    const selected = scanClass || "normal";
+    return `
+      <select class="scan-class-select" data-section="${escapeHtml(section)}" data-key="${escapeHtml(key || "")}" title="Jak casto se hodnoty entity ctou z PLC">
+        ${SCAN_CLASS_OPTIONS.map(
+          ([value, label]) => `<option value="${value}" ${value === selected ? "selected" : ""}>${label}</option>`,
+        ).join("")}
+      </select>
+    `;
+  }
+
+  _renderAlwaysWriteToggle(section, key, alwaysWrite) {
+    return `
+      <label class="checkbox-field always-write-toggle" title="Zapisovat i hodnoty, ktere PLC podle posledniho cteni uz ma">
+        <input class="always-write-input" type="checkbox" data-section="${escapeHtml(section)}" data-key="${escapeHtml(key || "")}" ${alwaysWrite ? "checked" : ""}>
+        <span>Vzdy zapisovat</span>
+      </label>
+    `;
+  }
+
   _renderAreaField(fieldId, selectedAreaId, helpText) {
     const areaId = String(selectedAreaId || "");
     if (!this._areas.length) {
@@ -1105,6 +1133,13 @@ class SSCPIntegrationPanel extends HTMLElement {
       webpanel_connection: entry?.webpanel_connection || "defaultConnection",
       webpanel_scheme: entry?.webpanel_scheme || "http",
       scan_interval: String(entry?.scan_interval ?? 5),
+      session_count: String(entry?.session_count ?? 1),
+      pipeline_depth: String(entry?.pipeline_depth ?? 1),
+      write_coalesce_ms: String(entry?.write_coalesce_ms ?? 20),
+      redundant_write_max_age: String(entry?.redundant_write_max_age ?? 0),
+      fast_scan_interval_ms: String(entry?.fast_scan_interval_ms ?? 200),
+      slow_scan_interval: String(entry?.slow_scan_interval ?? 60),
+      shared_gateway: entry?.shared_gateway ?? true,
       vlist_file_name: entry?.vlist_summary?.file_name || "",
       ...draft,
     };
@@ -1237,6 +1272,7 @@ class SSCPIntegrationPanel extends HTMLElement {
       area_id: "",
       suggested_display_precision: "",
       brightness_scale: "100",
+      write_interval_ms: "",
       min_mireds: "153",
       max_mireds: "500",
       power_name: "",
@@ -1265,6 +1301,7 @@ class SSCPIntegrationPanel extends HTMLElement {
           ? String(light.suggested_display_precision)
           : "";
       popup.brightness_scale = light.brightness_scale !== null && light.brightness_scale !== undefined ? String(light.brightness_scale) : "100";
+      popup.write_interval_ms = light.write_interval_ms ? String(light.write_interval_ms) : "";
       popup.min_mireds = light.min_mireds !== null && light.min_mireds !== undefined ? String(light.min_mireds) : "153";
       popup.max_mireds = light.max_mireds !== null && light.max_mireds !== undefined ? String(light.max_mireds) : "500";
       popup.power_name = light.power_name || "";
@@ -1794,7 +1831,9 @@ class SSCPIntegrationPanel extends HTMLElement {
       max_value: draft.max_value || "",
       step: draft.step || "",
       mode: draft.mode || "box",
+      write_interval_ms: draft.write_interval_ms || "",
       press_time: draft.press_time || "",
+      always_write: Boolean(draft.always_write),
     };
   }
 
@@ -1819,6 +1858,8 @@ class SSCPIntegrationPanel extends HTMLElement {
       max_value: "",
       step: "",
       mode: "box",
+      write_interval_ms: "",
+      always_write: false,
       error: "",
     };
     this._treeSensorPopup = {
@@ -1866,6 +1907,8 @@ class SSCPIntegrationPanel extends HTMLElement {
       max_value: "",
       step: "",
       mode: "box",
+      write_interval_ms: "",
+      always_write: false,
       error: "",
     };
     this._render();
@@ -1902,6 +1945,8 @@ class SSCPIntegrationPanel extends HTMLElement {
       max_value: "",
       step: "",
       mode: "box",
+      write_interval_ms: "",
+      always_write: false,
       error: "",
     };
     this._render();
@@ -1935,6 +1980,8 @@ class SSCPIntegrationPanel extends HTMLElement {
       max_value: "",
       step: "",
       mode: "box",
+      write_interval_ms: "",
+      always_write: false,
       error: "",
     };
     this._render();
@@ -1969,6 +2016,8 @@ class SSCPIntegrationPanel extends HTMLElement {
       max_value: state.max_value || "",
       step: state.step || "",
       mode: state.mode || "box",
+      write_interval_ms: state.write_interval_ms || "",
+      always_write: Boolean(state.always_write),
       error: "",
     };
     this._treeSelectPopup = { open: false, variable_name: "", variable_entry_key: "", select_options_raw: "", error: "" };
@@ -2002,6 +2051,8 @@ class SSCPIntegrationPanel extends HTMLElement {
       max_value: variable.max_value !== null && variable.max_value !== undefined ? String(variable.max_value) : "",
       step: variable.step !== null && variable.step !== undefined ? String(variable.step) : "",
       mode: variable.mode || "box",
+      write_interval_ms: variable.write_interval_ms ? String(variable.write_interval_ms) : "",
+      always_write: Boolean(variable.always_write),
       error: "",
     };
     this._treeSelectPopup = { open: false, variable_name: "", variable_entry_key: "", select_options_raw: "", error: "" };
@@ -2032,6 +2083,8 @@ class SSCPIntegrationPanel extends HTMLElement {
       max_value: "",
       step: "",
       mode: "box",
+      write_interval_ms: "",
+      always_write: false,
       error: "",
     };
     this._render();
@@ -2046,6 +2099,7 @@ class SSCPIntegrationPanel extends HTMLElement {
       display_name: "",
       area_id: "",
       press_time: "",
+      always_write: false,
       error: "",
     };
   }
@@ -2060,6 +2114,7 @@ class SSCPIntegrationPanel extends HTMLElement {
       display_name: state.display_name || "",
       area_id: state.area_id || "",
       press_time: state.press_time || "",
+      always_write: Boolean(state.always_write),
       error: "",
     };
     this._treeSelectPopup = { open: false, variable_name: "", variable_entry_key: "", select_options_raw: "", error: "" };
@@ -2086,6 +2141,8 @@ class SSCPIntegrationPanel extends HTMLElement {
       max_value: "",
       step: "",
       mode: "box",
+      write_interval_ms: "",
+      always_write: false,
       error: "",
     };
     this._render();
@@ -2100,6 +2157,7 @@ class SSCPIntegrationPanel extends HTMLElement {
       display_name: variable.name || "",
       area_id: variable.area_id || "",
       press_time: variable.press_time !== null && variable.press_time !== undefined ? String(variable.press_time) : "",
+      always_write: Boolean(variable.always_write),
       error: "",
     };
     this._treeSelectPopup = { open: false, variable_name: "", variable_entry_key: "", select_options_raw: "", error: "" };
@@ -2126,6 +2184,8 @@ class SSCPIntegrationPanel extends HTMLElement {
       max_value: "",
       step: "",
       mode: "box",
+      write_interval_ms: "",
+      always_write: false,
       error: "",
     };
     this._render();
@@ -2195,6 +2255,13 @@ class SSCPIntegrationPanel extends HTMLElement {
         webpanel_connection: field("#cfg-webpanel-connection")?.value || "defaultConnection",
         webpanel_scheme: field("#cfg-webpanel-scheme")?.value || "http",
         scan_interval: field("#cfg-scan")?.value || "5",
+        session_count: field("#cfg-sessions")?.value || "1",
+        pipeline_depth: field("#cfg-pipeline")?.value || "1",
+        write_coalesce_ms: field("#cfg-write-window")?.value || "20",
+        redundant_write_max_age: field("#cfg-redundant-writes")?.value || "0",
+        fast_scan_interval_ms: field("#cfg-scan-fast")?.value || "200",
+        slow_scan_interval: field("#cfg-scan-slow")?.value || "60",
+        shared_gateway: field("#cfg-shared-gateway")?.checked ?? true,
         vlist_file_name: field("#cfg-vlist")?.value || "",
       };
     }
@@ -2297,6 +2364,10 @@ class SSCPIntegrationPanel extends HTMLElement {
       const popupMax = field("#tree-number-popup-max")?.value ?? this._treeNumberPopup.max_value ?? "";
       const popupStep = field("#tree-number-popup-step")?.value ?? this._treeNumberPopup.step ?? "";
       const popupMode = field("#tree-number-popup-mode")?.value ?? this._treeNumberPopup.mode ?? "box";
+      const popupWriteInterval =
+        field("#tree-number-popup-write-interval")?.value ?? this._treeNumberPopup.write_interval_ms ?? "";
+      const popupAlwaysWrite =
+        field("#tree-number-popup-always-write")?.checked ?? this._treeNumberPopup.always_write ?? false;
       currentTreeDrafts[this._treeNumberPopup.variable_name] = {
         ...(currentTreeDrafts[this._treeNumberPopup.variable_name] || {}),
         entity_type: "number",
@@ -2308,6 +2379,8 @@ class SSCPIntegrationPanel extends HTMLElement {
         max_value: popupMax,
         step: popupStep,
         mode: popupMode,
+        write_interval_ms: popupWriteInterval,
+        always_write: popupAlwaysWrite,
       };
       this._treeNumberPopup = {
         ...this._treeNumberPopup,
@@ -2319,24 +2392,30 @@ class SSCPIntegrationPanel extends HTMLElement {
         max_value: popupMax,
         step: popupStep,
         mode: popupMode,
+        write_interval_ms: popupWriteInterval,
+        always_write: popupAlwaysWrite,
       };
     }
     if (this._treeBasicPopup.open && this._treeBasicPopup.variable_name) {
       const popupDisplayName = field("#tree-basic-popup-display-name")?.value ?? this._treeBasicPopup.display_name ?? "";
       const popupAreaId = field("#tree-basic-popup-area")?.value ?? this._treeBasicPopup.area_id ?? "";
       const popupPressTime = field("#tree-basic-popup-press-time")?.value ?? this._treeBasicPopup.press_time ?? "";
+      const popupAlwaysWrite =
+        field("#tree-basic-popup-always-write")?.checked ?? this._treeBasicPopup.always_write ?? false;
       currentTreeDrafts[this._treeBasicPopup.variable_name] = {
         ...(currentTreeDrafts[this._treeBasicPopup.variable_name] || {}),
         entity_type: this._treeBasicPopup.entity_type || "switch",
         display_name: popupDisplayName,
         area_id: popupAreaId,
         press_time: popupPressTime,
+        always_write: popupAlwaysWrite,
       };
       this._treeBasicPopup = {
         ...this._treeBasicPopup,
         display_name: popupDisplayName,
         area_id: popupAreaId,
         press_time: popupPressTime,
+        always_write: popupAlwaysWrite,
       };
     }
     if (this._composerVariablePicker.open) {
@@ -2377,6 +2456,7 @@ class SSCPIntegrationPanel extends HTMLElement {
         suggested_display_precision:
           field("#light-popup-precision")?.value ?? this._lightPopup.suggested_display_precision ?? "",
         brightness_scale: field("#light-popup-brightness-scale")?.value ?? this._lightPopup.brightness_scale ?? "100",
+        write_interval_ms: field("#light-popup-write-interval")?.value ?? this._lightPopup.write_interval_ms ?? "",
         min_mireds: field("#light-popup-min-mireds")?.value ?? this._lightPopup.min_mireds ?? "153",
         max_mireds: field("#light-popup-max-mireds")?.value ?? this._lightPopup.max_mireds ?? "500",
         power_name: field("#light-popup-power")?.value ?? this._lightPopup.power_name ?? "",
@@ -2743,6 +2823,11 @@ class SSCPIntegrationPanel extends HTMLElement {
               </select>
               <small class="field-help"><code>box</code> = prime zadani hodnoty, <code>slider</code> = posuvnik.</small>
             </label>
+            <label><span>Interval zapisu ms</span><input id="tree-number-popup-write-interval" type="number" min="0" step="1" placeholder="0" value="${escapeHtml(this._treeNumberPopup.write_interval_ms || "")}"><small class="field-help">Pri tazeni posuvniku se do PLC zapisuje jen posledni hodnota nejvyse jednou za tento interval. Prazdne nebo <code>0</code> = zapisovat kazdou zmenu hned.</small></label>
+            <label class="checkbox-field">
+              <input id="tree-number-popup-always-write" type="checkbox" ${this._treeNumberPopup.always_write ? "checked" : ""}>
+              <span>Vzdy zapisovat, i kdyz PLC uz hodnotu ma</span>
+            </label>
             ${this._renderAreaField(
               "tree-number-popup-area",
               this._treeNumberPopup.area_id,
@@ -2816,6 +2901,16 @@ class SSCPIntegrationPanel extends HTMLElement {
                 `
                 : ""
             }
+            ${
+              entityType === "switch" || entityType === "light"
+                ? `
+                  <label class="checkbox-field">
+                    <input id="tree-basic-popup-always-write" type="checkbox" ${this._treeBasicPopup.always_write ? "checked" : ""}>
+                    <span>Vzdy zapisovat, i kdyz PLC uz hodnotu ma</span>
+                  </label>
+                `
+                : ""
+            }
           </div>
           ${this._treeBasicPopup.error ? `<p class="error">${escapeHtml(this._treeBasicPopup.error)}</p>` : ""}
           <div class="inline-actions modal-actions">
@@ -3015,6 +3110,8 @@ class SSCPIntegrationPanel extends HTMLElement {
               <p class="muted">unit ${escapeHtml(formatUnitLabel(item.temperature_unit || "°C"))} | area ${escapeHtml(this._areaName(item.area_id) || "-")}</p>
             </div>
             <div class="entity-actions">
+              ${this._renderScanClassSelect("climate_entities", item.entity_key, item.scan_class)}
+              ${this._renderAlwaysWriteToggle("climate_entities", item.entity_key, item.always_write)}
               <button class="secondary" data-action="edit-climate-entity" data-key="${escapeHtml(item.entity_key || "")}">Upravit</button>
               <button class="secondary" data-action="delete-climate-entity" data-key="${escapeHtml(item.entity_key || "")}">Smazat</button>
             </div>
@@ -3198,6 +3295,8 @@ class SSCPIntegrationPanel extends HTMLElement {
               ${metadata ? `<p class="muted">${escapeHtml(metadata)}</p>` : ""}
             </div>
             <div class="entity-actions">
+              ${this._renderScanClassSelect("light_entities", item.entity_key, item.scan_class)}
+              ${this._renderAlwaysWriteToggle("light_entities", item.entity_key, item.always_write)}
               <button class="secondary" data-action="edit-light-entity" data-key="${escapeHtml(item.entity_key || "")}">Upravit</button>
               <button class="secondary" data-action="delete-light-entity" data-key="${escapeHtml(item.entity_key || "")}">Smazat</button>
             </div>
@@ -3251,6 +3350,7 @@ class SSCPIntegrationPanel extends HTMLElement {
             ${this._renderAreaField("light-popup-area", this._lightPopup.area_id, "Oblast v Home Assistantu, pod kterou se ma light entita priradit.")}
             <label><span>Presnost zobrazeni</span><input id="light-popup-precision" type="number" min="0" step="1" value="${escapeHtml(this._lightPopup.suggested_display_precision)}"><small class="field-help">Doporucena presnost pri prevodu hodnot, hlavne u procentnich nebo desetinnnych pointu.</small></label>
             <label><span>Brightness scale</span><input id="light-popup-brightness-scale" type="number" min="1" step="any" value="${escapeHtml(this._lightPopup.brightness_scale)}"><small class="field-help">Maksimum PLC hodnoty jasu. HA si ji prevede na interni rozsah 0-255.</small></label>
+            <label><span>Interval zapisu jasu ms</span><input id="light-popup-write-interval" type="number" min="0" step="1" placeholder="0" value="${escapeHtml(this._lightPopup.write_interval_ms || "")}"><small class="field-help">Pri tazeni jasu se do PLC zapisuje jen posledni hodnota nejvyse jednou za tento interval. Prazdne nebo <code>0</code> = zapisovat kazdou zmenu hned.</small></label>
             <label><span>Min mireds</span><input id="light-popup-min-mireds" type="number" min="1" step="1" value="${escapeHtml(this._lightPopup.min_mireds)}"><small class="field-help">Nejmensi podporovana hodnota color temperature v mireds.</small></label>
             <label><span>Max mireds</span><input id="light-popup-max-mireds" type="number" min="1" step="1" value="${escapeHtml(this._lightPopup.max_mireds)}"><small class="field-help">Nejvyssi podporovana hodnota color temperature v mireds.</small></label>
             ${this._renderVariableInputField("light-popup-power", "Power point", this._lightPopup.power_name, "Volitelny zapinaci point. Kdyz chybi, svetlo muze byt rizene jen jasem nebo white hodnotou.", "Technology.Room.Point", { popup_key: "light", field_key: "power_name" })}
@@ -3322,6 +3422,8 @@ class SSCPIntegrationPanel extends HTMLElement {
               ${metadata ? `<p class="muted">${escapeHtml(metadata)}</p>` : ""}
             </div>
             <div class="entity-actions">
+              ${this._renderScanClassSelect("cover_entities", item.entity_key, item.scan_class)}
+              ${this._renderAlwaysWriteToggle("cover_entities", item.entity_key, item.always_write)}
               <button class="secondary" data-action="edit-cover-entity" data-key="${escapeHtml(item.entity_key || "")}">Upravit</button>
               <button class="secondary" data-action="delete-cover-entity" data-key="${escapeHtml(item.entity_key || "")}">Smazat</button>
             </div>
@@ -3445,6 +3547,8 @@ class SSCPIntegrationPanel extends HTMLElement {
               ${metadata ? `<p class="muted">${escapeHtml(metadata)}</p>` : ""}
             </div>
             <div class="entity-actions">
+              ${this._renderScanClassSelect("vacuum_entities", item.entity_key, item.scan_class)}
+              ${this._renderAlwaysWriteToggle("vacuum_entities", item.entity_key, item.always_write)}
               <button class="secondary" data-action="edit-vacuum-entity" data-key="${escapeHtml(item.entity_key || "")}">Upravit</button>
               <button class="secondary" data-action="delete-vacuum-entity" data-key="${escapeHtml(item.entity_key || "")}">Smazat</button>
             </div>
@@ -3560,6 +3664,8 @@ class SSCPIntegrationPanel extends HTMLElement {
               ${metadata ? `<p class="muted">${escapeHtml(metadata)}</p>` : ""}
             </div>
             <div class="entity-actions">
+              ${this._renderScanClassSelect("fan_entities", item.entity_key, item.scan_class)}
+              ${this._renderAlwaysWriteToggle("fan_entities", item.entity_key, item.always_write)}
               <button class="secondary" data-action="edit-fan-entity" data-key="${escapeHtml(item.entity_key || "")}">Upravit</button>
               <button class="secondary" data-action="delete-fan-entity" data-key="${escapeHtml(item.entity_key || "")}">Smazat</button>
             </div>
@@ -3673,6 +3779,8 @@ class SSCPIntegrationPanel extends HTMLElement {
               ${metadata ? `<p class="muted">${escapeHtml(metadata)}</p>` : ""}
             </div>
             <div class="entity-actions">
+              ${this._renderScanClassSelect("humidifier_entities", item.entity_key, item.scan_class)}
+              ${this._renderAlwaysWriteToggle("humidifier_entities", item.entity_key, item.always_write)}
               <button class="secondary" data-action="edit-humidifier-entity" data-key="${escapeHtml(item.entity_key || "")}">Upravit</button>
               <button class="secondary" data-action="delete-humidifier-entity" data-key="${escapeHtml(item.entity_key || "")}">Smazat</button>
             </div>
@@ -3790,6 +3898,8 @@ class SSCPIntegrationPanel extends HTMLElement {
               ${metadata ? `<p class="muted">${escapeHtml(metadata)}</p>` : ""}
             </div>
             <div class="entity-actions">
+              ${this._renderScanClassSelect("water_heater_entities", item.entity_key, item.scan_class)}
+              ${this._renderAlwaysWriteToggle("water_heater_entities", item.entity_key, item.always_write)}
               <button class="secondary" data-action="edit-water-heater-entity" data-key="${escapeHtml(item.entity_key || "")}">Upravit</button>
               <button class="secondary" data-action="delete-water-heater-entity" data-key="${escapeHtml(item.entity_key || "")}">Smazat</button>
             </div>
@@ -3908,6 +4018,8 @@ class SSCPIntegrationPanel extends HTMLElement {
               ${metadata ? `<p class="muted">${escapeHtml(metadata)}</p>` : ""}
             </div>
             <div class="entity-actions">
+              ${this._renderScanClassSelect("lock_entities", item.entity_key, item.scan_class)}
+              ${this._renderAlwaysWriteToggle("lock_entities", item.entity_key, item.always_write)}
               <button class="secondary" data-action="edit-lock-entity" data-key="${escapeHtml(item.entity_key || "")}">Upravit</button>
               <button class="secondary" data-action="delete-lock-entity" data-key="${escapeHtml(item.entity_key || "")}">Smazat</button>
             </div>
@@ -4012,6 +4124,8 @@ class SSCPIntegrationPanel extends HTMLElement {
               ${metadata ? `<p class="muted">${escapeHtml(metadata)}</p>` : ""}
             </div>
             <div class="entity-actions">
+              ${this._renderScanClassSelect("valve_entities", item.entity_key, item.scan_class)}
+              ${this._renderAlwaysWriteToggle("valve_entities", item.entity_key, item.always_write)}
               <button class="secondary" data-action="edit-valve-entity" data-key="${escapeHtml(item.entity_key || "")}">Upravit</button>
               <button class="secondary" data-action="delete-valve-entity" data-key="${escapeHtml(item.entity_key || "")}">Smazat</button>
             </div>
@@ -4122,6 +4236,8 @@ class SSCPIntegrationPanel extends HTMLElement {
               ${metadata ? `<p class="muted">${escapeHtml(metadata)}</p>` : ""}
             </div>
             <div class="entity-actions">
+              ${this._renderScanClassSelect("siren_entities", item.entity_key, item.scan_class)}
+              ${this._renderAlwaysWriteToggle("siren_entities", item.entity_key, item.always_write)}
               <button class="secondary" data-action="edit-siren-entity" data-key="${escapeHtml(item.entity_key || "")}">Upravit</button>
               <button class="secondary" data-action="delete-siren-entity" data-key="${escapeHtml(item.entity_key || "")}">Smazat</button>
             </div>
@@ -4225,6 +4341,7 @@ class SSCPIntegrationPanel extends HTMLElement {
               ${metadata ? `<p class="muted">${escapeHtml(metadata)}</p>` : ""}
             </div>
             <div class="entity-actions">
+              ${this._renderScanClassSelect("scheduler_entities", item.entity_key, item.scan_class)}
               <button class="secondary" data-action="edit-scheduler-entity" data-key="${escapeHtml(item.entity_key || "")}">Upravit</button>
               <button class="secondary" data-action="delete-scheduler-entity" data-key="${escapeHtml(item.entity_key || "")}">Smazat</button>
             </div>
@@ -4534,6 +4651,7 @@ class SSCPIntegrationPanel extends HTMLElement {
               ${metadataBits(item) ? `<p class="muted">${escapeHtml(metadataBits(item))}</p>` : ""}
             </div>
             <div class="entity-actions">
+              ${item.entity_type === "button" ? "" : this._renderScanClassSelect("variables", item.key, item.scan_class)}
               <button class="secondary" data-action="edit-variable" data-key="${escapeHtml(item.key)}">Upravit</button>
               <button class="secondary" data-action="delete-variable" data-key="${escapeHtml(item.key)}">Smazat</button>
             </div>
@@ -4982,6 +5100,16 @@ class SSCPIntegrationPanel extends HTMLElement {
             <small class="field-help">Vol protokol, pod kterym bezi WebPanel.</small>
           </label>
           <label><span>Polling s</span><input id="cfg-scan" type="number" min="1" max="300" value="${escapeHtml(config.scan_interval)}"><small class="field-help">Interval hromadneho cteni hodnot v sekundach.</small></label>
+          <label><span>Rychle cteni ms</span><input id="cfg-scan-fast" type="number" min="50" max="5000" value="${escapeHtml(config.fast_scan_interval_ms)}"><small class="field-help">Interval pro entity s rychlym ctenim, napr. tlacitka na zdi.</small></label>
+          <label><span>Pomale cteni s</span><input id="cfg-scan-slow" type="number" min="1" max="3600" value="${escapeHtml(config.slow_scan_interval)}"><small class="field-help">Interval pro entity s pomalym ctenim, napr. konfiguracni parametry.</small></label>
+          <label id="cfg-sessions-wrapper"><span>SSCP sessions</span><input id="cfg-sessions" type="number" min="1" max="8" value="${escapeHtml(config.session_count)}"><small class="field-help">Pocet soubeznych SSCP spojeni pro paralelni cteni. PLC muze prijmout mene.</small></label>
+          <label id="cfg-write-window-wrapper"><span>Write okno ms</span><input id="cfg-write-window" type="number" min="0" max="500" value="${escapeHtml(config.write_coalesce_ms)}"><small class="field-help">Zapisy z vice entit behem tohoto okna se odeslou spolecne, napr. pri aktivaci sceny. 0 = vypnuto.</small></label>
+          <label id="cfg-redundant-writes-wrapper"><span>Preskakovat stejne zapisy s</span><input id="cfg-redundant-writes" type="number" min="0" max="3600" value="${escapeHtml(config.redundant_write_max_age)}"><small class="field-help">Zapis hodnoty, kterou PLC podle cteni mladsiho nez tento pocet sekund uz obsahuje, se neodesle. 0 = vypnuto.</small></label>
+          <label id="cfg-pipeline-wrapper"><span>Pipelining</span><input id="cfg-pipeline" type="number" min="1" max="8" value="${escapeHtml(config.pipeline_depth)}"><small class="field-help">Pocet cteni odeslanych najednou bez cekani na odpoved. 1 = vypnuto; PLC bez podpory se samo vrati na 1.</small></label>
+          <label class="checkbox-field" id="cfg-shared-gateway-wrapper">
+            <input id="cfg-shared-gateway" type="checkbox" ${config.shared_gateway ? "checked" : ""}>
+            <span>Sdilet TCP spojeni brany s dalsimi PLC na stejnem host:port</span>
+          </label>
           <label>
             <span>VList file</span>
             <select id="cfg-vlist">
@@ -5332,6 +5460,8 @@ class SSCPIntegrationPanel extends HTMLElement {
           max_value: "",
           step: "",
           mode: "box",
+          write_interval_ms: "",
+          always_write: false,
           error: "",
         };
         this._treeBasicPopup = this._treeBasicPopupDefaults();
@@ -5401,6 +5531,26 @@ class SSCPIntegrationPanel extends HTMLElement {
       };
     });
 
+    this.shadowRoot.querySelectorAll(".always-write-input").forEach((node) => {
+      node.onchange = async () => {
+        await this._runAction("set_always_write", {
+          section: node.dataset.section || "",
+          key: node.dataset.key || "",
+          always_write: node.checked,
+        });
+      };
+    });
+
+    this.shadowRoot.querySelectorAll(".scan-class-select").forEach((node) => {
+      node.onchange = async () => {
+        await this._runAction("set_scan_class", {
+          section: node.dataset.section || "",
+          key: node.dataset.key || "",
+          scan_class: node.value,
+        });
+      };
+    });
+
     this._syncManualEntityOptions();
     this._syncTreeSelectOptionVisibility();
 
@@ -5754,6 +5904,8 @@ class SSCPIntegrationPanel extends HTMLElement {
           const maxValue = this._treeNumberPopup.max_value === "" ? null : Number(this._treeNumberPopup.max_value);
           const stepValue = this._treeNumberPopup.step === "" ? null : Number(this._treeNumberPopup.step);
           const modeValue = this._treeNumberPopup.mode || "box";
+          const writeIntervalRaw = this._treeNumberPopup.write_interval_ms;
+          const writeIntervalValue = writeIntervalRaw === "" ? null : Number(writeIntervalRaw);
 
           if (precisionValue !== null && (!Number.isInteger(precisionValue) || precisionValue < 0)) {
             this._treeNumberPopup = {
@@ -5787,6 +5939,14 @@ class SSCPIntegrationPanel extends HTMLElement {
             this._render();
             return;
           }
+          if (writeIntervalValue !== null && (!Number.isInteger(writeIntervalValue) || writeIntervalValue < 0)) {
+            this._treeNumberPopup = {
+              ...this._treeNumberPopup,
+              error: "Interval zapisu musi byt cele cislo 0 nebo vetsi.",
+            };
+            this._render();
+            return;
+          }
 
           const result = await this._runAction(
             variableEntryKey ? "update_variable" : "add_variable",
@@ -5801,6 +5961,8 @@ class SSCPIntegrationPanel extends HTMLElement {
                   max_value: maxValue,
                   step: stepValue,
                   mode: modeValue,
+                  write_interval_ms: writeIntervalValue,
+                  always_write: Boolean(this._treeNumberPopup.always_write),
                 }
               : {
                   variable_name: variableName,
@@ -5813,6 +5975,8 @@ class SSCPIntegrationPanel extends HTMLElement {
                   max_value: maxValue,
                   step: stepValue,
                   mode: modeValue,
+                  write_interval_ms: writeIntervalValue,
+                  always_write: Boolean(this._treeNumberPopup.always_write),
                 },
             { refreshBrowser: true },
           );
@@ -5831,6 +5995,8 @@ class SSCPIntegrationPanel extends HTMLElement {
                 max_value: this._treeNumberPopup.max_value || "",
                 step: this._treeNumberPopup.step || "",
                 mode: this._treeNumberPopup.mode || "box",
+                write_interval_ms: this._treeNumberPopup.write_interval_ms || "",
+                always_write: Boolean(this._treeNumberPopup.always_write),
               },
             };
             this._treeNumberPopup = {
@@ -5845,6 +6011,8 @@ class SSCPIntegrationPanel extends HTMLElement {
               max_value: "",
               step: "",
               mode: "box",
+              write_interval_ms: "",
+              always_write: false,
               error: "",
             };
             this._render();
@@ -5860,6 +6028,8 @@ class SSCPIntegrationPanel extends HTMLElement {
           const displayName = (this._treeBasicPopup.display_name || "").trim();
           const pressTimeRaw = this._treeBasicPopup.press_time;
           const pressTime = pressTimeRaw === "" ? null : Number(pressTimeRaw);
+          const alwaysWrite =
+            entityType === "switch" || entityType === "light" ? Boolean(this._treeBasicPopup.always_write) : undefined;
 
           if (pressTime !== null && (Number.isNaN(pressTime) || pressTime <= 0)) {
             this._treeBasicPopup = {
@@ -5878,6 +6048,7 @@ class SSCPIntegrationPanel extends HTMLElement {
                   display_name: displayName || undefined,
                   area_id: this._treeBasicPopup.area_id || "",
                   press_time: entityType === "button" ? pressTime : undefined,
+                  always_write: alwaysWrite,
                 }
               : {
                   variable_name: variableName,
@@ -5885,6 +6056,7 @@ class SSCPIntegrationPanel extends HTMLElement {
                   display_name: displayName || undefined,
                   area_id: this._treeBasicPopup.area_id || "",
                   press_time: entityType === "button" ? pressTime : undefined,
+                  always_write: alwaysWrite,
                 },
             { refreshBrowser: true },
           );
@@ -5898,6 +6070,7 @@ class SSCPIntegrationPanel extends HTMLElement {
                 display_name: displayName,
                 area_id: this._treeBasicPopup.area_id || "",
                 press_time: this._treeBasicPopup.press_time || "",
+                always_write: Boolean(this._treeBasicPopup.always_write),
               },
             };
             this._treeBasicPopup = this._treeBasicPopupDefaults();
@@ -5976,6 +6149,8 @@ class SSCPIntegrationPanel extends HTMLElement {
             this._lightPopup.brightness_scale === "" ? null : Number(this._lightPopup.brightness_scale);
           const minMireds = this._lightPopup.min_mireds === "" ? null : Number(this._lightPopup.min_mireds);
           const maxMireds = this._lightPopup.max_mireds === "" ? null : Number(this._lightPopup.max_mireds);
+          const writeInterval =
+            this._lightPopup.write_interval_ms === "" ? null : Number(this._lightPopup.write_interval_ms);
 
           if (!this._lightPopup.name.trim()) {
             this._lightPopup = { ...this._lightPopup, error: "Light entita potrebuje nazev." };
@@ -5992,6 +6167,11 @@ class SSCPIntegrationPanel extends HTMLElement {
             this._render();
             return;
           }
+          if (writeInterval !== null && (!Number.isInteger(writeInterval) || writeInterval < 0)) {
+            this._lightPopup = { ...this._lightPopup, error: "Interval zapisu jasu musi byt cele cislo 0 nebo vetsi." };
+            this._render();
+            return;
+          }
           if ((minMireds !== null && (!Number.isInteger(minMireds) || minMireds <= 0)) || (maxMireds !== null && (!Number.isInteger(maxMireds) || maxMireds <= 0))) {
             this._lightPopup = { ...this._lightPopup, error: "Min a Max mireds musi byt kladna cela cisla." };
             this._render();
@@ -6009,6 +6189,7 @@ class SSCPIntegrationPanel extends HTMLElement {
             area_id: this._lightPopup.area_id || "",
             suggested_display_precision: precisionValue,
             brightness_scale: brightnessScale,
+            write_interval_ms: writeInterval,
             min_mireds: minMireds,
             max_mireds: maxMireds,
             power_name: this._lightPopup.power_name || "",
@@ -6453,6 +6634,8 @@ class SSCPIntegrationPanel extends HTMLElement {
             max_value: "",
             step: "",
             mode: "box",
+            write_interval_ms: "",
+            always_write: false,
             error: "",
           };
           this._treeBasicPopup = this._treeBasicPopupDefaults();
@@ -6480,6 +6663,13 @@ class SSCPIntegrationPanel extends HTMLElement {
               webpanel_connection: this.shadowRoot.querySelector("#cfg-webpanel-connection")?.value || "defaultConnection",
               webpanel_scheme: this.shadowRoot.querySelector("#cfg-webpanel-scheme")?.value || "http",
               scan_interval: Number(this.shadowRoot.querySelector("#cfg-scan")?.value || 5),
+              session_count: Number(this.shadowRoot.querySelector("#cfg-sessions")?.value || 1),
+              pipeline_depth: Number(this.shadowRoot.querySelector("#cfg-pipeline")?.value || 1),
+              write_coalesce_ms: Number(this.shadowRoot.querySelector("#cfg-write-window")?.value || 20),
+              redundant_write_max_age: Number(this.shadowRoot.querySelector("#cfg-redundant-writes")?.value || 0),
+              fast_scan_interval_ms: Number(this.shadowRoot.querySelector("#cfg-scan-fast")?.value || 200),
+              slow_scan_interval: Number(this.shadowRoot.querySelector("#cfg-scan-slow")?.value || 60),
+              shared_gateway: this.shadowRoot.querySelector("#cfg-shared-gateway")?.checked ?? true,
               vlist_file_name: this.shadowRoot.querySelector("#cfg-vlist")?.value || "",
               configuration_mode: "vlist",
             },
@@ -6823,6 +7013,9 @@ class SSCPIntegrationPanel extends HTMLElement {
     };
 
     toggle("#cfg-sscp-address-wrapper", mode === "sscp");
+    toggle("#cfg-sessions-wrapper", mode === "sscp");
+    toggle("#cfg-pipeline-wrapper", mode === "sscp");
+    toggle("#cfg-shared-gateway-wrapper", mode === "sscp");
     toggle("#cfg-webpanel-connection-wrapper", mode === "webpanel_api");
     toggle("#cfg-webpanel-scheme-wrapper", mode === "webpanel_api");
   }
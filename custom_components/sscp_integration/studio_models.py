@@ -4,6 +4,8 @@ from collections.abc import Iterable, Iterator
 import re
 from typing import Any
 
+from .const import SCAN_CLASS_NORMAL, SCAN_CLASSES
+
 
 def make_variable_key(variable: dict[str, Any]) -> str:
     return (
@@ -25,6 +27,11 @@ def build_variable_ref(variable: dict[str, Any] | None) -> dict[str, Any] | None
     }
 
 
+def normalize_scan_class(value: Any) -> str:
+    normalized = str(value or "").strip().lower()
+    return normalized if normalized in SCAN_CLASSES else SCAN_CLASS_NORMAL
+
+
 def variable_ref_name(variable: dict[str, Any] | None) -> str:
     if not variable:
         return ""
@@ -36,6 +43,8 @@ def climate_entity_payload(entity: dict[str, Any]) -> dict[str, Any]:
         "entity_key": entity.get("entity_key"),
         "name": entity.get("name"),
         "area_id": entity.get("area_id"),
+        "scan_class": normalize_scan_class(entity.get("scan_class")),
+        "always_write": bool(entity.get("always_write")),
         "temperature_unit": entity.get("temperature_unit"),
         "suggested_display_precision": entity.get("suggested_display_precision"),
         "min_temp": entity.get("min_temp"),
@@ -57,6 +66,8 @@ def light_entity_payload(entity: dict[str, Any]) -> dict[str, Any]:
         "entity_key": entity.get("entity_key"),
         "name": entity.get("name"),
         "area_id": entity.get("area_id"),
+        "scan_class": normalize_scan_class(entity.get("scan_class")),
+        "always_write": bool(entity.get("always_write")),
         "suggested_display_precision": entity.get("suggested_display_precision"),
         "brightness_scale": entity.get("brightness_scale"),
         "min_mireds": entity.get("min_mireds"),
@@ -72,6 +83,7 @@ def light_entity_payload(entity: dict[str, Any]) -> dict[str, Any]:
         "white_name": variable_ref_name(entity.get("white_var")),
         "effect_name": variable_ref_name(entity.get("effect_var")),
         "effect_map": dict(entity.get("effect_map") or {}),
+        "write_interval_ms": entity.get("write_interval_ms") or 0,
     }
 
 
@@ -80,6 +92,8 @@ def cover_entity_payload(entity: dict[str, Any]) -> dict[str, Any]:
         "entity_key": entity.get("entity_key"),
         "name": entity.get("name"),
         "area_id": entity.get("area_id"),
+        "scan_class": normalize_scan_class(entity.get("scan_class")),
+        "always_write": bool(entity.get("always_write")),
         "device_class": entity.get("device_class"),
         "invert_position": bool(entity.get("invert_position")),
         "current_position_name": variable_ref_name(entity.get("current_position_var")),
@@ -100,6 +114,8 @@ def vacuum_entity_payload(entity: dict[str, Any]) -> dict[str, Any]:
         "entity_key": entity.get("entity_key"),
         "name": entity.get("name"),
         "area_id": entity.get("area_id"),
+        "scan_class": normalize_scan_class(entity.get("scan_class")),
+        "always_write": bool(entity.get("always_write")),
         "status_name": variable_ref_name(entity.get("status_var")),
         "battery_level_name": variable_ref_name(entity.get("battery_level_var")),
         "battery_charging_name": variable_ref_name(entity.get("battery_charging_var")),
@@ -119,6 +135,8 @@ def fan_entity_payload(entity: dict[str, Any]) -> dict[str, Any]:
         "entity_key": entity.get("entity_key"),
         "name": entity.get("name"),
         "area_id": entity.get("area_id"),
+        "scan_class": normalize_scan_class(entity.get("scan_class")),
+        "always_write": bool(entity.get("always_write")),
         "percentage_step": entity.get("percentage_step"),
         "power_name": variable_ref_name(entity.get("power_var")),
         "percentage_name": variable_ref_name(entity.get("percentage_var")),
@@ -135,6 +153,8 @@ def humidifier_entity_payload(entity: dict[str, Any]) -> dict[str, Any]:
         "entity_key": entity.get("entity_key"),
         "name": entity.get("name"),
         "area_id": entity.get("area_id"),
+        "scan_class": normalize_scan_class(entity.get("scan_class")),
+        "always_write": bool(entity.get("always_write")),
         "device_class": entity.get("device_class"),
         "min_humidity": entity.get("min_humidity"),
         "max_humidity": entity.get("max_humidity"),
@@ -152,6 +172,8 @@ def water_heater_entity_payload(entity: dict[str, Any]) -> dict[str, Any]:
         "entity_key": entity.get("entity_key"),
         "name": entity.get("name"),
         "area_id": entity.get("area_id"),
+        "scan_class": normalize_scan_class(entity.get("scan_class")),
+        "always_write": bool(entity.get("always_write")),
         "temperature_unit": entity.get("temperature_unit"),
         "suggested_display_precision": entity.get("suggested_display_precision"),
         "min_temp": entity.get("min_temp"),
@@ -170,6 +192,8 @@ def lock_entity_payload(entity: dict[str, Any]) -> dict[str, Any]:
         "entity_key": entity.get("entity_key"),
         "name": entity.get("name"),
         "area_id": entity.get("area_id"),
+        "scan_class": normalize_scan_class(entity.get("scan_class")),
+        "always_write": bool(entity.get("always_write")),
         "state_name": variable_ref_name(entity.get("state_var")),
         "lock_name": variable_ref_name(entity.get("lock_var")),
         "unlock_name": variable_ref_name(entity.get("unlock_var")),
@@ -183,6 +207,8 @@ def valve_entity_payload(entity: dict[str, Any]) -> dict[str, Any]:
         "entity_key": entity.get("entity_key"),
         "name": entity.get("name"),
         "area_id": entity.get("area_id"),
+        "scan_class": normalize_scan_class(entity.get("scan_class")),
+        "always_write": bool(entity.get("always_write")),
         "device_class": entity.get("device_class"),
         "invert_position": bool(entity.get("invert_position")),
         "current_position_name": variable_ref_name(entity.get("current_position_var")),
@@ -198,6 +224,8 @@ def siren_entity_payload(entity: dict[str, Any]) -> dict[str, Any]:
         "entity_key": entity.get("entity_key"),
         "name": entity.get("name"),
         "area_id": entity.get("area_id"),
+        "scan_class": normalize_scan_class(entity.get("scan_class")),
+        "always_write": bool(entity.get("always_write")),
         "state_name": variable_ref_name(entity.get("state_var")),
         "turn_on_name": variable_ref_name(entity.get("turn_on_var")),
         "turn_off_name": variable_ref_name(entity.get("turn_off_var")),
@@ -214,6 +242,7 @@ def scheduler_entity_payload(entity: dict[str, Any]) -> dict[str, Any]:
         "entity_key": entity.get("entity_key"),
         "name": entity.get("name"),
         "area_id": entity.get("area_id"),
+        "scan_class": normalize_scan_class(entity.get("scan_class")),
         "root_name": entity.get("root_name"),
         "kind": entity.get("kind"),
         "supports_exceptions": bool(entity.get("supports_exceptions")),
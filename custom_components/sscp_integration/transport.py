@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import Any, Protocol
 
 from .const import (
     COMM_MODE_SSCP,
     COMM_MODE_WEBPANEL,
     CONF_COMMUNICATION_MODE,
+    CONF_PIPELINE_DEPTH,
+    CONF_SESSION_COUNT,
+    CONF_SHARED_GATEWAY,
     CONF_WEBPANEL_CONNECTION,
     CONF_WEBPANEL_SCHEME,
+    DEFAULT_PIPELINE_DEPTH,
+    DEFAULT_SESSION_COUNT,
+    DEFAULT_SHARED_GATEWAY,
 )
 
 
@@ -33,6 +40,7 @@ class PLCClientProtocol(Protocol):
     def get_time_offset(self, mode: str = "timezone"): ...
     def sync_time(self, mode: str = "utc"): ...
     def read_variables(self, variables: list[dict[str, Any]]) -> dict[str, Any]: ...
+    def write_variables(self, variables: list[dict[str, Any]]) -> None: ...
     def write_variable(
         self,
         uid: int,
@@ -44,6 +52,46 @@ class PLCClientProtocol(Protocol):
     ) -> None: ...
 
 
+class AsyncPLCClientProtocol(Protocol):
+    host: str
+    port: int
+    connected: bool
+    loggedin: bool
+    right_group: int | None
+    right_group_label: str
+    transport_name: str
+
+    async def async_connect(self) -> None: ...
+    async def async_disconnect(self) -> None: ...
+    async def async_login(self) -> dict[str, Any]: ...
+    def capabilities(self) -> dict[str, Any]: ...
+    async def async_get_basic_info(self, *, requested_size: int = 0, start_offset: int = 0) -> dict[str, Any]: ...
+    async def async_get_plc_statistics(self) -> dict[str, Any]: ...
+    async def async_get_time(self, mode: str = "utc"): ...
+    async def async_set_time(self, value: Any, mode: str = "utc") -> None: ...
+    async def async_get_time_offset(self, mode: str = "timezone"): ...
+    async def async_sync_time(self, mode: str = "utc"): ...
+    async def async_read_variables(self, variables: list[dict[str, Any]]) -> dict[str, Any]: ...
+    async def async_write_variables(self, variables: list[dict[str, Any]]) -> None: ...
+    async def async_write_variable(
+        self,
+        uid: int,
+        value: Any,
+        *,
+        offset: int = 0,
+        length: int = 0,
+        type_data: str = "BYTE",
+    ) -> None: ...
+
+
+async def async_call_client(hass: Any, client: Any, method: str, *args: Any, **kwargs: Any) -> Any:
+    """Await the client's native coroutine or fall back to the executor for blocking clients."""
+    native = getattr(client, f"async_{method}", None)
+    if native is not None:
+        return await native(*args, **kwargs)
+    return await hass.async_add_executor_job(partial(getattr(client, method), *args, **kwargs))
+
+
 def communication_mode_from_data(data: dict[str, Any]) -> str:
     raw_mode = str(data.get(CONF_COMMUNICATION_MODE, COMM_MODE_SSCP) or COMM_MODE_SSCP).strip().lower()
     if raw_mode == COMM_MODE_WEBPANEL:
@@ -59,7 +107,7 @@ def has_connection_settings(data: dict[str, Any]) -> bool:
     return bool(host_ready and data.get("username") and data.get("sscp_address"))
 
 
-def build_client_from_entry_data(data: dict[str, Any]) -> PLCClientProtocol:
+def build_client_from_entry_data(data: dict[str, Any]) -> PLCClientProtocol | AsyncPLCClientProtocol:
     mode = communication_mode_from_data(data)
     if mode == COMM_MODE_WEBPANEL:
         from .webpanel_client import WebPanelClient
@@ -74,13 +122,33 @@ def build_client_from_entry_data(data: dict[str, Any]) -> PLCClientProtocol:
             connection_name=data.get(CONF_WEBPANEL_CONNECTION, "defaultConnection"),
         )
 
-    from .sscp_client import SSCPClient
+    session_count = int(data.get(CONF_SESSION_COUNT) or DEFAULT_SESSION_COUNT)
+    pipeline_depth = int(data.get(CONF_PIPELINE_DEPTH) or DEFAULT_PIPELINE_DEPTH)
+    shared_gateway = bool(data.get(CONF_SHARED_GATEWAY, DEFAULT_SHARED_GATEWAY))
+    if session_count > 1:
+        from .sscp_pool import AsyncSSCPClientPool
+
+        return AsyncSSCPClientPool(
+            data["host"],
+            data["port"],
+            data["username"],
+            data.get("password", ""),
+            data["sscp_address"],
+            data.get("PLC_Name", "PLC"),
+            session_count=session_count,
+            pipeline_depth=pipeline_depth,
+            shared_gateway=shared_gateway,
+        )
+
+    from .sscp_async_client import AsyncSSCPClient
 
-    return SSCPClient(
+    return AsyncSSCPClient(
         data["host"],
         data["port"],
         data["username"],
         data.get("password", ""),
         data["sscp_address"],
         data.get("PLC_Name", "PLC"),
+        pipeline_depth=pipeline_depth,
+        shared_gateway=shared_gateway,
     )
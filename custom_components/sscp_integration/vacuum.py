@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from functools import partial
 import logging
 from typing import Any
 
@@ -11,8 +10,8 @@ except ImportError:  # pragma: no cover
     from homeassistant.components.vacuum.const import VacuumEntityFeature
 
 from .const import DOMAIN
-from .coordinator import SSCPDataCoordinator, variable_key
-from .entity import async_apply_entity_area, build_plc_device_info
+from .coordinator import SSCPDataCoordinator
+from .entity import SSCPRefValues, SSCPWriteTransaction, async_apply_entity_area, build_plc_device_info, ref_data_keys
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -91,6 +90,7 @@ class SSCPComposedVacuum(StateVacuumEntity):
             "return_to_base_var": config.get("return_to_base_var"),
             "locate_var": config.get("locate_var"),
         }
+        self._values = SSCPRefValues(coordinator, self._refs)
         self._attr_name = str(config.get("name") or "Vacuum")
         self._attr_unique_id = f"{entry_id}_vacuum_{config.get('entity_key')}"
         self._attr_has_entity_name = False
@@ -106,34 +106,31 @@ class SSCPComposedVacuum(StateVacuumEntity):
     async def async_added_to_hass(self) -> None:
         if hasattr(self.coordinator, "async_add_listener"):
             self.async_on_remove(self.coordinator.async_add_listener(self.async_write_ha_state))
+            self.async_on_remove(
+                self.coordinator.async_add_key_listener(ref_data_keys(self._refs), self.async_write_ha_state)
+            )
         await async_apply_entity_area(self.hass, getattr(self, "entity_id", None), self._config.get("area_id"))
 
     @property
     def available(self) -> bool:
         return self.coordinator.last_update_success if self.coordinator else False
 
-    def _coordinator_value(self, ref: dict[str, Any] | None) -> Any:
-        if not isinstance(ref, dict):
-            return None
-        return self.coordinator.data.get(variable_key(ref))
-
-    async def _async_write_ref(self, ref: dict[str, Any] | None, raw_value: Any) -> None:
-        if not isinstance(ref, dict):
-            raise ValueError("Chybi datovy bod pro zapis.")
-        await self.hass.async_add_executor_job(
-            partial(
-                self._client.write_variable,
-                int(ref["uid"]),
-                _coerce_write_value(raw_value, str(ref["type"])),
-                offset=int(ref.get("offset", 0)),
-                length=int(ref.get("length", 1)),
-                type_data=str(ref["type"]),
-            )
+    async def _async_write_ref(self, ref: dict[str, Any] | None, raw_value: Any, *, force: bool = False) -> None:
+        writes = self._write_transaction()
+        writes.add(ref, raw_value, force=force)
+        await writes.async_commit()
+
+    def _write_transaction(self) -> SSCPWriteTransaction:
+        return SSCPWriteTransaction(
+            self.coordinator,
+            _coerce_write_value,
+            read_back=self._refs.values(),
+            force=bool(self._config.get("always_write")),
         )
 
     async def _async_trigger(self, ref_key: str) -> None:
-        await self._async_write_ref(self._refs.get(ref_key), True)
-        await self.coordinator.async_request_refresh()
+        # Commands are triggers; the PLC may not have reset the last one yet.
+        await self._async_write_ref(self._refs.get(ref_key), True, force=True)
 
     @property
     def supported_features(self) -> VacuumEntityFeature:
@@ -154,7 +151,7 @@ class SSCPComposedVacuum(StateVacuumEntity):
 
     @property
     def state(self) -> str | None:
-        raw_value = self._coordinator_value(self._refs.get("status_var"))
+        raw_value = self._values.get("status_var")
         if raw_value is None:
             return None
         if isinstance(raw_value, bool):
@@ -170,7 +167,7 @@ class SSCPComposedVacuum(StateVacuumEntity):
 
     @property
     def battery_level(self) -> int | None:
-        value = self._coordinator_value(self._refs.get("battery_level_var"))
+        value = self._values.get("battery_level_var")
         if value is None:
             return None
         return max(0, min(100, int(round(float(value)))))
@@ -182,14 +179,14 @@ class SSCPComposedVacuum(StateVacuumEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         attributes: dict[str, Any] = {}
-        charging = self._coordinator_value(self._refs.get("battery_charging_var"))
+        charging = self._values.get("battery_charging_var")
         if charging is not None:
             attributes["battery_charging"] = bool(charging)
         return attributes or None
 
     @property
     def fan_speed(self) -> str | None:
-        value = self._coordinator_value(self._refs.get("fan_speed_var"))
+        value = self._values.get("fan_speed_var")
         if value is None or not self._fan_speed_map:
             return None
         if isinstance(value, bool):
@@ -243,6 +240,5 @@ class SSCPComposedVacuum(StateVacuumEntity):
             if raw_value is None:
                 raise ValueError(f"Fan speed {fan_speed} neni v mapovani definovana.")
             await self._async_write_ref(self._refs.get("fan_speed_var"), raw_value)
-            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to set fan speed for vacuum %s: %s", self.name, err)
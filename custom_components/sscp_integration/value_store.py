@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
+
+from .const import SCAN_CLASS_NORMAL
+
+# Marks a slot whose data point the last poll did not read, e.g. a quarantined reference.
+_MISSING: Any = object()
+
+
+class SSCPDataPoint:
+    """One polled data point of a poll plan and the slot its value occupies in the store.
+
+    request is the dict handed to the client for reads; the client keeps decoding
+    through the chunk decoders its read plan precompiled for that request.
+    """
+
+    __slots__ = ("key", "uid", "offset", "length", "type", "slot", "request", "scan_class")
+
+    def __init__(self, request: dict[str, Any], slot: int, scan_class: str = SCAN_CLASS_NORMAL) -> None:
+        self.key: str = request["key"]
+        self.uid = int(request["uid"])
+        self.offset = int(request.get("offset", 0))
+        self.length = int(request.get("length", 1))
+        self.type = str(request.get("type", ""))
+        self.slot = slot
+        self.request = request
+        self.scan_class = scan_class
+
+    @property
+    def address(self) -> tuple[int, int, int]:
+        return self.uid, self.offset, self.length
+
+
+class SSCPValueStore(Mapping[str, Any]):
+    """Values of one poll plan in a list indexed by data point slot.
+
+    The coordinator fills the same store in place on every poll. Entities resolve
+    their key to a slot once and then read by index. Unread slots behave like
+    missing keys, so the store still reads like the dict the client returns.
+    """
+
+    __slots__ = ("_slots", "_values")
+
+    def __init__(self, slots: Mapping[str, int]) -> None:
+        self._slots = slots
+        self._values: list[Any] = [_MISSING] * len(slots)
+
+    def slot_of(self, key: str) -> int | None:
+        return self._slots.get(key)
+
+    def value_at(self, slot: int, default: Any = None) -> Any:
+        value = self._values[slot]
+        return default if value is _MISSING else value
+
+    def has_value_at(self, slot: int) -> bool:
+        return self._values[slot] is not _MISSING
+
+    def set_at(self, slot: int, value: Any) -> None:
+        self._values[slot] = value
+
+    def fill(self, values: Mapping[str, Any], points: Iterable[SSCPDataPoint] | None = None) -> list[str]:
+        """Replace the slots of points, or every slot, with the poll's value for its key or mark it unread.
+
+        Returns the keys whose value changed, including points that became unread.
+        """
+        stored = self._values
+        changed: list[str] = []
+        pairs = self._slots.items() if points is None else ((point.key, point.slot) for point in points)
+        for key, slot in pairs:
+            value = values.get(key, _MISSING)
+            previous = stored[slot]
+            if value is not previous and value != previous:
+                changed.append(key)
+            stored[slot] = value
+        return changed
+
+    def get(self, key: str, default: Any = None) -> Any:
+        slot = self._slots.get(key)
+        if slot is None:
+            return default
+        value = self._values[slot]
+        return default if value is _MISSING else value
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._values[self._slots[key]]
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._values[self._slots[key]] = value
+
+    def __contains__(self, key: object) -> bool:
+        slot = self._slots.get(key)  # type: ignore[call-overload]
+        return slot is not None and self._values[slot] is not _MISSING
+
+    def __iter__(self) -> Iterator[str]:
+        values = self._values
+        return (key for key, slot in self._slots.items() if values[slot] is not _MISSING)
+
+    def __len__(self) -> int:
+        return sum(1 for value in self._values if value is not _MISSING)
+
+    def __eq__(self, other: object) -> bool:
+        # The coordinator compares the store with itself after every in-place poll.
+        return self is other or super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from functools import partial
 import logging
 from typing import Any
 
@@ -11,8 +10,8 @@ except ImportError:  # pragma: no cover
     ValveDeviceClass = None
 
 from .const import DOMAIN
-from .coordinator import SSCPDataCoordinator, variable_key
-from .entity import async_apply_entity_area, build_plc_device_info
+from .coordinator import SSCPDataCoordinator
+from .entity import SSCPRefValues, SSCPWriteTransaction, async_apply_entity_area, build_plc_device_info, ref_data_keys
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -97,6 +96,7 @@ class SSCPComposedValve(ValveEntity):
             "close_var": config.get("close_var"),
             "stop_var": config.get("stop_var"),
         }
+        self._values = SSCPRefValues(coordinator, self._refs)
         self._attr_name = str(config.get("name") or "Valve")
         self._attr_unique_id = f"{entry_id}_valve_{config.get('entity_key')}"
         self._attr_has_entity_name = False
@@ -113,29 +113,26 @@ class SSCPComposedValve(ValveEntity):
     async def async_added_to_hass(self) -> None:
         if hasattr(self.coordinator, "async_add_listener"):
             self.async_on_remove(self.coordinator.async_add_listener(self.async_write_ha_state))
+            self.async_on_remove(
+                self.coordinator.async_add_key_listener(ref_data_keys(self._refs), self.async_write_ha_state)
+            )
         await async_apply_entity_area(self.hass, getattr(self, "entity_id", None), self._config.get("area_id"))
 
     @property
     def available(self) -> bool:
         return self.coordinator.last_update_success if self.coordinator else False
 
-    def _coordinator_value(self, ref: dict[str, Any] | None) -> Any:
-        if not isinstance(ref, dict):
-            return None
-        return self.coordinator.data.get(variable_key(ref))
-
-    async def _async_write_ref(self, ref: dict[str, Any] | None, raw_value: Any) -> None:
-        if not isinstance(ref, dict):
-            raise ValueError("Chybi datovy bod pro zapis.")
-        await self.hass.async_add_executor_job(
-            partial(
-                self._client.write_variable,
-                int(ref["uid"]),
-                _coerce_write_value(raw_value, str(ref["type"])),
-                offset=int(ref.get("offset", 0)),
-                length=int(ref.get("length", 1)),
-                type_data=str(ref["type"]),
-            )
+    async def _async_write_ref(self, ref: dict[str, Any] | None, raw_value: Any, *, force: bool = False) -> None:
+        writes = self._write_transaction()
+        writes.add(ref, raw_value, force=force)
+        await writes.async_commit()
+
+    def _write_transaction(self) -> SSCPWriteTransaction:
+        return SSCPWriteTransaction(
+            self.coordinator,
+            _coerce_write_value,
+            read_back=self._refs.values(),
+            force=bool(self._config.get("always_write")),
         )
 
     @property
@@ -153,9 +150,9 @@ class SSCPComposedValve(ValveEntity):
 
     @property
     def current_valve_position(self) -> int | None:
-        value = self._coordinator_value(self._refs.get("current_position_var"))
+        value = self._values.get("current_position_var")
         if value is None:
-            value = self._coordinator_value(self._refs.get("target_position_var"))
+            value = self._values.get("target_position_var")
         return _normalize_position(value, self._invert)
 
     @property
@@ -168,31 +165,28 @@ class SSCPComposedValve(ValveEntity):
     async def async_open_valve(self, **kwargs) -> None:
         try:
             if self._refs.get("open_var"):
-                await self._async_write_ref(self._refs.get("open_var"), True)
+                await self._async_write_ref(self._refs.get("open_var"), True, force=True)
             elif self._refs.get("target_position_var"):
                 await self._async_write_ref(self._refs.get("target_position_var"), 0 if self._invert else 100)
             else:
                 raise ValueError("Valve nema definovan open point.")
-            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to open valve %s: %s", self.name, err)
 
     async def async_close_valve(self, **kwargs) -> None:
         try:
             if self._refs.get("close_var"):
-                await self._async_write_ref(self._refs.get("close_var"), True)
+                await self._async_write_ref(self._refs.get("close_var"), True, force=True)
             elif self._refs.get("target_position_var"):
                 await self._async_write_ref(self._refs.get("target_position_var"), 100 if self._invert else 0)
             else:
                 raise ValueError("Valve nema definovan close point.")
-            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to close valve %s: %s", self.name, err)
 
     async def async_stop_valve(self, **kwargs) -> None:
         try:
-            await self._async_write_ref(self._refs.get("stop_var"), True)
-            await self.coordinator.async_request_refresh()
+            await self._async_write_ref(self._refs.get("stop_var"), True, force=True)
         except Exception as err:
             _LOGGER.error("Failed to stop valve %s: %s", self.name, err)
 
@@ -201,6 +195,5 @@ class SSCPComposedValve(ValveEntity):
             normalized = max(0, min(100, int(position)))
             raw_value = 100 - normalized if self._invert else normalized
             await self._async_write_ref(self._refs.get("target_position_var"), raw_value)
-            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to set valve position for %s: %s", self.name, err)
@@ -284,6 +284,8 @@ def build_entity_entry(
     mode: str = "box",
     press_time: float | None = None,
     select_options: dict[str, str] | None = None,
+    write_interval_ms: int | None = None,
+    always_write: bool = False,
 ) -> dict[str, Any]:
     entity: dict[str, Any] = {
         "uid": int(variable["uid"]),
@@ -306,6 +308,8 @@ def build_entity_entry(
             entity["device_class"] = device_class
         if suggested_display_precision is not None:
             entity["suggested_display_precision"] = int(suggested_display_precision)
+        if write_interval_ms:
+            entity["write_interval_ms"] = int(write_interval_ms)
 
     if entity_type == "select":
         entity["select_options"] = dict(select_options or {})
@@ -324,6 +328,8 @@ def build_entity_entry(
 
     if area_id:
         entity["area_id"] = area_id
+    if always_write:
+        entity["always_write"] = True
 
     return entity
 
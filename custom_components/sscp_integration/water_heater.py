@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from functools import partial
 import logging
 from typing import Any
 
@@ -8,8 +7,8 @@ from homeassistant.components.water_heater import WaterHeaterEntity, WaterHeater
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 
 from .const import DOMAIN
-from .coordinator import SSCPDataCoordinator, variable_key
-from .entity import async_apply_entity_area, build_plc_device_info
+from .coordinator import SSCPDataCoordinator
+from .entity import SSCPRefValues, SSCPWriteTransaction, async_apply_entity_area, build_plc_device_info, ref_data_keys
 from .vlist import normalize_unit_of_measurement
 
 _LOGGER = logging.getLogger(__name__)
@@ -96,6 +95,7 @@ class SSCPComposedWaterHeater(WaterHeaterEntity):
             "power_var": config.get("power_var"),
             "operation_mode_var": config.get("operation_mode_var"),
         }
+        self._values = SSCPRefValues(coordinator, self._refs)
         self._operation_mode_map = {
             str(key): str(value).strip().lower()
             for key, value in (config.get("operation_mode_map") or {}).items()
@@ -118,29 +118,26 @@ class SSCPComposedWaterHeater(WaterHeaterEntity):
     async def async_added_to_hass(self) -> None:
         if hasattr(self.coordinator, "async_add_listener"):
             self.async_on_remove(self.coordinator.async_add_listener(self.async_write_ha_state))
+            self.async_on_remove(
+                self.coordinator.async_add_key_listener(ref_data_keys(self._refs), self.async_write_ha_state)
+            )
         await async_apply_entity_area(self.hass, getattr(self, "entity_id", None), self._config.get("area_id"))
 
     @property
     def available(self) -> bool:
         return self.coordinator.last_update_success if self.coordinator else False
 
-    def _coordinator_value(self, ref: dict[str, Any] | None) -> Any:
-        if not isinstance(ref, dict):
-            return None
-        return self.coordinator.data.get(variable_key(ref))
-
-    async def _async_write_ref(self, ref: dict[str, Any] | None, raw_value: Any) -> None:
-        if not isinstance(ref, dict):
-            raise ValueError("Chybi datovy bod pro zapis.")
-        await self.hass.async_add_executor_job(
-            partial(
-                self._client.write_variable,
-                int(ref["uid"]),
-                _coerce_write_value(raw_value, str(ref["type"])),
-                offset=int(ref.get("offset", 0)),
-                length=int(ref.get("length", 1)),
-                type_data=str(ref["type"]),
-            )
+    async def _async_write_ref(self, ref: dict[str, Any] | None, raw_value: Any, *, force: bool = False) -> None:
+        writes = self._write_transaction()
+        writes.add(ref, raw_value, force=force)
+        await writes.async_commit()
+
+    def _write_transaction(self) -> SSCPWriteTransaction:
+        return SSCPWriteTransaction(
+            self.coordinator,
+            _coerce_write_value,
+            read_back=self._refs.values(),
+            force=bool(self._config.get("always_write")),
         )
 
     @property
@@ -170,14 +167,14 @@ class SSCPComposedWaterHeater(WaterHeaterEntity):
 
     @property
     def current_temperature(self) -> float | None:
-        value = self._coordinator_value(self._refs.get("current_temperature_var"))
+        value = self._values.get("current_temperature_var")
         if value is None:
             return None
         return float(value)
 
     @property
     def target_temperature(self) -> float | None:
-        value = self._coordinator_value(self._refs.get("target_temperature_var"))
+        value = self._values.get("target_temperature_var")
         if value is None:
             return None
         return float(value)
@@ -196,10 +193,10 @@ class SSCPComposedWaterHeater(WaterHeaterEntity):
 
     @property
     def current_operation(self) -> str | None:
-        power_value = self._coordinator_value(self._refs.get("power_var"))
+        power_value = self._values.get("power_var")
         if power_value is not None and not bool(power_value):
             return "off"
-        operation_value = self._coordinator_value(self._refs.get("operation_mode_var"))
+        operation_value = self._values.get("operation_mode_var")
         if operation_value is None:
             return "off" if power_value is False else None
         mapped = self._operation_mode_map.get(_value_key(operation_value))
@@ -226,7 +223,6 @@ class SSCPComposedWaterHeater(WaterHeaterEntity):
                 await self._async_write_ref(self._refs.get("operation_mode_var"), raw_value)
             else:
                 raise ValueError("Water heater nema power ani operation mode point pro zapnuti.")
-            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to turn on water heater %s: %s", self.name, err)
 
@@ -241,7 +237,6 @@ class SSCPComposedWaterHeater(WaterHeaterEntity):
                 await self._async_write_ref(self._refs.get("operation_mode_var"), raw_value)
             else:
                 raise ValueError("Water heater nema power ani operation mode point pro vypnuti.")
-            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to turn off water heater %s: %s", self.name, err)
 
@@ -251,7 +246,6 @@ class SSCPComposedWaterHeater(WaterHeaterEntity):
             return
         try:
             await self._async_write_ref(self._refs.get("target_temperature_var"), float(target_temperature))
-            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to set temperature for water heater %s: %s", self.name, err)
 
@@ -261,6 +255,5 @@ class SSCPComposedWaterHeater(WaterHeaterEntity):
             if raw_value is None:
                 raise ValueError(f"Operation mode {operation_mode} neni v mapovani definovan.")
             await self._async_write_ref(self._refs.get("operation_mode_var"), raw_value)
-            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to set operation mode for water heater %s: %s", self.name, err)
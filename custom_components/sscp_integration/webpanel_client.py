@@ -268,6 +268,17 @@ class WebPanelClient:
 
         return results
 
+    def write_variables(self, variables: list[dict[str, Any]]) -> None:
+        if not variables:
+            return
+        if not self.loggedin:
+            self.login()
+
+        commands = [self._build_write_command(variable) for variable in variables]
+        self._request_json("command.cgi", self._authorized_payload({"v": commands}))
+        for command in commands:
+            _LOGGER.debug("WebPanel write %s=%s", command["i"], command["set"])
+
     def write_variable(
         self,
         uid: int,
@@ -277,23 +288,26 @@ class WebPanelClient:
         length: int = 0,
         type_data: str = "BYTE",
     ) -> None:
-        if not self.loggedin:
-            self.login()
+        self.write_variables(
+            [
+                {
+                    "uid": uid,
+                    "offset": offset,
+                    "length": length,
+                    "type": type_data,
+                    "value": value,
+                }
+            ]
+        )
 
-        variable = {
-            "uid": uid,
-            "offset": offset,
-            "length": length,
-            "type": type_data,
-        }
-        command_value = self._command_value(value, type_data)
+    def _build_write_command(self, variable: dict[str, Any]) -> dict[str, Any]:
+        type_data = str(variable["type"])
+        command_value = self._command_value(variable["value"], type_data)
         command: dict[str, Any] = {
             "i": self._build_variable_id(variable),
             "set": command_value,
         }
-        if str(type_data).upper() == "BOOL":
+        if type_data.upper() == "BOOL":
             command["defaultValue"] = 1 if command_value else 0
             command["time"] = "0"
-
-        self._request_json("command.cgi", self._authorized_payload({"v": [command]}))
-        _LOGGER.debug("WebPanel write %s=%s", command["i"], command_value)
+        return command
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from time import monotonic
+from typing import Any, Awaitable, Callable, Iterator, Sequence
+
+from .const import DEFAULT_WRITE_COALESCE_MS
+from .sscp_client import WRITE_VARIABLE_LIMIT, SSCPConnectionError
+from .transport import PLCClientProtocol, async_call_client
+from .webpanel_client import WebPanelConnectionError
+
+_LOGGER = logging.getLogger(__name__)
+
+# Failures that say nothing about individual data points; retrying group by group would only repeat them.
+_LINK_ERRORS = (OSError, SSCPConnectionError, WebPanelConnectionError)
+
+_PendingWrite = tuple[list[dict[str, Any]], "asyncio.Future[None]"]
+
+
+class SSCPWriteCoalescer:
+    """Merges the writes many entities issue within a short window into few client calls.
+
+    Every caller submits its writes as one group, for example all data points of
+    one light service call. When the window closes, whole groups are packed into
+    batches that fit a single direct-mode write frame, and each batch resolves
+    exactly the callers it carried. A batch refused by the PLC is retried group by
+    group, so one bad data point does not fail the writes queued next to it.
+    """
+
+    def __init__(self, hass, client: PLCClientProtocol, *, window_ms: int = DEFAULT_WRITE_COALESCE_MS) -> None:
+        self.hass = hass
+        self.client = client
+        self.window = max(0, int(window_ms)) / 1000
+        self.submitted_groups = 0
+        self.sent_batches = 0
+        self._pending: list[_PendingWrite] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_task: asyncio.Task[None] | None = None
+        self._flush_lock = asyncio.Lock()
+
+    async def async_write(self, writes: Sequence[dict[str, Any]]) -> None:
+        """Queue one group of writes and wait until the PLC acknowledged it."""
+        if not writes:
+            return
+        self.submitted_groups += 1
+        if self.window <= 0:
+            self.sent_batches += 1
+            await async_call_client(self.hass, self.client, "write_variables", list(writes))
+            return
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        self._pending.append((list(writes), future))
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._start_flush)
+        await future
+
+    def _start_flush(self) -> None:
+        self._flush_handle = None
+        self._flush_task = asyncio.get_running_loop().create_task(
+            self._async_flush(),
+            name="SSCP write coalescer flush",
+        )
+
+    async def async_flush(self) -> None:
+        """Send everything queued so far without waiting for the window to close."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        await self._async_flush()
+
+    async def _async_flush(self) -> None:
+        # Flushes run one at a time so later writes never overtake earlier ones.
+        async with self._flush_lock:
+            pending, self._pending = self._pending, []
+            # Callers that gave up before the window closed no longer want their writes applied.
+            groups = [(writes, future) for writes, future in pending if not future.done()]
+            for batch in self._pack_batches(groups):
+                await self._async_send_batch(batch)
+
+    def _pack_batches(self, groups: list[_PendingWrite]) -> Iterator[list[_PendingWrite]]:
+        payload_size = getattr(self.client, "write_payload_size", None)
+        if payload_size is None:
+            # Clients without a frame budget take the whole window in one request.
+            if groups:
+                yield groups
+            return
+
+        limit = self.client.max_data_size
+        header_size = payload_size([])
+        batch: list[_PendingWrite] = []
+        batch_size = header_size
+        batch_count = 0
+        for writes, future in groups:
+            group_size = payload_size(writes) - header_size
+            if batch and (
+                batch_size + group_size > limit or batch_count + len(writes) > WRITE_VARIABLE_LIMIT
+            ):
+                yield batch
+                batch, batch_size, batch_count = [], header_size, 0
+            # A group larger than one frame still goes alone; the client splits or spools it.
+            batch.append((writes, future))
+            batch_size += group_size
+            batch_count += len(writes)
+        if batch:
+            yield batch
+
+    async def _async_send_batch(self, batch: list[_PendingWrite]) -> None:
+        self.sent_batches += 1
+        try:
+            await async_call_client(
+                self.hass,
+                self.client,
+                "write_variables",
+                [write for writes, _future in batch for write in writes],
+            )
+        except Exception as err:
+            if len(batch) == 1 or isinstance(err, _LINK_ERRORS):
+                for _writes, future in batch:
+                    if not future.done():
+                        future.set_exception(err)
+                return
+            _LOGGER.debug("Coalesced write of %s groups failed (%s); retrying them one by one", len(batch), err)
+            for group in batch:
+                await self._async_send_batch([group])
+            return
+
+        for _writes, future in batch:
+            if not future.done():
+                future.set_result(None)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "window_ms": round(self.window * 1000),
+            "submitted_groups": self.submitted_groups,
+            "sent_batches": self.sent_batches,
+            "queued_groups": len(self._pending),
+        }
+
+
+class SSCPWriteBehind:
+    """Writes the latest value of a rapidly changing control at a bounded rate.
+
+    Slider drags produce a burst of set calls; only the newest pending value is
+    kept and intermediate ones are dropped. The first value goes out at once,
+    later ones at most every interval, and the last one always lands. While a
+    value is pending the entity shows it optimistically; on_settled runs once
+    the burst has been written so the entity can refresh and drop that value.
+    """
+
+    def __init__(
+        self,
+        interval_ms: int,
+        write: Callable[[Any], Awaitable[None]],
+        on_settled: Callable[[BaseException | None], Awaitable[None]],
+    ) -> None:
+        self.interval = max(0, int(interval_ms)) / 1000
+        self._write = write
+        self._on_settled = on_settled
+        self._value: Any = None
+        self._queued = False
+        self._in_flight = False
+        self._task: asyncio.Task[None] | None = None
+        self._last_write_at: float | None = None
+        self.dropped_values = 0
+
+    @property
+    def pending(self) -> bool:
+        return self._queued or self._in_flight
+
+    @property
+    def value(self) -> Any:
+        """The value the control should show until the burst settles."""
+        return self._value
+
+    def submit(self, value: Any) -> None:
+        if self._queued:
+            self.dropped_values += 1
+        self._value = value
+        self._queued = True
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._async_run(), name="SSCP write-behind")
+
+    async def async_drain(self) -> None:
+        """Wait until everything submitted so far has been written."""
+        if self._task is not None and not self._task.done():
+            await asyncio.shield(self._task)
+
+    async def _async_run(self) -> None:
+        while self._queued:
+            error: BaseException | None = None
+            while self._queued:
+                if self._last_write_at is not None:
+                    await asyncio.sleep(max(0.0, self.interval - (monotonic() - self._last_write_at)))
+                value = self._value
+                self._queued = False
+                self._in_flight = True
+                self._last_write_at = monotonic()
+                try:
+                    await self._write(value)
+                    error = None
+                except Exception as err:  # noqa: BLE001 - reported once the burst settles
+                    error = err
+                finally:
+                    self._in_flight = False
+            # A value submitted while settling starts the next burst in this same task.
+            await self._on_settled(error)